@@ -30,7 +30,12 @@
 Returns content from plugins and sets reponses
 """
 
-from datetime import datetime
+import base64
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import os
@@ -41,18 +46,21 @@ from dateutil.parser import parse as dateparse
 import pytz
 
 from pygeoapi import __version__
+from pygeoapi.formatter.covjson import CoverageJSONFormatter
 from pygeoapi.linked_data import (geojson2geojsonld, jsonldify,
                                   jsonldify_collection)
 from pygeoapi.log import setup_logger
 from pygeoapi.plugin import load_plugin, PLUGINS
+from pygeoapi.singleflight import SingleFlight
 from pygeoapi.provider.base import (
     ProviderGenericError, ProviderConnectionError, ProviderNotFoundError,
     ProviderInvalidQueryError, ProviderQueryError, ProviderItemNotFoundError,
     ProviderTypeError)
 from pygeoapi.util import (dategetter, filter_dict_by_key_value,
                            get_provider_by_type, get_provider_default,
-                           get_typed_value, render_j2_template,
-                           TEMPLATES, to_json)
+                           get_typed_value, get_wkt_points,
+                           render_j2_template, TEMPLATES, to_json,
+                           to_utc_string)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +73,18 @@ HEADERS = {
 #: Formats allowed for ?f= requests
 FORMATS = ['json', 'html', 'jsonld']
 
+#: Bulk export formats of items (one feature per line), and their media types
+BULK_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'geojsonseq': 'application/geo+json-seq'
+}
+
+#: Size (characters) of the chunks of streamed responses
+STREAM_CHUNK_SIZE = 65536
+
+#: aggregations of coverage resampling and coarsening
+AGGREGATIONS = ['mean', 'min', 'max', 'sum']
+
 CONFORMANCE = [
     'http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core',
     'http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/oas30',
@@ -88,6 +108,7 @@ def pre_process(func):
         :returns: `func`
     """
 
+    @functools.wraps(func)
     def inner(*args, **kwargs):
         cls = args[0]
         headers_ = HEADERS.copy()
@@ -101,6 +122,119 @@ def pre_process(func):
     return inner
 
 
+def conditional(func):
+    """
+        Decorator handling conditional requests of documents derived
+        from the configuration, validated by the configuration version
+        (and by the data version of coverage collections, or the
+        document served, e.g. the OpenAPI document)
+
+        :param func: decorated function
+
+        :returns: `func`
+    """
+
+    @functools.wraps(func)
+    def inner(*args, **kwargs):
+        cls = args[0]
+        headers = args[1]
+        format_ = check_format(args[2], headers)
+        resource = args[3] if len(args) > 3 and isinstance(args[3], str) \
+            else None
+
+        # coverage metadata (domain set, range type) is derived from data,
+        # a document argument (OpenAPI) may change with the same config
+        data_version = None
+        if len(args) > 3 and isinstance(args[3], dict):
+            data_version = make_etag(to_json(args[3]))
+        elif resource is not None and cls._is_coverage(resource):
+            data_version = cls._get_coverage_data_version(resource)
+            if data_version is None:  # cannot be validated
+                return func(*args, **kwargs)
+
+        etag = make_etag(cls.config_version, func.__name__, format_,
+                         resource, data_version)
+        if is_not_modified(headers, etag):
+            headers_ = cls._get_validators(resource, etag)
+            return headers_, 304, ''
+
+        headers_, status, content = func(*args, **kwargs)
+        if status == 200:
+            headers_.update(cls._get_validators(resource, etag))
+
+        return headers_, status, content
+
+    return inner
+
+
+def make_etag(*args):
+    """
+    Make an entity tag from values identifying a representation
+
+    :param args: values identifying the representation
+
+    :returns: `str` of quoted entity tag
+    """
+
+    text = '|'.join(str(arg) for arg in args)
+    return '"{}"'.format(hashlib.sha256(text.encode('utf-8')).hexdigest()[:32])
+
+
+def is_not_modified(headers, etag=None, last_modified=None):
+    """
+    Evaluate the conditional headers (If-None-Match, If-Modified-Since)
+    of a GET request
+
+    :param headers: dict of HTTP headers
+    :param etag: `str` of entity tag of the current representation
+    :param last_modified: `datetime` of last modification of the
+                          current representation
+
+    :returns: `bool` of whether the client representation is current
+    """
+
+    if_none_match = headers.get('If-None-Match')
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        # weak comparison
+        tags = [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+        return '*' in tags or etag in tags
+
+    if_modified_since = headers.get('If-Modified-Since')
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            LOGGER.debug('Invalid If-Modified-Since: {}'.format(
+                if_modified_since))
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def normalize_args(args):
+    """
+    Helper function to normalize request parameters (except format),
+    so that equivalent requests are identified by the same values
+
+    :param args: dict of HTTP request parameters
+
+    :returns: `list` of sorted (name, value) tuples
+    """
+
+    if hasattr(args, 'getlist'):  # repeated parameters
+        items = [(k, v) for k in args.keys() for v in args.getlist(k)]
+    else:
+        items = args.items()
+
+    return sorted((k, str(v).strip()) for k, v in items if k != 'f')
+
+
 class API:
     """API object"""
 
@@ -126,6 +260,23 @@ class API:
 
         setup_logger(self.config['logging'])
 
+        # validates documents derived from the configuration
+        self.config_version = hashlib.sha256('{}|{}'.format(
+            __version__, to_json(self.config)).encode('utf-8')).hexdigest()
+
+        # cache of responses, shared by all collections (optional)
+        self.response_cache = None
+        if 'response_cache' in self.config['server']:
+            self.response_cache = load_plugin(
+                'cache', self.config['server']['response_cache'])
+            LOGGER.debug('Response cache: {}'.format(self.response_cache))
+
+        # concurrent identical provider calls share one call
+        self.single_flight = None
+        if self.config['server'].get('coalesce_requests', False):
+            self.single_flight = SingleFlight()
+
+    @conditional
     @pre_process
     @jsonldify
     def landing_page(self, headers_, format_):
@@ -219,6 +370,7 @@ class API:
 
         return headers_, 200, to_json(fcm, self.pretty_print)
 
+    @conditional
     @pre_process
     def openapi(self, headers_, format_, openapi):
         """
@@ -256,6 +408,7 @@ class API:
 
         return headers_, 200, to_json(openapi, self.pretty_print)
 
+    @conditional
     @pre_process
     def conformance(self, headers_, format_):
         """
@@ -288,6 +441,7 @@ class API:
 
         return headers_, 200, to_json(conformance, self.pretty_print)
 
+    @conditional
     @pre_process
     @jsonldify
     def describe_collections(self, headers_, format_, dataset=None):
@@ -650,6 +804,405 @@ class API:
         return headers_, 200, to_json(queryables, self.pretty_print)
 
     def get_collection_items(self, headers, args, dataset, pathinfo=None):
+        """
+        Queries collection, from the response cache if enabled
+
+        :param headers: dict of HTTP headers
+        :param args: dict of HTTP request parameters
+        :param dataset: dataset name
+        :param pathinfo: path location
+
+        :returns: tuple of headers, status code, content
+        """
+
+        ttl = self._get_response_cache_ttl(dataset)
+        if ttl is None:
+            return self._get_collection_items(headers, args, dataset,
+                                              pathinfo)
+
+        cache = self.response_cache
+        key = cache.make_key('items', dataset, cache.get_version(dataset),
+                             check_format(args, headers), pathinfo,
+                             normalize_args(args))
+
+        cached = cache.get(key)
+        if cached is not None:
+            LOGGER.debug('Response cache hit: {}'.format(key))
+            response = json.loads(cached.decode('utf-8'))
+            etag = response['headers'].get('ETag')
+            last_modified = response['headers'].get('Last-Modified')
+            if last_modified is not None:
+                last_modified = parsedate_to_datetime(last_modified)
+            if is_not_modified(headers, etag, last_modified):
+                return (self._get_validators(dataset, etag, last_modified),
+                        304, '')
+            content = response['content']
+            if response['binary']:
+                content = base64.b64decode(content)
+            return response['headers'], 200, content
+
+        headers_, status, content = self._get_collection_items(
+            headers, args, dataset, pathinfo)
+
+        if status == 200 and isinstance(content, (str, bytes)):
+            binary = isinstance(content, bytes)
+            response = {
+                'headers': dict(headers_),
+                'binary': binary,
+                'content': (base64.b64encode(content).decode('ascii')
+                            if binary else content)
+            }
+            cache.set(key, json.dumps(response).encode('utf-8'), ttl=ttl)
+
+        return headers_, status, content
+
+    def invalidate_response_cache(self, dataset):
+        """
+        Invalidate the cached responses of a collection, e.g. after
+        transactional writes to its data
+
+        :param dataset: dataset name
+
+        :returns: `None`
+        """
+
+        if self.response_cache is not None:
+            self.response_cache.invalidate(dataset)
+
+    def _get_response_cache_ttl(self, dataset):
+        """
+        Helper function to get the seconds to cache responses of
+        a collection
+
+        :param dataset: dataset name
+
+        :returns: `int` of seconds or `None` if responses are not cached
+        """
+
+        if self.response_cache is None:
+            return None
+
+        resource = self.config['resources'].get(dataset)
+        if resource is None or resource.get('type') != 'collection':
+            return None
+
+        cache_def = resource.get('response_cache', {})
+        if cache_def is False:
+            return None
+
+        ttl = int(cache_def.get('ttl', self.response_cache.ttl))
+        if ttl <= 0:
+            return None
+
+        return ttl
+
+    def _get_validators(self, dataset, etag=None, last_modified=None):
+        """
+        Helper function to make the validator and cache headers of
+        a response
+
+        :param dataset: dataset name (`None` for server documents)
+        :param etag: `str` of entity tag
+        :param last_modified: `datetime` of last modification
+
+        :returns: `dict` of HTTP headers
+        """
+
+        headers_ = {}
+        if etag is not None:
+            headers_['ETag'] = etag
+        if last_modified is not None:
+            headers_['Last-Modified'] = format_datetime(last_modified,
+                                                        usegmt=True)
+
+        cache_control = self.config['server'].get('cache_control')
+        if dataset in self.config['resources']:
+            cache_control = self.config['resources'][dataset].get(
+                'cache_control', cache_control)
+        if cache_control:
+            headers_['Cache-Control'] = cache_control
+
+        return headers_
+
+    def _is_coverage(self, dataset):
+        """
+        Helper function to check whether a resource is a coverage
+        collection
+
+        :param dataset: resource name
+
+        :returns: `bool` of whether the resource has a coverage provider
+        """
+
+        resource = self.config['resources'].get(dataset, {})
+        return (resource.get('type') == 'collection' and
+                any(provider['type'] == 'coverage'
+                    for provider in resource.get('providers', [])))
+
+    def _get_coverage_data_version(self, dataset):
+        """
+        Helper function to get the data version of a coverage collection
+
+        :param dataset: dataset name
+
+        :returns: data version of the coverage provider (`None` if unknown)
+        """
+
+        try:
+            p = load_plugin('provider', get_provider_by_type(
+                self.config['resources'][dataset]['providers'], 'coverage'))
+            return p.get_data_version()
+        except ProviderGenericError as err:
+            LOGGER.warning('Cannot get data version: {}'.format(err))
+            return None
+
+    def _get_data_validators(self, dataset, p, *args):
+        """
+        Helper function to make the entity tag and last modification of
+        a response from the data version of a provider
+
+        :param dataset: dataset name
+        :param p: provider object
+        :param args: values identifying the representation (format,
+                     parameters)
+
+        :returns: tuple of entity tag and `datetime` of last modification
+                  (`None` if unknown)
+        """
+
+        try:
+            version = p.get_data_version()
+        except ProviderGenericError as err:
+            LOGGER.warning('Cannot get data version: {}'.format(err))
+            version = None
+
+        if version is None:
+            return None, None
+
+        if isinstance(version, datetime):
+            if version.tzinfo is None:
+                version = version.replace(tzinfo=timezone.utc)
+            last_modified = version
+        else:
+            last_modified = None
+
+        return make_etag(dataset, p.type, version, *args), last_modified
+
+    def _call_provider(self, dataset, p, method, **kwargs):
+        """
+        Helper function to call a provider method, sharing the result of
+        an identical call in flight (if coalescing is enabled). Coverage
+        data (NumPy arrays) is not shared, as copying it for each waiting
+        request costs more memory than querying it again.
+
+        :param dataset: dataset name
+        :param p: provider object
+        :param method: name of provider method
+        :param kwargs: keyword arguments of provider method
+
+        :returns: result of provider method
+        """
+
+        func = getattr(p, method)
+        if self.single_flight is None or p.type == 'coverage':
+            return func(**kwargs)
+
+        key = (dataset, p.type, method, repr(sorted(kwargs.items())))
+        return self.single_flight.do(key, func, **kwargs)
+
+    def get_coalescing_metrics(self):
+        """
+        Get metrics of coalesced provider calls
+
+        :returns: `dict` of number of provider calls, number of requests
+                  which shared an in-flight call and number of calls in
+                  flight (`None` if coalescing is disabled)
+        """
+
+        if self.single_flight is None:
+            return None
+
+        return self.single_flight.get_metrics()
+
+    def _get_items_links(self, dataset, format_, args, startindex, limit,
+                         number_returned):
+        """
+        Helper function to make the links of a page of items
+
+        :param dataset: dataset name
+        :param format_: format of response
+        :param args: dict of HTTP request parameters
+        :param startindex: starting record of page
+        :param limit: number of records per page
+        :param number_returned: number of records of page
+
+        :returns: `list` of links
+        """
+
+        serialized_query_params = ''
+        for k, v in args.items():
+            if k not in ('f', 'startindex'):
+                serialized_query_params += '&'
+                serialized_query_params += urllib.parse.quote(k, safe='')
+                serialized_query_params += '='
+                serialized_query_params += urllib.parse.quote(str(v), safe=',')
+
+        links = [{
+            'type': 'application/geo+json',
+            'rel': 'self' if not format_ or format_ == 'json' else 'alternate',
+            'title': 'This document as GeoJSON',
+            'href': '{}/collections/{}/items?f=json{}'.format(
+                self.config['server']['url'], dataset, serialized_query_params)
+            }, {
+            'rel': 'self' if format_ == 'jsonld' else 'alternate',
+            'type': 'application/ld+json',
+            'title': 'This document as RDF (JSON-LD)',
+            'href': '{}/collections/{}/items?f=jsonld{}'.format(
+                self.config['server']['url'], dataset, serialized_query_params)
+            }, {
+            'type': 'text/html',
+            'rel': 'self' if format_ == 'html' else 'alternate',
+            'title': 'This document as HTML',
+            'href': '{}/collections/{}/items?f=html{}'.format(
+                self.config['server']['url'], dataset, serialized_query_params)
+            }
+        ]
+
+        if startindex > 0:
+            prev = max(0, startindex - limit)
+            links.append(
+                {
+                    'type': 'application/geo+json',
+                    'rel': 'prev',
+                    'title': 'items (prev)',
+                    'href': '{}/collections/{}/items?startindex={}{}'
+                    .format(self.config['server']['url'], dataset, prev,
+                            serialized_query_params)
+                })
+
+        if number_returned == limit:
+            next_ = startindex + limit
+            links.append(
+                {
+                    'type': 'application/geo+json',
+                    'rel': 'next',
+                    'title': 'items (next)',
+                    'href': '{}/collections/{}/items?startindex={}{}'
+                    .format(
+                        self.config['server']['url'], dataset, next_,
+                        serialized_query_params)
+                })
+
+        links.append(
+            {
+                'type': 'application/json',
+                'title': self.config['resources'][dataset]['title'],
+                'rel': 'collection',
+                'href': '{}/collections/{}'.format(
+                    self.config['server']['url'], dataset)
+            })
+
+        return links
+
+    def _stream_collection_items(self, features, dataset, format_, args,
+                                 startindex, limit, timestamp):
+        """
+        Helper function to serialize a FeatureCollection incrementally,
+        feature by feature
+
+        :param features: iterator of GeoJSON features
+        :param dataset: dataset name
+        :param format_: format of response
+        :param args: dict of HTTP request parameters
+        :param startindex: starting record of page
+        :param limit: number of records per page
+        :param timestamp: `str` of timeStamp of response
+
+        :returns: generator of `str` chunks
+        """
+
+        chunk = ['{"type": "FeatureCollection", "features": [']
+        size = 0
+        number_returned = 0
+
+        try:
+            for feature in features:
+                if number_returned > 0:
+                    chunk.append(',')
+                text = to_json(feature, self.pretty_print)
+                chunk.append(text)
+                size += len(text)
+                number_returned += 1
+
+                if size >= STREAM_CHUNK_SIZE:
+                    yield ''.join(chunk)
+                    chunk = []
+                    size = 0
+        except ProviderGenericError as err:
+            # the response has started: the client gets invalid JSON
+            LOGGER.error('Error streaming items: {}'.format(err))
+            yield ''.join(chunk)
+            return
+
+        end = to_json({
+            'numberReturned': number_returned,
+            'links': self._get_items_links(dataset, format_, args,
+                                           startindex, limit,
+                                           number_returned),
+            'timeStamp': timestamp
+        }, self.pretty_print)
+        chunk.append('], ')
+        chunk.append(end[1:])  # without opening brace
+
+        yield ''.join(chunk)
+
+    def _stream_feature_sequence(self, features, format_):
+        """
+        Helper function to serialize features as newline-delimited
+        GeoJSON or as a GeoJSON text sequence (RFC 8142)
+
+        :param features: iterator of GeoJSON features
+        :param format_: bulk format of response (`ndjson` or `geojsonseq`)
+
+        :returns: generator of `str` chunks
+        """
+
+        prefix = '\x1e' if format_ == 'geojsonseq' else ''
+        chunk = []
+        size = 0
+
+        try:
+            for feature in features:
+                text = '{}{}\n'.format(prefix, to_json(feature))
+                chunk.append(text)
+                size += len(text)
+
+                if size >= STREAM_CHUNK_SIZE:
+                    yield ''.join(chunk)
+                    chunk = []
+                    size = 0
+        except ProviderGenericError as err:
+            # the response has started: the client gets a truncated
+            # sequence
+            LOGGER.error('Error exporting items: {}'.format(err))
+
+        yield ''.join(chunk)
+
+    def _is_streamed(self, dataset):
+        """
+        Helper function to check whether items of a collection are
+        streamed
+
+        :param dataset: dataset name
+
+        :returns: `bool` of whether items are streamed
+        """
+
+        stream_items = self.config['server'].get('stream_items', False)
+        return self.config['resources'][dataset].get('stream_items',
+                                                     stream_items)
+
+    def _get_collection_items(self, headers, args, dataset, pathinfo=None):
         """
         Queries collection
 
@@ -666,7 +1219,7 @@ class API:
         properties = []
         reserved_fieldnames = ['bbox', 'f', 'limit', 'startindex',
                                'resulttype', 'datetime', 'sortby']
-        formats = FORMATS
+        formats = FORMATS + list(BULK_FORMATS)
         formats.extend(f.lower() for f in PLUGINS['formatter'].keys())
 
         collections = filter_dict_by_key_value(self.config['resources'],
@@ -729,7 +1282,10 @@ class API:
                 return headers_, 400, to_json(exception, self.pretty_print)
         except TypeError as err:
             LOGGER.warning(err)
-            limit = int(self.config['server']['limit'])
+            if format_ in BULK_FORMATS:  # all matching features
+                limit = None
+            else:
+                limit = int(self.config['server']['limit'])
         except ValueError as err:
             LOGGER.warning(err)
             exception = {
@@ -896,17 +1452,78 @@ class API:
         else:
             sortby = []
 
+        etag, last_modified = self._get_data_validators(
+            dataset, p, format_, pathinfo, normalize_args(args))
+        headers_.update(self._get_validators(dataset, etag, last_modified))
+        if is_not_modified(headers, etag, last_modified):
+            return headers_, 304, ''
+
+        # responses of unchanged data are identical
+        if last_modified is not None:
+            timestamp = to_utc_string(last_modified)
+        else:
+            timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
         LOGGER.debug('Querying provider')
         LOGGER.debug('startindex: {}'.format(startindex))
         LOGGER.debug('limit: {}'.format(limit))
         LOGGER.debug('resulttype: {}'.format(resulttype))
         LOGGER.debug('sortby: {}'.format(sortby))
 
+        if format_ in BULK_FORMATS:
+            LOGGER.debug('Exporting items as {}'.format(format_))
+            try:
+                features = iter(p.iter_features(
+                    startindex=startindex, limit=limit, bbox=bbox,
+                    datetime=datetime_, properties=properties,
+                    sortby=sortby))
+                # start the query, so that errors have an error response
+                first = next(features, None)
+            except ProviderGenericError as err:
+                exception = {
+                    'code': 'NoApplicableCode',
+                    'description': 'query error (check logs)'
+                }
+                LOGGER.error(err)
+                return headers_, 500, to_json(exception, self.pretty_print)
+
+            if first is not None:
+                features = itertools.chain([first], features)
+
+            headers_['Content-Type'] = BULK_FORMATS[format_]
+            return headers_, 200, self._stream_feature_sequence(features,
+                                                                format_)
+
+        if (format_ in [None, 'json'] and resulttype == 'results' and
+                self._is_streamed(dataset)):
+            LOGGER.debug('Streaming items')
+            try:
+                features = iter(p.iter_features(
+                    startindex=startindex, limit=limit, bbox=bbox,
+                    datetime=datetime_, properties=properties,
+                    sortby=sortby))
+                # start the query, so that errors have an error response
+                first = next(features, None)
+            except ProviderGenericError as err:
+                exception = {
+                    'code': 'NoApplicableCode',
+                    'description': 'query error (check logs)'
+                }
+                LOGGER.error(err)
+                return headers_, 500, to_json(exception, self.pretty_print)
+
+            if first is not None:
+                features = itertools.chain([first], features)
+
+            return headers_, 200, self._stream_collection_items(
+                features, dataset, format_, args, startindex, limit,
+                timestamp)
+
         try:
-            content = p.query(startindex=startindex, limit=limit,
-                              resulttype=resulttype, bbox=bbox,
-                              datetime=datetime_, properties=properties,
-                              sortby=sortby)
+            content = self._call_provider(
+                dataset, p, 'query', startindex=startindex, limit=limit,
+                resulttype=resulttype, bbox=bbox, datetime=datetime_,
+                properties=properties, sortby=sortby)
         except ProviderConnectionError as err:
             exception = {
                 'code': 'NoApplicableCode',
@@ -929,71 +1546,11 @@ class API:
             LOGGER.error(err)
             return headers_, 500, to_json(exception, self.pretty_print)
 
-        serialized_query_params = ''
-        for k, v in args.items():
-            if k not in ('f', 'startindex'):
-                serialized_query_params += '&'
-                serialized_query_params += urllib.parse.quote(k, safe='')
-                serialized_query_params += '='
-                serialized_query_params += urllib.parse.quote(str(v), safe=',')
-
-        content['links'] = [{
-            'type': 'application/geo+json',
-            'rel': 'self' if not format_ or format_ == 'json' else 'alternate',
-            'title': 'This document as GeoJSON',
-            'href': '{}/collections/{}/items?f=json{}'.format(
-                self.config['server']['url'], dataset, serialized_query_params)
-            }, {
-            'rel': 'self' if format_ == 'jsonld' else 'alternate',
-            'type': 'application/ld+json',
-            'title': 'This document as RDF (JSON-LD)',
-            'href': '{}/collections/{}/items?f=jsonld{}'.format(
-                self.config['server']['url'], dataset, serialized_query_params)
-            }, {
-            'type': 'text/html',
-            'rel': 'self' if format_ == 'html' else 'alternate',
-            'title': 'This document as HTML',
-            'href': '{}/collections/{}/items?f=html{}'.format(
-                self.config['server']['url'], dataset, serialized_query_params)
-            }
-        ]
-
-        if startindex > 0:
-            prev = max(0, startindex - limit)
-            content['links'].append(
-                {
-                    'type': 'application/geo+json',
-                    'rel': 'prev',
-                    'title': 'items (prev)',
-                    'href': '{}/collections/{}/items?startindex={}{}'
-                    .format(self.config['server']['url'], dataset, prev,
-                            serialized_query_params)
-                })
-
-        if len(content['features']) == limit:
-            next_ = startindex + limit
-            content['links'].append(
-                {
-                    'type': 'application/geo+json',
-                    'rel': 'next',
-                    'title': 'items (next)',
-                    'href': '{}/collections/{}/items?startindex={}{}'
-                    .format(
-                        self.config['server']['url'], dataset, next_,
-                        serialized_query_params)
-                })
-
-        content['links'].append(
-            {
-                'type': 'application/json',
-                'title': collections[dataset]['title'],
-                'rel': 'collection',
-                'href': '{}/collections/{}'.format(
-                    self.config['server']['url'], dataset)
-            })
+        content['links'] = self._get_items_links(
+            dataset, format_, args, startindex, limit,
+            len(content['features']))
 
-        content['timeStamp'] = datetime.utcnow().strftime(
-            '%Y-%m-%dT%H:%M:%S.%fZ')
+        content['timeStamp'] = timestamp
 
         if format_ == 'html':  # render
             headers_['Content-Type'] = 'text/html'
@@ -1042,20 +1599,21 @@ class API:
 
         return headers_, 200, to_json(content, self.pretty_print)
 
-    @pre_process
-    def get_collection_item(self, headers_, format_, dataset, identifier):
+    def get_collection_item(self, headers, args, dataset, identifier):
         """
         Get a single collection item
 
-        :param headers_: copy of HEADERS object
-        :param format_: format of requests,
-                        pre checked by pre_process decorator
+        :param headers: dict of HTTP headers
+        :param args: dict of HTTP request parameters
         :param dataset: dataset name
         :param identifier: item identifier
 
         :returns: tuple of headers, status code, content
         """
 
+        headers_ = HEADERS.copy()
+        format_ = check_format(args, headers)
+
         if format_ is not None and format_ not in FORMATS:
             exception = {
                 'code': 'InvalidParameterValue',
@@ -1088,9 +1646,17 @@ class API:
             }
             LOGGER.error(exception)
             return headers_, 400, to_json(exception, self.pretty_print)
+
+        etag, last_modified = self._get_data_validators(
+            dataset, p, format_, identifier)
+        headers_.update(self._get_validators(dataset, etag, last_modified))
+        if is_not_modified(headers, etag, last_modified):
+            return headers_, 304, ''
+
         try:
             LOGGER.debug('Fetching id {}'.format(identifier))
-            content = p.get(identifier)
+            content = self._call_provider(dataset, p, 'get',
+                                          identifier=identifier)
         except ProviderConnectionError as err:
             exception = {
                 'code': 'NoApplicableCode',
@@ -1222,7 +1788,8 @@ class API:
                 'description': 'connection error (check logs)'
             }
             LOGGER.error(exception)
-            return headers_, 500, to_json(exception, self.pretty_print)
+            return (HEADERS.copy(), 500,
+                    to_json(exception, self.pretty_print))
 
         if 'f' in args:
             query_args['format_'] = format_ = args['f']
@@ -1266,14 +1833,137 @@ class API:
                         'description': 'subset should be like "axis(min,max)"'
                     }
                     LOGGER.error(exception)
-                    return headers_, 400, to_json(exception, self.pretty_print)
+                    return (HEADERS.copy(), 400,
+                            to_json(exception, self.pretty_print))
 
             query_args['subsets'] = subsets
             LOGGER.debug('Subsets: {}'.format(query_args['subsets']))
 
+        scale_params = [
+            param for param in ['scaleSize', 'scaleFactor', 'scaleAxes']
+            if param in args]
+        if len(scale_params) > 1:
+            exception = {
+                'code': 'InvalidParameterValue',
+                'description': 'only one of scaleSize, scaleFactor or '
+                               'scaleAxes may be specified'
+            }
+            LOGGER.error(exception)
+            return (HEADERS.copy(), 400,
+                    to_json(exception, self.pretty_print))
+
+        if 'scaleFactor' in args:
+            LOGGER.debug('Processing scaleFactor parameter')
+            try:
+                query_args['scale_factor'] = float(args['scaleFactor'])
+                if query_args['scale_factor'] <= 0:
+                    raise ValueError('scaleFactor must be positive')
+            except ValueError:
+                exception = {
+                    'code': 'InvalidParameterValue',
+                    'description': 'scaleFactor should be a positive number'
+                }
+                LOGGER.error(exception)
+                return (HEADERS.copy(), 400,
+                        to_json(exception, self.pretty_print))
+
+        for param, query_arg, type_ in [('scaleSize', 'scale_size', int),
+                                        ('scaleAxes', 'scale_axes', float)]:
+            if param not in args:
+                continue
+
+            LOGGER.debug('Processing {} parameter'.format(param))
+            query_args[query_arg] = {}
+            for s in args[param].split(','):
+                try:
+                    m = re.search(r'^(.+)\((.+)\)$', s.strip())
+                    axis_name = m.group(1)
+                    value = type_(m.group(2))
+                    if value <= 0:
+                        raise ValueError('{} must be positive'.format(param))
+                except (AttributeError, ValueError):
+                    exception = {
+                        'code': 'InvalidParameterValue',
+                        'description': '{} should be like "axis(value)" with '
+                                       'a positive value'.format(param)
+                    }
+                    LOGGER.error(exception)
+                    return (HEADERS.copy(), 400,
+                            to_json(exception, self.pretty_print))
+
+                if axis_name not in p.axes:
+                    exception = {
+                        'code': 'InvalidParameterValue',
+                        'description': 'Invalid axis name'
+                    }
+                    LOGGER.error(exception)
+                    return ({'Content-type': 'application/json'}, 400,
+                            to_json(exception, self.pretty_print))
+
+                query_args[query_arg][axis_name] = value
+
+        if 'resample' in args:
+            LOGGER.debug('Processing resample parameter')
+            query_args['resample'] = args['resample']
+
+        if 'aggregation' in args:
+            LOGGER.debug('Processing aggregation parameter')
+            if args['aggregation'] not in AGGREGATIONS:
+                exception = {
+                    'code': 'InvalidParameterValue',
+                    'description': 'aggregation should be one of {}'.format(
+                        ', '.join(AGGREGATIONS))
+                }
+                LOGGER.error(exception)
+                return (HEADERS.copy(), 400,
+                        to_json(exception, self.pretty_print))
+
+            query_args['aggregation'] = args['aggregation']
+
+        if 'coords' in args:
+            LOGGER.debug('Processing coords parameter')
+            try:
+                query_args['coords'] = get_wkt_points(args['coords'])
+            except ValueError as err:
+                exception = {
+                    'code': 'InvalidParameterValue',
+                    'description': 'coords should be a WKT POINT or '
+                                   'MULTIPOINT: {}'.format(err)
+                }
+                LOGGER.error(exception)
+                return (HEADERS.copy(), 400,
+                        to_json(exception, self.pretty_print))
+
+        for param, query_arg in [('subset-crs', 'subset_crs'), ('crs', 'crs')]:
+            if param in args:
+                LOGGER.debug('Processing {} parameter'.format(param))
+                query_args[query_arg] = args[param]
+
+        mt = collection_def['format']['name']
+
+        if format_ not in ['json', mt] and format_ not in p.output_formats:
+            exception = {
+                'code': 'InvalidParameterValue',
+                'description': 'invalid format parameter'
+            }
+            LOGGER.error(exception)
+            return ({'Content-type': 'application/json'},
+                    400, to_json(exception, self.pretty_print))
+
+        encoding = 'json'
+        if ('f' not in args and 'application/prs.coverage+cbor' in
+                headers_.get('Accept', '')):
+            encoding = 'cbor'
+
+        etag, last_modified = self._get_data_validators(
+            dataset, p, format_, encoding, normalize_args(args))
+        validators = self._get_validators(dataset, etag, last_modified)
+        if is_not_modified(headers_, etag, last_modified):
+            return validators, 304, ''
+
         LOGGER.debug('Querying coverage')
         try:
-            data = p.query(**query_args)
+            data = self._call_provider(dataset, p, 'query', **query_args)
         except ProviderInvalidQueryError as err:
             exception = {
                 'code': 'NoApplicableCode',
@@ -1291,21 +1981,19 @@ class API:
             return ({'Content-type': 'application/json'},
                     500, to_json(exception, self.pretty_print))
 
-        mt = collection_def['format']['name']
-
         if format_ == mt:
-            return ({'Content-type': mt}, 200, data)
-        elif format_ == 'json':
-            return ({'Content-type': 'application/prs.coverage+json'},
-                    200, to_json(data, self.pretty_print))
-        else:
-            exception = {
-                'code': 'InvalidParameterValue',
-                'description': 'invalid format parameter'
-            }
-            LOGGER.error(exception)
-            return ({'Content-type': 'application/json'},
-                    400, to_json(exception, self.pretty_print))
+            validators['Content-type'] = mt
+            return validators, 200, data
+        elif format_ in p.output_formats:
+            validators['Content-type'] = p.output_formats[format_]
+            return validators, 200, data
+        else:  # CoverageJSON
+            formatter = CoverageJSONFormatter({'encoding': encoding})
+            content = formatter.write(
+                data=data, options={'pretty': self.pretty_print})
+
+            validators['Content-type'] = formatter.mimetype
+            return validators, 200, content
 
     @jsonldify
     def get_collection_coverage_domainset(self, headers_, args, dataset,
@@ -1427,6 +2115,7 @@ class API:
             return ({'Content-type': 'application/json'},
                     400, to_json(exception, self.pretty_print))
 
+    @conditional
     @pre_process
     @jsonldify
     def describe_processes(self, headers_, format_, process=None):
@@ -1559,6 +2248,7 @@ class API:
             LOGGER.error(exception)
             return headers_, 400, to_json(exception, self.pretty_print)
 
+    @conditional
     @pre_process
     @jsonldify
     def get_stac_root(self, headers_, format_):
@@ -1704,10 +2394,191 @@ class API:
 
             return headers_, 200, to_json(content, self.pretty_print)
 
-        else:  # send back file
+        else:  # send back file (path), served by the web application
             headers_.pop('Content-Type', None)
             return headers_, 200, stac_data
 
+    def get_stac_search(self, headers, args):
+        """
+        Search items of STAC collections
+
+        :param headers: dict of HTTP headers
+        :param args: dict of HTTP request parameters
+
+        :returns: tuple of headers, status code, content
+        """
+
+        headers_ = HEADERS.copy()
+
+        reserved_fieldnames = ['bbox', 'collections', 'datetime', 'f',
+                               'limit', 'startindex']
+
+        format_ = check_format(args, headers)
+        if format_ is not None and format_ != 'json':
+            exception = {
+                'code': 'InvalidParameterValue',
+                'description': 'Invalid format'
+            }
+            LOGGER.error(exception)
+            return headers_, 400, to_json(exception, self.pretty_print)
+
+        stac_collections = filter_dict_by_key_value(self.config['resources'],
+                                                    'type', 'stac-collection')
+
+        datasets = list(stac_collections.keys())
+        if args.get('collections'):
+            datasets = args['collections'].split(',')
+            if not set(datasets).issubset(stac_collections):
+                exception = {
+                    'code': 'InvalidParameterValue',
+                    'description': 'Invalid collection'
+                }
+                LOGGER.error(exception)
+                return headers_, 400, to_json(exception, self.pretty_print)
+
+        LOGGER.debug('Processing startindex and limit parameters')
+        try:
+            startindex = int(args.get('startindex', 0))
+            limit = int(args.get('limit', self.config['server']['limit']))
+            if startindex < 0 or limit <= 0:
+                raise ValueError('startindex or limit out of range')
+        except ValueError as err:
+            LOGGER.warning(err)
+            exception = {
+                'code': 'InvalidParameterValue',
+                'description': 'startindex should be a positive integer or '
+                               'zero and limit a strictly positive integer'
+            }
+            LOGGER.error(exception)
+            return headers_, 400, to_json(exception, self.pretty_print)
+
+        LOGGER.debug('Processing bbox parameter')
+        bbox = []
+        if args.get('bbox'):
+            try:
+                bbox = [float(c) for c in args['bbox'].split(',')]
+                if len(bbox) != 4:
+                    raise ValueError('bbox should have 4 values')
+            except ValueError as err:
+                LOGGER.warning(err)
+                exception = {
+                    'code': 'InvalidParameterValue',
+                    'description': 'bbox values should be minx,miny,maxx,maxy'
+                }
+                LOGGER.error(exception)
+                return headers_, 400, to_json(exception, self.pretty_print)
+
+        LOGGER.debug('Processing datetime parameter')
+        datetime_ = None
+        if args.get('datetime'):
+            values = args['datetime'].split('/')
+            if len(values) == 1:  # time instant
+                values = values * 2
+            try:
+                if len(values) != 2:
+                    raise ValueError('Invalid datetime interval')
+                datetime_ = tuple(
+                    None if value in ['', '..'] else
+                    to_utc_string(dateparse(value)) for value in values)
+            except (ValueError, OverflowError) as err:
+                LOGGER.warning(err)
+                exception = {
+                    'code': 'InvalidParameterValue',
+                    'description': 'datetime should be an ISO 8601 instant '
+                                   'or interval'
+                }
+                LOGGER.error(exception)
+                return headers_, 400, to_json(exception, self.pretty_print)
+
+        properties = [(k, v) for k, v in args.items()
+                      if k not in reserved_fieldnames]
+
+        stac_url = os.path.join(self.config['server']['url'], 'stac')
+
+        features = []
+        matched = 0
+        searched = 0
+        for dataset in datasets:
+            LOGGER.debug('Searching {}'.format(dataset))
+            try:
+                p = load_plugin('provider', get_provider_by_type(
+                    stac_collections[dataset]['providers'], 'stac'))
+                result = p.search(
+                    '{}/{}'.format(stac_url, dataset), bbox=bbox,
+                    datetime_=datetime_, properties=properties,
+                    limit=limit - len(features),
+                    startindex=max(0, startindex - matched))
+            except ProviderConnectionError as err:
+                LOGGER.error(err)
+                exception = {
+                    'code': 'NoApplicableCode',
+                    'description': 'connection error (check logs)'
+                }
+                LOGGER.error(exception)
+                return headers_, 500, to_json(exception, self.pretty_print)
+            except ProviderQueryError as err:
+                if 'collections' not in args:  # not searchable, skip
+                    LOGGER.warning('{}: {}'.format(dataset, err))
+                    continue
+                exception = {
+                    'code': 'InvalidParameterValue',
+                    'description': 'collection {} is not searchable'.format(
+                        dataset)
+                }
+                LOGGER.error(exception)
+                return headers_, 400, to_json(exception, self.pretty_print)
+
+            for feature in result['features']:
+                feature['collection'] = dataset
+            features.extend(result['features'])
+            matched += result['numberMatched']
+            searched += 1
+
+        if searched == 0:
+            exception = {
+                'code': 'NoApplicableCode',
+                'description': 'no searchable collection (search requires '
+                               'a metadata_cache)'
+            }
+            LOGGER.error(exception)
+            return headers_, 501, to_json(exception, self.pretty_print)
+
+        serialized_query_params = ''
+        for k, v in args.items():
+            if k not in ('f', 'startindex'):
+                serialized_query_params += '&'
+                serialized_query_params += urllib.parse.quote(k, safe='')
+                serialized_query_params += '='
+                serialized_query_params += urllib.parse.quote(str(v), safe=',')
+
+        content = {
+            'type': 'FeatureCollection',
+            'stac_version': '0.6.2',
+            'features': features,
+            'links': [{
+                'rel': 'self',
+                'type': 'application/geo+json',
+                'href': '{}/search?f=json&startindex={}{}'.format(
+                    stac_url, startindex, serialized_query_params)
+            }],
+            'context': {
+                'returned': len(features),
+                'limit': limit,
+                'matched': matched
+            }
+        }
+
+        if startindex + len(features) < matched:
+            content['links'].append({
+                'rel': 'next',
+                'type': 'application/geo+json',
+                'href': '{}/search?f=json&startindex={}{}'.format(
+                    stac_url, startindex + limit, serialized_query_params)
+            })
+
+        headers_['Content-Type'] = 'application/geo+json'
+        return headers_, 200, to_json(content, self.pretty_print)
+
 
 def check_format(args, headers):
     """
@@ -1743,5 +2614,9 @@ def check_format(args, headers):
             format_ = 'jsonld'
         elif 'application/json' in headers_:
             format_ = 'json'
+        elif 'application/geo+json-seq' in headers_:
+            format_ = 'geojsonseq'
+        elif 'application/x-ndjson' in headers_:
+            format_ = 'ndjson'
 
     return format_
@@ -0,0 +1,576 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+"""Caches for responses of (remote) data sources"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+LOGGER = logging.getLogger(__name__)
+
+#: Seconds a namespace version is kept (see `BaseCache.get_version`)
+NAMESPACE_TTL = 86400
+
+
+class BaseCache:
+    """generic cache ABC"""
+
+    def __init__(self, cache_def):
+        """
+        Initialize object
+
+        :param cache_def: cache definition
+
+        :returns: pygeoapi.cache.BaseCache
+        """
+
+        self.ttl = int(cache_def.get('ttl', 300))
+        self.max_size = int(cache_def.get('max_size', 100 * 1024 * 1024))
+
+    @staticmethod
+    def make_key(*args):
+        """
+        Make a cache key from arbitrary (stringable) arguments
+
+        :param args: values identifying the cached item
+
+        :returns: `str` of cache key
+        """
+
+        text = '|'.join(str(arg) for arg in args)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Get a cached value
+
+        :param key: cache key
+
+        :returns: `bytes` of cached value or `None` if missing or expired
+        """
+
+        raise NotImplementedError()
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value
+
+        :param key: cache key
+        :param value: `bytes` to store
+        :param ttl: seconds to keep the value (default is the cache ttl)
+
+        :returns: `None`
+        """
+
+        raise NotImplementedError()
+
+    def delete(self, key):
+        """
+        Remove a cached value
+
+        :param key: cache key
+
+        :returns: `None`
+        """
+
+        raise NotImplementedError()
+
+    def clear(self):
+        """
+        Remove all cached values
+
+        :returns: `None`
+        """
+
+        raise NotImplementedError()
+
+    def get_version(self, namespace):
+        """
+        Get the current version of a namespace (e.g. a collection), to be
+        part of the keys of the values cached for that namespace
+
+        :param namespace: namespace name
+
+        :returns: `str` of namespace version
+        """
+
+        key = self.make_key('namespace', namespace)
+        version = self.get(key)
+        if version is None:
+            version = uuid.uuid4().hex.encode('utf-8')
+            self.set(key, version, ttl=NAMESPACE_TTL)
+
+        return version.decode('utf-8')
+
+    def invalidate(self, namespace):
+        """
+        Invalidate all values cached for a namespace, by starting a new
+        version of it (stale values expire or are evicted eventually)
+
+        :param namespace: namespace name
+
+        :returns: `None`
+        """
+
+        LOGGER.debug('Invalidating cache namespace {}'.format(namespace))
+        self.delete(self.make_key('namespace', namespace))
+
+    def __repr__(self):
+        return '<BaseCache> ttl={} max_size={}'.format(
+            self.ttl, self.max_size)
+
+
+class MemoryCache(BaseCache):
+    """
+    In-process cache, evicting the least recently used values once
+    their total size exceeds max_size bytes
+    """
+
+    def __init__(self, cache_def):
+        """
+        Initialize object
+
+        # Typical cache YAML config:
+
+        cache:
+            name: Memory
+            ttl: 300  # seconds
+            max_size: 104857600  # bytes
+
+        :param cache_def: cache definition
+
+        :returns: pygeoapi.cache.MemoryCache
+        """
+
+        BaseCache.__init__(self, cache_def)
+
+        self._values = OrderedDict()  # key: (expires, value)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                expires, value = self._values[key]
+            except KeyError:
+                return None
+
+            if expires < time.time():
+                LOGGER.debug('Cache entry {} expired'.format(key))
+                self._remove(key)
+                return None
+
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+
+        with self._lock:
+            self._remove(key)
+            if len(value) > self.max_size:
+                LOGGER.debug('Value of {} exceeds cache size'.format(key))
+                return
+
+            self._values[key] = (time.time() + ttl, value)
+            self._size += len(value)
+
+            while self._size > self.max_size:
+                evicted = next(iter(self._values))
+                LOGGER.debug('Evicted cache entry {}'.format(evicted))
+                self._remove(evicted)
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        item = self._values.pop(key, None)
+        if item is not None:
+            self._size -= len(item[1])
+
+    def __repr__(self):
+        return '<MemoryCache> {} entries'.format(len(self._values))
+
+
+class FileSystemCache(BaseCache):
+    """
+    Cache storing one file per key in a directory.
+
+    Each file holds its expiry time on the first line followed by
+    the value. Files are touched on read, so that eviction (once the
+    directory exceeds max_size bytes) removes the least recently used.
+    """
+
+    def __init__(self, cache_def):
+        """
+        Initialize object
+
+        # Typical cache YAML config:
+
+        cache:
+            directory: /tmp/pygeoapi-cache
+            ttl: 300  # seconds
+            max_size: 104857600  # bytes
+
+        :param cache_def: cache definition
+
+        :returns: pygeoapi.cache.FileSystemCache
+        """
+
+        BaseCache.__init__(self, cache_def)
+
+        self.directory = cache_def.get('directory', os.path.join(
+            tempfile.gettempdir(), 'pygeoapi-cache'))
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, '{}.cache'.format(key))
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fh:
+                expires = float(fh.readline())
+                if expires < time.time():
+                    LOGGER.debug('Cache entry {} expired'.format(key))
+                    value = None
+                else:
+                    value = fh.read()
+        except (OSError, ValueError):
+            return None
+
+        if value is None:
+            self.delete(key)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return value
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+
+        expires = '{}\n'.format(time.time() + ttl).encode('utf-8')
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(expires)
+                fh.write(value)
+            os.replace(tmp_path, self._path(key))
+        except OSError as err:
+            LOGGER.warning('Cannot write cache entry {}: {}'.format(
+                key, err))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        self._evict()
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.directory)
+                    if entry.name.endswith('.cache')]
+        except OSError:
+            return []
+
+    def _evict(self):
+        """
+        Remove least recently used entries until the cache directory
+        is within max_size
+
+        :returns: `None`
+        """
+
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in self._entries():
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+            if total <= self.max_size:
+                return
+
+            for mtime, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                LOGGER.debug('Evicted cache entry {}'.format(path))
+                total -= size
+                if total <= self.max_size:
+                    break
+
+    def __repr__(self):
+        return '<FileSystemCache> {}'.format(self.directory)
+
+
+class SQLiteCache(BaseCache):
+    """
+    Cache storing values in a SQLite database, which can be shared by
+    the worker processes of a server on the same host.  The least
+    recently used values are evicted once their total size exceeds
+    max_size bytes.
+    """
+
+    def __init__(self, cache_def):
+        """
+        Initialize object
+
+        # Typical cache YAML config:
+
+        cache:
+            name: SQLite
+            path: /tmp/pygeoapi-cache.sqlite
+            ttl: 300  # seconds
+            max_size: 104857600  # bytes
+
+        :param cache_def: cache definition
+
+        :returns: pygeoapi.cache.SQLiteCache
+        """
+
+        BaseCache.__init__(self, cache_def)
+
+        self.path = cache_def.get('path', os.path.join(
+            tempfile.gettempdir(), 'pygeoapi-cache.sqlite'))
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'key TEXT PRIMARY KEY, value BLOB, expires REAL, '
+                'accessed REAL, size INTEGER)')
+            conn.execute('CREATE INDEX IF NOT EXISTS cache_accessed '
+                         'ON cache (accessed)')
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:  # commit or roll back
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT value, expires FROM cache WHERE key = ?',
+                    (key,)).fetchone()
+                if row is None:
+                    return None
+
+                if row[1] < now:
+                    LOGGER.debug('Cache entry {} expired'.format(key))
+                    conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+                    return None
+
+                conn.execute('UPDATE cache SET accessed = ? WHERE key = ?',
+                             (now, key))
+        except sqlite3.Error as err:
+            LOGGER.warning('Cannot read cache entry {}: {}'.format(key, err))
+            return None
+
+        return bytes(row[0])
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO cache '
+                    '(key, value, expires, accessed, size) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key, sqlite3.Binary(value), now + ttl, now, len(value)))
+                self._evict(conn, now)
+        except sqlite3.Error as err:
+            LOGGER.warning('Cannot write cache entry {}: {}'.format(
+                key, err))
+
+    def delete(self, key):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute('DELETE FROM cache')
+
+    def _evict(self, conn, now):
+        """
+        Remove expired and least recently used values until the cache
+        is within max_size
+
+        :param conn: `sqlite3.Connection` of cache database
+        :param now: `float` of current time
+
+        :returns: `None`
+        """
+
+        conn.execute('DELETE FROM cache WHERE expires < ?', (now,))
+
+        total = conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM cache').fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        evicted = []
+        for key, size in conn.execute(
+                'SELECT key, size FROM cache ORDER BY accessed'):
+            evicted.append((key,))
+            total -= size
+            if total <= self.max_size:
+                break
+
+        LOGGER.debug('Evicting {} cache entries'.format(len(evicted)))
+        conn.executemany('DELETE FROM cache WHERE key = ?', evicted)
+
+    def __repr__(self):
+        return '<SQLiteCache> {}'.format(self.path)
+
+
+class RedisCache(BaseCache):
+    """
+    Cache storing values in Redis, which can be shared by all servers.
+    Values expire after their ttl; the size of the cache and the eviction
+    of least recently used values are set by the ``maxmemory`` and
+    ``maxmemory-policy`` (e.g. ``allkeys-lru``) of the Redis server.
+    """
+
+    def __init__(self, cache_def, client=None):
+        """
+        Initialize object
+
+        # Typical cache YAML config:
+
+        cache:
+            name: Redis
+            url: redis://localhost:6379/0
+            prefix: 'pygeoapi:'  # prefix of the keys
+            ttl: 300  # seconds
+
+        :param cache_def: cache definition
+        :param client: Redis client (default is a client of `url`)
+
+        :returns: pygeoapi.cache.RedisCache
+        """
+
+        BaseCache.__init__(self, cache_def)
+
+        self.url = cache_def.get('url', 'redis://localhost:6379/0')
+        self.prefix = cache_def.get('prefix', 'pygeoapi:')
+
+        if client is None:
+            if redis is None:
+                raise CacheError('Redis cache requires the redis package')
+            client = redis.Redis.from_url(self.url)
+
+        self.client = client
+
+    def get(self, key):
+        try:
+            return self.client.get(self.prefix + key)
+        except Exception as err:
+            LOGGER.warning('Cannot read cache entry {}: {}'.format(key, err))
+            return None
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+
+        try:
+            if ttl > 0:
+                self.client.set(self.prefix + key, value, ex=int(ttl))
+            else:
+                self.client.delete(self.prefix + key)
+        except Exception as err:
+            LOGGER.warning('Cannot write cache entry {}: {}'.format(
+                key, err))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        for key in self.client.scan_iter(match='{}*'.format(self.prefix)):
+            self.client.delete(key)
+
+    def __repr__(self):
+        return '<RedisCache> {}'.format(self.url)
+
+
+class CacheError(Exception):
+    """Cache cannot be set up"""
+    pass
@@ -34,7 +34,8 @@ import os
 
 import click
 
-from flask import Flask, make_response, request, send_from_directory
+from flask import (Flask, make_response, request, send_file,
+                   send_from_directory)
 
 from pygeoapi.api import API
 from pygeoapi.util import get_mimetype, yaml_load
@@ -209,7 +210,10 @@ def collection_items(collection_id, item_id=None):
         headers, status_code, content = api_.get_collection_item(
             request.headers, request.args, collection_id, item_id)
 
-    response = make_response(content, status_code)
+    if isinstance(content, (str, bytes)):
+        response = make_response(content, status_code)
+    else:  # streamed (chunked) content
+        response = APP.response_class(content, status=status_code)
 
     if headers:
         response.headers = headers
@@ -344,6 +348,25 @@ def stac_catalog_root():
     return response
 
 
+@APP.route('/stac/search')
+def stac_search():
+    """
+    STAC search endpoint
+
+    :returns: HTTP response
+    """
+
+    headers, status_code, content = api_.get_stac_search(
+        request.headers, request.args)
+
+    response = make_response(content, status_code)
+
+    if headers:
+        response.headers = headers
+
+    return response
+
+
 @APP.route('/stac/<path:path>')
 def stac_catalog_path(path):
     """
@@ -357,6 +380,13 @@ def stac_catalog_path(path):
     headers, status_code, content = api_.get_stac_path(
         request.headers, request.args, path)
 
+    if isinstance(content, os.PathLike):  # raw file
+        # Range requests, ETag and wsgi.file_wrapper (sendfile)
+        response = send_file(os.path.abspath(content), conditional=True,
+                             etag=True)
+        response.headers.extend(headers)
+        return response
+
     response = make_response(content, status_code)
 
     if headers:
@@ -0,0 +1,341 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import logging
+import struct
+
+import numpy as np
+
+from pygeoapi.formatter.base import BaseFormatter
+from pygeoapi.util import json_serial, to_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOGGER = logging.getLogger(__name__)
+
+#: number of range values serialized per chunk
+CHUNK_SIZE = 65536
+
+#: bytes of lazy (e.g. Dask) range values computed at once
+BLOCK_SIZE = 64 * 1024 * 1024
+
+#: placeholder of NumPy range values in the serialized document
+VALUES_MARKER = '__pygeoapi_covjson_values_'
+
+#: RFC 8746 tags of little endian typed arrays
+CBOR_TYPED_ARRAY_TAGS = {
+    'u1': 64, 'u2': 69, 'u4': 70, 'u8': 71,
+    'i1': 72, 'i2': 77, 'i4': 78, 'i8': 79,
+    'f2': 84, 'f4': 85, 'f8': 86
+}
+
+MIMETYPES = {
+    'json': 'application/prs.coverage+json',
+    'cbor': 'application/prs.coverage+cbor'
+}
+
+
+class CoverageJSONFormatter(BaseFormatter):
+    """CoverageJSON formatter"""
+
+    def __init__(self, formatter_def):
+        """
+        Initialize object
+
+        :param formatter_def: formatter definition
+
+        :returns: `pygeoapi.formatter.covjson.CoverageJSONFormatter`
+        """
+
+        BaseFormatter.__init__(self, {'name': 'CoverageJSON'})
+
+        self.encoding = formatter_def.get('encoding', 'json')
+        self.mimetype = MIMETYPES[self.encoding]
+
+    def write(self, options={}, data=None):
+        """
+        Generate data in CoverageJSON format.
+
+        Range values may be NumPy (masked) arrays or lazy arrays
+        (e.g. Dask). They are written from the array buffer in chunks,
+        either as JSON text or as CBOR typed arrays, without building
+        Python lists. Lazy arrays are computed in blocks of at most
+        BLOCK_SIZE bytes, so that memory use stays bounded.
+
+        :param options: CoverageJSON formatting options (pretty)
+        :param data: dict of CoverageJSON data
+
+        :returns: generator of `bytes` chunks
+        """
+
+        if self.encoding == 'cbor':
+            return _cbor_encode(data)
+
+        return self._write_json(data, options.get('pretty', False))
+
+    def _write_json(self, data, pretty=False):
+        arrays = []
+        document = dict(data)
+        document['ranges'] = {}
+        for key, range_ in data.get('ranges', {}).items():
+            range_ = dict(range_)
+            if _is_array(range_.get('values')):
+                arrays.append(range_['values'])
+                range_['values'] = '{}{}'.format(
+                    VALUES_MARKER, len(arrays) - 1)
+            document['ranges'][key] = range_
+
+        text = to_json(document, pretty)
+        for i, values in enumerate(arrays):
+            head, text = text.split('"{}{}"'.format(VALUES_MARKER, i), 1)
+            yield head.encode('utf-8')
+            yield b'['
+            for chunk in _json_values(values):
+                yield chunk
+            yield b']'
+
+        yield text.encode('utf-8')
+
+    def __repr__(self):
+        return '<CoverageJSONFormatter> {}'.format(self.name)
+
+
+def _is_array(values):
+    """
+    Helper function to test whether range values are a NumPy
+    or lazy array
+
+    :param values: range values
+
+    :returns: `bool` of whether values are an array
+    """
+
+    return isinstance(values, np.ndarray) or _is_lazy(values)
+
+
+def _is_lazy(values):
+    """
+    Helper function to test whether range values are a lazy
+    array (computed on demand, e.g. Dask)
+
+    :param values: range values
+
+    :returns: `bool` of whether values are a lazy array
+    """
+
+    return all(hasattr(values, attr) for attr in
+               ('compute', 'shape', 'dtype', '__getitem__'))
+
+
+def _flat_dtype(values):
+    """
+    Helper function to get the data type of flattened range values
+
+    :param values: NumPy or lazy array
+
+    :returns: NumPy data type
+    """
+
+    if values.dtype.kind == 'b':
+        return np.dtype(np.uint8)
+    elif isinstance(values, np.ma.MaskedArray) and \
+            values.dtype.kind != 'f' and np.ma.is_masked(values):
+        return np.dtype(np.float64)
+
+    return values.dtype
+
+
+def _flat_blocks(values):
+    """
+    Helper function to get range values as 1-D blocks in row-major
+    order. Lazy arrays are computed slab by slab along their first
+    axis, each slab holding at most BLOCK_SIZE bytes (or one row).
+
+    :param values: NumPy (masked) or lazy array
+
+    :returns: generator of contiguous 1-D NumPy arrays
+    """
+
+    if not _is_lazy(values):
+        yield _flat_values(values)
+        return
+
+    if len(values.shape) == 0:
+        yield _flat_values(np.asarray(values.compute()))
+        return
+
+    row_size = int(np.prod(values.shape[1:])) * values.dtype.itemsize
+    rows = max(1, BLOCK_SIZE // max(1, row_size))
+    for start in range(0, values.shape[0], rows):
+        block = values[start:start + rows].compute()
+        yield _flat_values(np.asarray(block))
+
+
+def _flat_values(values):
+    """
+    Helper function to get range values as a 1-D array,
+    with masked values as NaN
+
+    :param values: NumPy (masked) array
+
+    :returns: contiguous 1-D NumPy array
+    """
+
+    if isinstance(values, np.ma.MaskedArray):
+        if np.ma.is_masked(values):
+            dtype = values.dtype if values.dtype.kind == 'f' else np.float64
+            values = values.astype(dtype).filled(np.nan)
+        else:
+            values = values.data
+
+    if values.dtype.kind == 'b':
+        values = values.astype(np.uint8)
+
+    return np.ascontiguousarray(values).ravel()
+
+
+def _json_values(values):
+    """
+    Helper function to serialize range values as JSON
+    (without brackets), NaN being written as null
+
+    :param values: NumPy (masked) or lazy array
+
+    :returns: generator of `bytes` chunks
+    """
+
+    first = True
+    for flat in _flat_blocks(values):
+        for start in range(0, flat.size, CHUNK_SIZE):
+            chunk = flat[start:start + CHUNK_SIZE]
+            if not first:
+                yield b','
+            first = False
+
+            yield _json_chunk(chunk)
+
+
+def _json_chunk(chunk):
+    """
+    Helper function to serialize a 1-D array as JSON (without brackets)
+
+    :param chunk: 1-D NumPy array
+
+    :returns: `bytes` of JSON values
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                chunk, option=orjson.OPT_SERIALIZE_NUMPY)[1:-1]
+        except TypeError:  # dtype not supported by orjson
+            pass
+
+    text = to_json(chunk.tolist())
+    return text[1:-1].encode('utf-8')
+
+
+def _cbor_head(major_type, value):
+    """
+    Helper function to encode a CBOR data item head
+
+    :param major_type: CBOR major type (0..7)
+    :param value: argument (length, value or tag)
+
+    :returns: `bytes` of head
+    """
+
+    initial = major_type << 5
+    if value < 24:
+        return struct.pack('>B', initial | value)
+    elif value < 0x100:
+        return struct.pack('>BB', initial | 24, value)
+    elif value < 0x10000:
+        return struct.pack('>BH', initial | 25, value)
+    elif value < 0x100000000:
+        return struct.pack('>BI', initial | 26, value)
+    else:
+        return struct.pack('>BQ', initial | 27, value)
+
+
+def _cbor_encode(obj):
+    """
+    Helper function to encode an object as CBOR (RFC 7049), with
+    NumPy arrays as typed arrays (RFC 8746)
+
+    :param obj: object to encode
+
+    :returns: generator of `bytes` chunks
+    """
+
+    if obj is None:
+        yield b'\xf6'
+    elif obj is True:
+        yield b'\xf5'
+    elif obj is False:
+        yield b'\xf4'
+    elif _is_array(obj):
+        dtype = _flat_dtype(obj).newbyteorder('<')
+        nbytes = int(np.prod(obj.shape)) * dtype.itemsize
+        yield _cbor_head(6, CBOR_TYPED_ARRAY_TAGS[dtype.str[1:]])
+        yield _cbor_head(2, nbytes)
+        chunk_size = CHUNK_SIZE * dtype.itemsize
+        for flat in _flat_blocks(obj):
+            flat = flat.astype(dtype, copy=False)
+            buffer = memoryview(flat).cast('B')
+            for start in range(0, flat.nbytes, chunk_size):
+                yield bytes(buffer[start:start + chunk_size])
+    elif isinstance(obj, np.generic):
+        yield from _cbor_encode(obj.item())
+    elif isinstance(obj, int):
+        if obj >= 0:
+            yield _cbor_head(0, obj)
+        else:
+            yield _cbor_head(1, -1 - obj)
+    elif isinstance(obj, float):
+        yield b'\xfb' + struct.pack('>d', obj)
+    elif isinstance(obj, str):
+        value = obj.encode('utf-8')
+        yield _cbor_head(3, len(value)) + value
+    elif isinstance(obj, bytes):
+        yield _cbor_head(2, len(obj)) + obj
+    elif isinstance(obj, (list, tuple)):
+        yield _cbor_head(4, len(obj))
+        for item in obj:
+            yield from _cbor_encode(item)
+    elif isinstance(obj, dict):
+        yield _cbor_head(5, len(obj))
+        for key, value in obj.items():
+            yield from _cbor_encode(str(key))
+            yield from _cbor_encode(value)
+    else:
+        yield from _cbor_encode(json_serial(obj))
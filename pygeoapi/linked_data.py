@@ -30,6 +30,7 @@
 Returns content as linked data representations
 """
 
+import functools
 import json
 import logging
 
@@ -48,6 +49,7 @@ def jsonldify(func):
         :returns: `func`
     """
 
+    @functools.wraps(func)
     def inner(*args, **kwargs):
         format_ = args[2]
         if not format_ == 'jsonld':
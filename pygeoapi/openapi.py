@@ -346,7 +346,7 @@ def get_oas_30(cfg):
     }
 
     items_f = deepcopy(oas['components']['parameters']['f'])
-    items_f['schema']['enum'].append('csv')
+    items_f['schema']['enum'].extend(['csv', 'ndjson', 'geojsonseq'])
 
     LOGGER.debug('setting up datasets')
     collections = filter_dict_by_key_value(cfg['resources'],
@@ -587,6 +587,33 @@ def get_oas_30(cfg):
                 }
             }
         }
+        paths['/stac/search'] = {
+            'get': {
+                'summary': 'Search SpatioTemporal Asset Catalog items',
+                'description': 'Search SpatioTemporal Asset Catalog items',
+                'tags': ['stac'],
+                'operationId': 'searchStac',
+                'parameters': [
+                    {'$ref': '{}#/components/parameters/bbox'.format(OPENAPI_YAML['oapif'])},  # noqa
+                    {'$ref': '{}#/components/parameters/datetime'.format(OPENAPI_YAML['oapif'])},  # noqa
+                    {'$ref': '{}#/components/parameters/limit'.format(OPENAPI_YAML['oapif'])},  # noqa
+                    {'$ref': '#/components/parameters/startindex'},
+                    {
+                        'name': 'collections',
+                        'in': 'query',
+                        'description': 'Comma-separated list of STAC collections to search',  # noqa
+                        'required': False,
+                        'schema': {'type': 'string'},
+                        'style': 'form',
+                        'explode': False
+                    }
+                ],
+                'responses': {
+                    '200': {'$ref': '#/components/responses/200'},
+                    'default': {'$ref': '#/components/responses/default'}
+                }
+            }
+        }
 
     LOGGER.debug('setting up processes')
     processes = filter_dict_by_key_value(cfg['resources'], 'type', 'process')
@@ -34,7 +34,7 @@ import logging
 LOGGER = logging.getLogger(__name__)
 
 #: Loads provider plugins to be used by pygeoapi,\
-#: formatters and processes available
+#: formatters, processes and caches available
 PLUGINS = {
     'provider': {
         'CSV': 'pygeoapi.provider.csv_.CSVProvider',
@@ -53,6 +53,12 @@ PLUGINS = {
     },
     'process': {
         'HelloWorld': 'pygeoapi.process.hello_world.HelloWorldProcessor'
+    },
+    'cache': {
+        'Memory': 'pygeoapi.cache.MemoryCache',
+        'FileSystem': 'pygeoapi.cache.FileSystemCache',
+        'SQLite': 'pygeoapi.cache.SQLiteCache',
+        'Redis': 'pygeoapi.cache.RedisCache'
     }
 }
 
@@ -61,7 +67,8 @@ def load_plugin(plugin_type, plugin_def):
     """
     loads plugin by name
 
-    :param plugin_type: type of plugin (provider, formatter)
+    :param plugin_type: type of plugin (provider, formatter, process,
+                        cache)
     :param plugin_def: plugin definition
 
     :returns: plugin object
@@ -27,10 +27,15 @@
 #
 # =================================================================
 
+from datetime import datetime, timezone
 import logging
+import os
 
 LOGGER = logging.getLogger(__name__)
 
+#: number of features read at once by `BaseProvider.iter_features`
+ITER_BATCH_SIZE = 1000
+
 
 class BaseProvider:
     """generic Provider ABC"""
@@ -62,6 +67,8 @@ class BaseProvider:
         self.axes = []
         self.crs = None
         self.num_bands = None
+        # additional output formats (name: mimetype)
+        self.output_formats = {}
 
     def get_fields(self):
         """
@@ -72,6 +79,21 @@ class BaseProvider:
 
         raise NotImplementedError()
 
+    def get_data_version(self):
+        """
+        Get the version of the data, to validate responses (by default
+        the modification time of a data file)
+
+        :returns: `datetime` of last modification, `str` of version
+                  or `None` if unknown
+        """
+
+        if isinstance(self.data, str) and os.path.isfile(self.data):
+            return datetime.fromtimestamp(os.path.getmtime(self.data),
+                                          timezone.utc)
+
+        return None
+
     def get_data_path(self, baseurl, urlpath, dirpath):
         """
         Gets directory listing or file description or raw file dump
@@ -104,6 +126,41 @@ class BaseProvider:
 
         raise NotImplementedError()
 
+    def iter_features(self, startindex=0, limit=10, bbox=[], datetime=None,
+                      properties=[], sortby=[]):
+        """
+        query the provider, yielding features one by one (by default from
+        pages of ITER_BATCH_SIZE features returned by `query`; providers
+        override this to read features incrementally)
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10, `None`
+                      for all records)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: iterator of GeoJSON features
+        """
+
+        while limit is None or limit > 0:
+            size = ITER_BATCH_SIZE
+            if limit is not None:
+                size = min(limit, ITER_BATCH_SIZE)
+                limit -= size
+
+            features = self.query(startindex=startindex, limit=size,
+                                  resulttype='results', bbox=bbox,
+                                  datetime=datetime, properties=properties,
+                                  sortby=sortby)['features']
+            for feature in features:
+                yield feature
+
+            if len(features) < size:
+                break
+            startindex += size
+
     def get(self, identifier):
         """
         query the provider by id
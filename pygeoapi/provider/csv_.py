@@ -100,25 +100,7 @@ class CSVProvider(BaseProvider):
                 return feature_collection
             LOGGER.debug('Slicing CSV rows')
             for row in itertools.islice(data_, startindex, startindex+limit):
-                feature = {'type': 'Feature'}
-                feature['id'] = row.pop(self.id_field)
-                feature['geometry'] = {
-                    'type': 'Point',
-                    'coordinates': [
-                        float(row.pop(self.geometry_x)),
-                        float(row.pop(self.geometry_y))
-                    ]
-                }
-                if self.properties:
-                    feature['properties'] = OrderedDict()
-                    for p in self.properties:
-                        try:
-                            feature['properties'][p] = row[p]
-                        except KeyError as err:
-                            LOGGER.error(err)
-                            raise ProviderQueryError()
-                else:
-                    feature['properties'] = row
+                feature = self._make_feature(row)
 
                 if identifier is not None and feature['id'] == identifier:
                     found = True
@@ -137,6 +119,37 @@ class CSVProvider(BaseProvider):
 
         return feature_collection
 
+    def _make_feature(self, row):
+        """
+        Make a GeoJSON feature from a CSV row
+
+        :param row: `dict` of CSV row
+
+        :returns: `dict` of GeoJSON feature
+        """
+
+        feature = {'type': 'Feature'}
+        feature['id'] = row.pop(self.id_field)
+        feature['geometry'] = {
+            'type': 'Point',
+            'coordinates': [
+                float(row.pop(self.geometry_x)),
+                float(row.pop(self.geometry_y))
+            ]
+        }
+        if self.properties:
+            feature['properties'] = OrderedDict()
+            for p in self.properties:
+                try:
+                    feature['properties'][p] = row[p]
+                except KeyError as err:
+                    LOGGER.error(err)
+                    raise ProviderQueryError()
+        else:
+            feature['properties'] = row
+
+        return feature
+
     def query(self, startindex=0, limit=10, resulttype='results',
               bbox=[], datetime=None, properties=[], sortby=[]):
         """
@@ -155,6 +168,29 @@ class CSVProvider(BaseProvider):
 
         return self._load(startindex, limit, resulttype)
 
+    def iter_features(self, startindex=0, limit=10, bbox=[], datetime=None,
+                      properties=[], sortby=[]):
+        """
+        CSV query, reading rows one by one
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10, `None`
+                      for all records)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: generator of GeoJSON features
+        """
+
+        stop = None if limit is None else startindex + limit
+
+        with open(self.data) as ff:
+            data_ = csv.DictReader(ff)
+            for row in itertools.islice(data_, startindex, stop):
+                yield self._make_feature(row)
+
     def get(self, identifier):
         """
         query CSV id
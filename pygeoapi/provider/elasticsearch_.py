@@ -28,12 +28,14 @@
 # =================================================================
 
 from collections import OrderedDict
+import itertools
 import logging
 
 from elasticsearch import Elasticsearch, exceptions, helpers
 from elasticsearch.client.indices import IndicesClient
 
-from pygeoapi.provider.base import (BaseProvider, ProviderConnectionError,
+from pygeoapi.provider.base import (BaseProvider, ITER_BATCH_SIZE,
+                                    ProviderConnectionError,
                                     ProviderQueryError,
                                     ProviderItemNotFoundError)
 
@@ -113,34 +115,21 @@ class ElasticsearchProvider(BaseProvider):
 
         return fields_
 
-    def query(self, startindex=0, limit=10, resulttype='results',
-              bbox=[], datetime=None, properties=[], sortby=[]):
+    def _get_query(self, bbox=[], datetime=None, properties=[], sortby=[]):
         """
-        query Elasticsearch index
+        Build the Elasticsearch query body
 
-        :param startindex: starting record to return (default 0)
-        :param limit: number of records to return (default 10)
-        :param resulttype: return results or hit limit (default results)
         :param bbox: bounding box [minx,miny,maxx,maxy]
         :param datetime: temporal (datestamp or extent)
         :param properties: list of tuples (name, value)
         :param sortby: list of dicts (property, order)
 
-        :returns: dict of 0..n GeoJSON features
+        :returns: `dict` of query body
         """
 
         query = {'track_total_hits': True, 'query': {'bool': {'filter': []}}}
         filter_ = []
 
-        feature_collection = {
-            'type': 'FeatureCollection',
-            'features': []
-        }
-
-        if resulttype == 'hits':
-            LOGGER.debug('hits only specified')
-            limit = 0
-
         if bbox:
             LOGGER.debug('processing bbox parameter')
             minx, miny, maxx, maxy = bbox
@@ -236,6 +225,37 @@ class ElasticsearchProvider(BaseProvider):
             query['_source']['includes'].append(self.mask_prop(self.id_field))
             query['_source']['includes'].append('type')
             query['_source']['includes'].append('geometry')
+
+        return query
+
+    def query(self, startindex=0, limit=10, resulttype='results',
+              bbox=[], datetime=None, properties=[], sortby=[]):
+        """
+        query Elasticsearch index
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10)
+        :param resulttype: return results or hit limit (default results)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: dict of 0..n GeoJSON features
+        """
+
+        query = self._get_query(bbox=bbox, datetime=datetime,
+                                properties=properties, sortby=sortby)
+
+        feature_collection = {
+            'type': 'FeatureCollection',
+            'features': []
+        }
+
+        if resulttype == 'hits':
+            LOGGER.debug('hits only specified')
+            limit = 0
+
         try:
             LOGGER.debug('querying Elasticsearch')
 
@@ -290,6 +310,44 @@ class ElasticsearchProvider(BaseProvider):
 
         return feature_collection
 
+    def iter_features(self, startindex=0, limit=10, bbox=[], datetime=None,
+                      properties=[], sortby=[]):
+        """
+        query Elasticsearch index, reading documents in batches with the
+        scroll API
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10, `None`
+                      for all records)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: iterator of GeoJSON features
+        """
+
+        query = self._get_query(bbox=bbox, datetime=datetime,
+                                properties=properties, sortby=sortby)
+        query.pop('track_total_hits')
+
+        stop = None if limit is None else startindex + limit
+
+        try:
+            LOGGER.debug('scrolling Elasticsearch')
+            gen = helpers.scan(client=self.es, query=query,
+                               size=ITER_BATCH_SIZE,
+                               preserve_order=bool(sortby),
+                               index=self.index_name)
+            for feature in itertools.islice(gen, startindex, stop):
+                yield self.esdoc2geojson(feature)
+        except exceptions.ConnectionError as err:
+            LOGGER.error(err)
+            raise ProviderConnectionError()
+        except (exceptions.RequestError, exceptions.NotFoundError) as err:
+            LOGGER.error(err)
+            raise ProviderQueryError()
+
     def get(self, identifier):
         """
         Get ES document by id
@@ -27,16 +27,42 @@
 #
 # =================================================================
 
-import io
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import hashlib
+import json
 import logging
 import os
+import pathlib
+import queue
+import sqlite3
+import tempfile
+import threading
+import time
 from urllib.parse import urljoin
 
+from dateutil.parser import parse as dateparse
+
 from pygeoapi.provider.base import (BaseProvider, ProviderConnectionError,
-                                    ProviderNotFoundError)
+                                    ProviderNotFoundError,
+                                    ProviderQueryError)
+from pygeoapi.util import to_json, to_utc_string
 
 LOGGER = logging.getLogger(__name__)
 
+# background scanners of metadata caches, their queues of files
+# to describe, and the sidecars with a schema, by sidecar path
+SCANNERS = {}
+SCANNER_QUEUES = {}
+SCHEMAS = set()
+SCANNERS_LOCK = threading.Lock()
+
+# version of the metadata cache schema (older sidecars are rebuilt)
+SCHEMA_VERSION = 3
+
+# CRS of item bboxes and geometries
+WGS84 = 'EPSG:4326'
+
 
 class FileSystemProvider(BaseProvider):
     """filesystem Provider"""
@@ -57,6 +83,12 @@ class FileSystemProvider(BaseProvider):
             LOGGER.error(msg)
             raise ProviderConnectionError(msg)
 
+        self.metadata_cache = None
+        if 'metadata_cache' in provider_def:
+            self.metadata_cache = FileMetadataCache(
+                self.data, self.file_types, provider_def['metadata_cache'])
+            self.metadata_cache.start_scanner()
+
     def get_data_path(self, baseurl, urlpath, dirpath):
         """
         Gets directory listing or file description or raw file dump
@@ -65,7 +97,8 @@ class FileSystemProvider(BaseProvider):
         :param urlpath: base path of URL
         :param dirpath: directory basepath (equivalent of URL)
 
-        :returns: `dict` of file listing or `dict` of GeoJSON item or raw file
+        :returns: `dict` of file listing or `dict` of GeoJSON item or
+                  `pathlib.Path` of raw file
         """
 
         thispath = os.path.join(baseurl, urlpath)
@@ -136,13 +169,11 @@ class FileSystemProvider(BaseProvider):
             raise ProviderNotFoundError(msg)
 
         if resource_type == 'raw_file':
-            with io.open(data_path, 'rb') as fh:
-                return fh.read()
+            return pathlib.Path(data_path)
 
         elif resource_type == 'directory':
-            for dc in os.listdir(data_path):
-                fullpath = os.path.join(data_path, dc)
-                if os.path.isdir(fullpath):
+            for dc, is_dir in self._list_directory(data_path):
+                if is_dir:
                     newpath = os.path.join(baseurl, urlpath, dc)
                     child_links.append({
                         'rel': 'child',
@@ -154,7 +185,7 @@ class FileSystemProvider(BaseProvider):
                         'href': newpath,
                         'type': 'text/html'
                     })
-                elif os.path.isfile(fullpath):
+                else:
                     basename, extension = os.path.splitext(dc)
                     newpath = os.path.join(baseurl, urlpath, basename)
                     if extension in self.file_types:
@@ -185,7 +216,7 @@ class FileSystemProvider(BaseProvider):
                 'assets': {}
             }
 
-            content.update(_describe_file(data_path))
+            content.update(self._describe_file(data_path))
 
             content['assets']['default'] = {
                 'href': url
@@ -195,10 +226,595 @@ class FileSystemProvider(BaseProvider):
 
         return content
 
+    def search(self, baseurl, bbox=[], datetime_=None, properties=[],
+               limit=10, startindex=0):
+        """
+        Search items by footprint, time and properties (requires
+        a metadata cache)
+
+        :param baseurl: base URL of the collection
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime_: tuple of start and end (ISO 8601 UTC strings,
+                          `None` if open)
+        :param properties: list of tuples (name, value)
+        :param limit: number of items to return
+        :param startindex: starting item
+
+        :returns: `dict` of number of matching items and `list` of items
+        """
+
+        if self.metadata_cache is None:
+            msg = 'Search requires a metadata_cache'
+            LOGGER.error(msg)
+            raise ProviderQueryError(msg)
+
+        matched, items = self.metadata_cache.search(
+            bbox=bbox, datetime_=datetime_, properties=properties,
+            limit=limit, startindex=startindex)
+
+        root = os.path.normpath(self.data)
+        features = []
+        for path, description in items:
+            relpath = os.path.relpath(path, root).replace(os.sep, '/')
+            itemurl = '{}/{}'.format(baseurl, os.path.splitext(relpath)[0])
+
+            item = {
+                'id': os.path.splitext(os.path.basename(path))[0],
+                'type': 'Feature',
+                'properties': {},
+                'links': [{
+                    'rel': 'self',
+                    'href': '{}?f=json'.format(itemurl),
+                    'type': 'application/json'
+                }, {
+                    'rel': 'self',
+                    'href': itemurl,
+                    'type': 'text/html'
+                }],
+                'assets': {}
+            }
+
+            item.update(description)
+
+            item['assets']['default'] = {
+                'href': '{}/{}'.format(baseurl, relpath)
+            }
+
+            features.append(item)
+
+        return {
+            'numberMatched': matched,
+            'features': features
+        }
+
+    def _list_directory(self, dirpath):
+        """
+        Helper function to list the subdirectories and files of a
+        directory, from the metadata cache if configured
+
+        :param dirpath: path to directory
+
+        :returns: `list` of tuples of name and `bool` of whether a directory
+        """
+
+        if self.metadata_cache is not None:
+            return self.metadata_cache.list_directory(dirpath)
+
+        return _scan_directory(dirpath)
+
+    def _describe_file(self, filepath):
+        """
+        Helper function to describe a geospatial data file, from the
+        metadata cache if configured
+
+        :param filepath: path to file
+
+        :returns: `dict` of GeoJSON item
+        """
+
+        if self.metadata_cache is not None:
+            return self.metadata_cache.describe_file(filepath)
+
+        return _describe_file(filepath)
+
     def __repr__(self):
         return '<FileSystemProvider> {}'.format(self.data)
 
 
+class FileMetadataCache:
+    """
+    Cache of directory listings and file descriptions, persisted to
+    a SQLite sidecar and kept in sync by a background scanner.
+
+    Entries are keyed by path and invalidated by their modification
+    time (and size for files). Described files are indexed by footprint
+    (R*Tree) and time range for searching.
+    """
+
+    def __init__(self, data, file_types, cache_def):
+        """
+        Initialize object
+
+        # Typical metadata cache YAML config:
+
+        metadata_cache:
+            path: /var/cache/pygeoapi/stac.sqlite
+            scan_interval: 300  # seconds (0 disables the scanner)
+
+        :param data: root directory
+        :param file_types: `list` of file extensions of items
+        :param cache_def: metadata cache definition
+
+        :returns: pygeoapi.provider.filesystem.FileMetadataCache
+        """
+
+        self.data = os.path.normpath(data)
+        self.file_types = file_types
+        self.path = cache_def.get('path') or os.path.join(
+            tempfile.gettempdir(), 'pygeoapi-stac-{}.sqlite'.format(
+                hashlib.sha256(self.data.encode('utf-8')).hexdigest()[:16]))
+        self.scan_interval = int(cache_def.get('scan_interval', 300))
+
+        # caches are created per request: set up the schema only once
+        with SCANNERS_LOCK:
+            if self.path not in SCHEMAS or not os.path.exists(self.path):
+                self._create_schema()
+                SCHEMAS.add(self.path)
+
+    def _create_schema(self):
+        """
+        Create (or rebuild, if outdated) the tables of the sidecar
+
+        :returns: `None`
+        """
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version != SCHEMA_VERSION:
+                LOGGER.debug('Creating metadata cache {}'.format(self.path))
+                for table in ['entries', 'footprints', 'times']:
+                    conn.execute('DROP TABLE IF EXISTS {}'.format(table))
+                conn.execute('PRAGMA user_version = {}'.format(
+                    SCHEMA_VERSION))
+
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'id INTEGER PRIMARY KEY, path TEXT UNIQUE, parent TEXT, '
+                'name TEXT, is_dir INTEGER, mtime REAL, size INTEGER, '
+                'description TEXT)')
+            conn.execute('CREATE INDEX IF NOT EXISTS entries_parent '
+                         'ON entries (parent)')
+            conn.execute('CREATE VIRTUAL TABLE IF NOT EXISTS footprints '
+                         'USING rtree (id, minx, maxx, miny, maxy)')
+            conn.execute('CREATE TABLE IF NOT EXISTS times ('
+                         'id INTEGER PRIMARY KEY, start TEXT, end TEXT)')
+            conn.execute('CREATE INDEX IF NOT EXISTS times_start '
+                         'ON times (start)')
+            conn.execute('CREATE INDEX IF NOT EXISTS times_end '
+                         'ON times (end)')
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:  # commit or roll back
+                yield conn
+        finally:
+            conn.close()
+
+    def list_directory(self, dirpath):
+        """
+        List a directory, from the cache if the directory is unchanged
+
+        :param dirpath: path to directory
+
+        :returns: `list` of tuples of name and `bool` of whether a directory
+        """
+
+        dirpath = os.path.normpath(dirpath)
+        mtime = os.stat(dirpath).st_mtime
+
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT mtime FROM entries WHERE path = ? AND is_dir = 1',
+                (dirpath,)).fetchone()
+            if row is not None and row[0] == mtime:
+                LOGGER.debug('Listing {} from cache'.format(dirpath))
+                return [(name, bool(is_dir)) for name, is_dir in
+                        conn.execute('SELECT name, is_dir FROM entries '
+                                     'WHERE parent = ? ORDER BY name',
+                                     (dirpath,))]
+
+        return [(name, is_dir) for name, is_dir, mtime, size in
+                self._sync_directory(dirpath)]
+
+    def describe_file(self, filepath):
+        """
+        Describe a file, from the cache if the file is unchanged.
+        New or modified files are queued for the background scanner and
+        described from their file status meanwhile (or, without a
+        scanner, described at once).
+
+        :param filepath: path to file
+
+        :returns: `dict` of GeoJSON item
+        """
+
+        filepath = os.path.normpath(filepath)
+        stat = os.stat(filepath)
+
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT mtime, size, description FROM entries '
+                'WHERE path = ?', (filepath,)).fetchone()
+
+        if (row is not None and row[2] is not None and
+                (row[0], row[1]) == (stat.st_mtime, stat.st_size)):
+            return json.loads(row[2])
+
+        queue_ = SCANNER_QUEUES.get(self.path)
+        if queue_ is None:
+            LOGGER.debug('{} not scanned yet, describing'.format(filepath))
+            return self._describe(filepath, stat.st_mtime, stat.st_size)
+
+        LOGGER.debug('{} not scanned yet, queued'.format(filepath))
+        queue_.put(filepath)
+
+        return {
+            'bbox': None,
+            'geometry': None,
+            'properties': {
+                'datetime': to_utc_string(
+                    datetime.fromtimestamp(stat.st_mtime, timezone.utc)),
+                'file:size': stat.st_size
+            }
+        }
+
+    def search(self, bbox=[], datetime_=None, properties=[], limit=10,
+               startindex=0):
+        """
+        Search described files by footprint, time and properties
+
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime_: tuple of start and end (ISO 8601 UTC strings,
+                          `None` if open)
+        :param properties: list of tuples (name, value)
+        :param limit: number of files to return
+        :param startindex: starting file
+
+        :returns: tuple of number of matching files and `list` of
+                  tuples of path and `dict` of GeoJSON item
+        """
+
+        joins = []
+        where = ['e.description IS NOT NULL']
+        params = []
+
+        if bbox:
+            joins.append('JOIN footprints f ON f.id = e.id')
+            where.append('f.minx <= ? AND f.maxx >= ? AND '
+                         'f.miny <= ? AND f.maxy >= ?')
+            params.extend([bbox[2], bbox[0], bbox[3], bbox[1]])
+
+        if datetime_ is not None:
+            joins.append('JOIN times t ON t.id = e.id')
+            start, end = datetime_
+            if end is not None:
+                where.append('t.start <= ?')
+                params.append(end)
+            if start is not None:
+                where.append('t.end >= ?')
+                params.append(start)
+
+        for name, value in properties:
+            where.append('CAST(json_extract(e.description, ?) AS TEXT) = ?')
+            params.extend(['$.properties."{}"'.format(name), str(value)])
+
+        query = 'FROM entries e {} WHERE {}'.format(
+            ' '.join(joins), ' AND '.join(where))
+
+        with self._connect() as conn:
+            matched = conn.execute(
+                'SELECT COUNT(*) {}'.format(query), params).fetchone()[0]
+
+            items = []
+            if limit > 0:
+                rows = conn.execute(
+                    'SELECT e.path, e.description, (SELECT start FROM times '
+                    'WHERE times.id = e.id) {} ORDER BY e.path '
+                    'LIMIT ? OFFSET ?'.format(query),
+                    params + [limit, startindex])
+
+                for path, description, start in rows:
+                    description = json.loads(description)
+                    description['properties'].setdefault('datetime', start)
+                    items.append((path, description))
+
+        return matched, items
+
+    def scan(self):
+        """
+        Bring the cache in sync with the directory tree: list all
+        directories and describe new or modified files
+
+        :returns: `int` of number of files described
+        """
+
+        described = 0
+        dirpaths = [self.data]
+        while dirpaths:
+            dirpath = dirpaths.pop()
+            try:
+                entries = self._sync_directory(dirpath)
+            except OSError as err:
+                LOGGER.warning('Cannot scan {}: {}'.format(dirpath, err))
+                continue
+
+            with self._connect() as conn:
+                pending = {path for path, in conn.execute(
+                    'SELECT path FROM entries WHERE parent = ? AND '
+                    'is_dir = 0 AND description IS NULL', (dirpath,))}
+
+            for name, is_dir, mtime, size in entries:
+                path = os.path.join(dirpath, name)
+                if is_dir:
+                    dirpaths.append(path)
+                elif (path in pending and
+                        os.path.splitext(name)[1] in self.file_types):
+                    try:
+                        self._describe(path, mtime, size)
+                        described += 1
+                    except Exception as err:
+                        LOGGER.warning('Cannot describe {}: {}'.format(
+                            path, err))
+
+        LOGGER.debug('Scanned {}: {} files described'.format(
+            self.data, described))
+        return described
+
+    def start_scanner(self):
+        """
+        Start the background scanner of the cache (once per sidecar)
+
+        :returns: `None`
+        """
+
+        if self.scan_interval <= 0:
+            return
+
+        with SCANNERS_LOCK:
+            if self.path in SCANNERS:
+                return
+
+            thread = threading.Thread(target=self._run_scanner,
+                                      name='pygeoapi-stac-scanner',
+                                      daemon=True)
+            SCANNERS[self.path] = thread
+            SCANNER_QUEUES[self.path] = queue.Queue()
+            thread.start()
+
+    def describe_queued(self, timeout=0):
+        """
+        Describe the files queued by `describe_file` (if not described
+        since), until the queue stays empty for the timeout
+
+        :param timeout: seconds to wait for queued files
+
+        :returns: `int` of number of files described
+        """
+
+        queue_ = SCANNER_QUEUES[self.path]
+        deadline = time.monotonic() + timeout
+        described = 0
+
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    filepath = queue_.get(timeout=remaining)
+                else:
+                    filepath = queue_.get_nowait()
+            except queue.Empty:
+                return described
+
+            try:
+                stat = os.stat(filepath)
+                with self._connect() as conn:
+                    row = conn.execute(
+                        'SELECT mtime, size FROM entries WHERE path = ? '
+                        'AND description IS NOT NULL',
+                        (filepath,)).fetchone()
+                if row != (stat.st_mtime, stat.st_size):
+                    self._describe(filepath, stat.st_mtime, stat.st_size)
+                    described += 1
+            except Exception as err:
+                LOGGER.warning('Cannot describe {}: {}'.format(
+                    filepath, err))
+
+    def _run_scanner(self):
+        while True:
+            try:
+                self.scan()
+            except Exception as err:
+                LOGGER.error('Metadata cache scan failed: {}'.format(err))
+            self.describe_queued(self.scan_interval)
+
+    def _sync_directory(self, dirpath):
+        """
+        List a directory and update its entries in the cache: new and
+        modified files are reset (to be described again) and removed
+        entries are deleted, with their descendants
+
+        :param dirpath: normalized path to directory
+
+        :returns: `list` of tuples of name, `bool` of whether a directory,
+                  modification time and size
+        """
+
+        dir_mtime = os.stat(dirpath).st_mtime
+        entries = []
+        for entry in os.scandir(dirpath):
+            try:
+                if entry.is_dir():
+                    is_dir = True
+                elif entry.is_file():
+                    is_dir = False
+                else:
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry.name, is_dir, stat.st_mtime, stat.st_size))
+
+        entries.sort()
+
+        with self._connect() as conn:
+            cached = {row[0]: row[1:] for row in conn.execute(
+                'SELECT name, is_dir, mtime, size FROM entries '
+                'WHERE parent = ?', (dirpath,))}
+
+            for name, is_dir, mtime, size in entries:
+                path = os.path.join(dirpath, name)
+                if is_dir:
+                    # directory mtimes are compared on listing
+                    if name not in cached or not cached[name][0]:
+                        _delete_entries(conn, path)
+                        conn.execute(
+                            'INSERT INTO entries (path, parent, name, '
+                            'is_dir) VALUES (?, ?, ?, 1)',
+                            (path, dirpath, name))
+                elif cached.get(name) != (0, mtime, size):
+                    _delete_entries(conn, path)
+                    conn.execute(
+                        'INSERT INTO entries (path, parent, name, is_dir, '
+                        'mtime, size) VALUES (?, ?, ?, 0, ?, ?)',
+                        (path, dirpath, name, mtime, size))
+
+            names = {entry[0] for entry in entries}
+            for name in set(cached) - names:
+                _delete_entries(conn, os.path.join(dirpath, name),
+                                descendants=True)
+
+            cursor = conn.execute(
+                'UPDATE entries SET mtime = ? WHERE path = ?',
+                (dir_mtime, dirpath))
+            if cursor.rowcount == 0:
+                conn.execute(
+                    'INSERT INTO entries (path, parent, name, is_dir, '
+                    'mtime) VALUES (?, ?, ?, 1, ?)',
+                    (dirpath, os.path.dirname(dirpath),
+                     os.path.basename(dirpath), dir_mtime))
+
+        return entries
+
+    def _describe(self, filepath, mtime, size):
+        """
+        Describe a file, store its description and index its
+        footprint and time range
+
+        :param filepath: normalized path to file
+        :param mtime: modification time of file
+        :param size: size of file
+
+        :returns: `dict` of GeoJSON item
+        """
+
+        description = _describe_file(filepath)
+        start, end = _get_time_range(description, mtime)
+
+        with self._connect() as conn:
+            _delete_entries(conn, filepath)
+            cursor = conn.execute(
+                'INSERT INTO entries (path, parent, name, is_dir, mtime, '
+                'size, description) VALUES (?, ?, ?, 0, ?, ?, ?)',
+                (filepath, os.path.dirname(filepath),
+                 os.path.basename(filepath), mtime, size,
+                 to_json(description)))
+            id_ = cursor.lastrowid
+
+            bbox = description.get('bbox')
+            if bbox:
+                conn.execute(
+                    'INSERT INTO footprints VALUES (?, ?, ?, ?, ?)',
+                    (id_, bbox[0], bbox[2], bbox[1], bbox[3]))
+            conn.execute('INSERT INTO times VALUES (?, ?, ?)',
+                         (id_, start, end))
+
+        return description
+
+    def __repr__(self):
+        return '<FileMetadataCache> {}'.format(self.path)
+
+
+def _delete_entries(conn, path, descendants=False):
+    """
+    Helper function to delete cache entries and their index rows
+
+    :param conn: `sqlite3.Connection` of metadata cache
+    :param path: normalized path of entry
+    :param descendants: `bool` of whether to delete the entries below
+                        path (directory)
+
+    :returns: `None`
+    """
+
+    where = 'path = ?'
+    params = [path]
+    if descendants:
+        prefix = '{}{}'.format(path, os.sep)
+        where += ' OR substr(path, 1, ?) = ?'
+        params.extend([len(prefix), prefix])
+
+    for table in ['footprints', 'times']:
+        conn.execute(
+            'DELETE FROM {} WHERE id IN (SELECT id FROM entries '
+            'WHERE {})'.format(table, where), params)
+
+    conn.execute('DELETE FROM entries WHERE {}'.format(where), params)
+
+
+def _get_time_range(description, mtime):
+    """
+    Helper function to get the time range of a described file, from
+    its (STAC) datetime properties or else its modification time
+
+    :param description: `dict` of GeoJSON item
+    :param mtime: modification time of file
+
+    :returns: tuple of start and end as ISO 8601 UTC strings
+    """
+
+    properties = description.get('properties', {})
+    values = [properties.get('start_datetime') or properties.get('datetime'),
+              properties.get('end_datetime') or properties.get('datetime')]
+
+    try:
+        return tuple(to_utc_string(dateparse(value)) for value in values)
+    except (TypeError, ValueError, OverflowError):
+        value = to_utc_string(datetime.fromtimestamp(mtime, timezone.utc))
+        return value, value
+
+
+def _scan_directory(dirpath):
+    """
+    Helper function to list the subdirectories and files of a directory
+
+    :param dirpath: path to directory
+
+    :returns: `list` of tuples of name and `bool` of whether a directory
+    """
+
+    entries = []
+    for entry in os.scandir(dirpath):
+        if entry.is_dir():
+            entries.append((entry.name, True))
+        elif entry.is_file():
+            entries.append((entry.name, False))
+
+    return entries
+
+
 def _describe_file(filepath):
     """
     Helper function to describe a geospatial data
@@ -230,54 +846,73 @@ def _describe_file(filepath):
 
     try:  # raster
         LOGGER.debug('Testing raster data detection')
-        d = rasterio.open(filepath)
-        content['bbox'] = [
-            d.bounds.left,
-            d.bounds.bottom,
-            d.bounds.right,
-            d.bounds.top
-        ]
-        content['geometry'] = {
-            'type': 'Polygon',
-            'coordinates': [[
-                [d.bounds.left, d.bounds.bottom],
-                [d.bounds.left, d.bounds.top],
-                [d.bounds.right, d.bounds.top],
-                [d.bounds.right, d.bounds.bottom],
-                [d.bounds.left, d.bounds.bottom]
-            ]]
-        }
-        for k, v in d.tags(1).items():
-            content['properties'][k] = v
+        with rasterio.open(filepath) as d:
+            bounds = _get_wgs84_bounds(d.bounds, d.crs)
+            content['bbox'] = list(bounds)
+            content['geometry'] = _get_bounds_polygon(bounds)
+            for k, v in d.tags(1).items():
+                content['properties'][k] = v
     except rasterio.errors.RasterioIOError:
         LOGGER.debug('Testing vector data detection')
-        d = fiona.open(filepath)
-
-        if d.schema['geometry'] not in [None, 'None']:
-            content['bbox'] = [
-                d.bounds[0],
-                d.bounds[1],
-                d.bounds[2],
-                d.bounds[3]
-            ]
-            content['geometry'] = {
-                'type': 'Polygon',
-                'coordinates': [[
-                    [d.bounds[0], d.bounds[1]],
-                    [d.bounds[0], d.bounds[3]],
-                    [d.bounds[2], d.bounds[3]],
-                    [d.bounds[2], d.bounds[1]],
-                    [d.bounds[0], d.bounds[1]]
-                ]]
-            }
-        for k, v in d.schema['properties'].items():
-            content['properties'][k] = v
-
-        if d.driver == 'ESRI Shapefile':
-            id_ = os.path.splitext(os.path.basename(filepath))[0]
-            content['assets'] = {}
-            for suffix in ['shx', 'dbf', 'prj']:
-                content['assets'][suffix] = {
-                    'href': './{}.{}'.format(id_, suffix)
-                }
+        with fiona.open(filepath) as d:
+            if d.schema['geometry'] not in [None, 'None']:
+                crs = None
+                if d.crs_wkt:
+                    crs = rasterio.crs.CRS.from_wkt(d.crs_wkt)
+                bounds = _get_wgs84_bounds(d.bounds, crs)
+                content['bbox'] = list(bounds)
+                content['geometry'] = _get_bounds_polygon(bounds)
+            for k, v in d.schema['properties'].items():
+                content['properties'][k] = v
+
+            if d.driver == 'ESRI Shapefile':
+                id_ = os.path.splitext(os.path.basename(filepath))[0]
+                content['assets'] = {}
+                for suffix in ['shx', 'dbf', 'prj']:
+                    content['assets'][suffix] = {
+                        'href': './{}.{}'.format(id_, suffix)
+                    }
     return content
+
+
+def _get_wgs84_bounds(bounds, crs):
+    """
+    Helper function to transform bounds to WGS84 longitudes and
+    latitudes (as bbox and geometry of items and for searching)
+
+    :param bounds: tuple of minx, miny, maxx, maxy
+    :param crs: `rasterio.crs.CRS` of bounds (`None` if unknown,
+                assumed to be WGS84)
+
+    :returns: tuple of minx, miny, maxx, maxy in WGS84
+    """
+
+    from rasterio.warp import transform_bounds
+
+    if crs is None or crs == WGS84:
+        return tuple(bounds)
+
+    return transform_bounds(crs, WGS84, *bounds)
+
+
+def _get_bounds_polygon(bounds):
+    """
+    Helper function to make a GeoJSON polygon of bounds
+
+    :param bounds: tuple of minx, miny, maxx, maxy
+
+    :returns: `dict` of GeoJSON geometry
+    """
+
+    minx, miny, maxx, maxy = bounds
+
+    return {
+        'type': 'Polygon',
+        'coordinates': [[
+            [minx, miny],
+            [minx, maxy],
+            [maxx, maxy],
+            [maxx, miny],
+            [minx, miny]
+        ]]
+    }
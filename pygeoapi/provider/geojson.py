@@ -137,6 +137,26 @@ class GeoJSONProvider(BaseProvider):
 
         return data
 
+    def iter_features(self, startindex=0, limit=10, bbox=[], datetime=None,
+                      properties=[], sortby=[]):
+        """
+        query the provider, yielding features one by one
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10, `None`
+                      for all records)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: iterator of GeoJSON features
+        """
+
+        stop = None if limit is None else startindex + limit
+
+        return iter(self._load()['features'][startindex:stop])
+
     def get(self, identifier):
         """
         query the provider by id
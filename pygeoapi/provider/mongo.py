@@ -34,7 +34,8 @@ from pymongo import MongoClient
 from pymongo import GEOSPHERE
 from pymongo import ASCENDING, DESCENDING
 from pymongo.collection import ObjectId
-from pygeoapi.provider.base import BaseProvider, ProviderItemNotFoundError
+from pygeoapi.provider.base import (BaseProvider, ITER_BATCH_SIZE,
+                                    ProviderItemNotFoundError)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -94,12 +95,16 @@ class MongoProvider(BaseProvider):
 
         return featurelist, matchCount
 
-    def query(self, startindex=0, limit=10, resulttype='results',
-              bbox=[], datetime=None, properties=[], sortby=[]):
+    def _get_filter(self, bbox=[], datetime=None, properties=[], sortby=[]):
         """
-        query the provider
+        Build the filter and sort specification of a query
 
-        :returns: dict of 0..n GeoJSON features
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: tuple of filter `dict` and sort `list`
         """
         and_filter = []
 
@@ -123,6 +128,19 @@ class MongoProvider(BaseProvider):
                       ASCENDING if (sort['order'] == 'A') else DESCENDING)
                      for sort in sortby]
 
+        return filterobj, sort_list
+
+    def query(self, startindex=0, limit=10, resulttype='results',
+              bbox=[], datetime=None, properties=[], sortby=[]):
+        """
+        query the provider
+
+        :returns: dict of 0..n GeoJSON features
+        """
+        filterobj, sort_list = self._get_filter(bbox=bbox, datetime=datetime,
+                                                properties=properties,
+                                                sortby=sortby)
+
         featurelist, matchcount = self._get_feature_list(filterobj,
                                                          sortList=sort_list,
                                                          skip=startindex,
@@ -140,6 +158,42 @@ class MongoProvider(BaseProvider):
 
         return feature_collection
 
+    def iter_features(self, startindex=0, limit=10, bbox=[], datetime=None,
+                      properties=[], sortby=[]):
+        """
+        query the provider, reading features in batches from a cursor
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10, `None`
+                      for all records)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: iterator of GeoJSON features
+        """
+        filterobj, sort_list = self._get_filter(bbox=bbox, datetime=datetime,
+                                                properties=properties,
+                                                sortby=sortby)
+
+        featurecursor = self.featuredb[self.collection].find(
+            filterobj, batch_size=ITER_BATCH_SIZE)
+
+        if sort_list:
+            featurecursor = featurecursor.sort(sort_list)
+
+        featurecursor.skip(startindex)
+        if limit is not None:
+            featurecursor.limit(limit)
+
+        try:
+            for item in featurecursor:
+                item['id'] = str(item.pop('_id'))
+                yield item
+        finally:
+            featurecursor.close()
+
     def get(self, identifier):
         """
         query the provider by id
@@ -31,18 +31,24 @@
 
 import functools
 import importlib
+import json
 import logging
 import os
+import struct
 from typing import Any
 
+import numpy as np
+
 from osgeo import gdal as osgeo_gdal
 from osgeo import ogr as osgeo_ogr
 from osgeo import osr as osgeo_osr
 
+from pygeoapi.cache import FileSystemCache
 from pygeoapi.provider.base import (
-    BaseProvider, ProviderGenericError,
+    BaseProvider, ITER_BATCH_SIZE, ProviderGenericError,
     ProviderQueryError, ProviderConnectionError,
     ProviderItemNotFoundError)
+from pygeoapi.util import to_json
 
 LOGGER = logging.getLogger(__name__)
 
@@ -89,10 +95,15 @@ class OGRProvider(BaseProvider):
                 target_srs: EPSG:4326
                 source_capabilities:
                     paging: True
+                    # arrow_stream: False (disable batched reading)
                 source_options:
                     OGR_WFS_LOAD_MULTIPLE_LAYER_DEFN: NO
                 # open_options:
                     # EXPOSE_GML_ID: NO
+                # cache: (optional local cache of remote responses)
+                    # directory: /tmp/pygeoapi-cache
+                    # ttl: 300
+                    # max_size: 104857600
                 gdal_ogr_options:
                     EMPTY_AS_NULL: NO
                     GDAL_CACHEMAX: 64
@@ -136,8 +147,13 @@ class OGRProvider(BaseProvider):
         source_options = self.data_def.get('source_options', {})
         for key in source_options:
             self.gdal.SetConfigOption(key, str(source_options[key]))
-        # Open options
-        self.open_options = self.data_def.get('open_options', {})
+        # Open options (copied, as paging may update them per request)
+        self.open_options = dict(self.data_def.get('open_options', {}))
+
+        # Local cache of query results, for remote sources (optional)
+        self.cache = None
+        if 'cache' in self.data_def:
+            self.cache = FileSystemCache(self.data_def['cache'])
 
         self.source_capabilities = self.data_def.get('source_capabilities',
                                                      {'paging': False})
@@ -232,7 +248,7 @@ class OGRProvider(BaseProvider):
             raise Exception(msg)
 
         # Always need to disable paging immediately after Open!
-        if self.source_capabilities['paging']:
+        if self.source_capabilities.get('paging', False):
             self.source_helper.disable_paging()
 
     def _close(self):
@@ -249,6 +265,13 @@ class OGRProvider(BaseProvider):
         # Delegate getting Layer to SourceHelper
         return self.source_helper.get_layer()
 
+    def _get_query_layer(self, **kwargs):
+        if not self.conn:
+            self._open()
+
+        # Delegate filtering, sorting and paging to SourceHelper
+        return self.source_helper.get_query_layer(**kwargs)
+
     def get_fields(self):
         """
         Get provider field information (names, types)
@@ -286,6 +309,47 @@ class OGRProvider(BaseProvider):
 
         return fields
 
+    def _get_filters(self, bbox=[], properties=[]):
+        """
+        Build the spatial and attribute filters of a query
+
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param properties: list of tuples (name, value)
+
+        :returns: tuple of OGR Geometry (in source SRS) and
+                  OGR SQL WHERE expression (or `None`)
+        """
+
+        spatial_filter = None
+        if bbox:
+            LOGGER.debug('processing bbox parameter')
+            minx, miny, maxx, maxy = bbox
+
+            wkt = "POLYGON (({minx} {miny},{minx} {maxy},{maxx} {maxy}," \
+                  "{maxx} {miny},{minx} {miny}))".format(
+                    minx=float(minx), miny=float(miny),
+                    maxx=float(maxx), maxy=float(maxy))
+
+            spatial_filter = self.ogr.CreateGeometryFromWkt(wkt)
+            if self.transform_in:
+                spatial_filter.Transform(self.transform_in)
+
+        attribute_filter = None
+        if properties:
+            LOGGER.debug('processing properties')
+
+            attribute_filter = ' and '.join(
+                map(
+                    lambda x: '"{}" = \'{}\''.format(
+                        x[0], str(x[1]).replace("'", "''")),
+                    properties
+                )
+            )
+
+            LOGGER.debug(attribute_filter)
+
+        return spatial_filter, attribute_filter
+
     def query(self, startindex=0, limit=10, resulttype='results',
               bbox=[], datetime=None, properties=[], sortby=[]):
         """
@@ -301,52 +365,43 @@ class OGRProvider(BaseProvider):
 
         :returns: dict of 0..n GeoJSON features
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                self.data_def['source'], self.layer_name, self.target_srs,
+                'query', startindex, limit, resulttype, bbox, datetime,
+                properties, sortby)
+            result = self._get_cached(cache_key)
+            if result is not None:
+                return result
+
         result = None
         try:
-            if self.source_capabilities['paging']:
+            if self.source_capabilities.get('paging', False):
                 self.source_helper.enable_paging(startindex, limit)
 
-            layer = self._get_layer()
-
-            if bbox:
-                LOGGER.debug('processing bbox parameter')
-                minx, miny, maxx, maxy = bbox
-
-                wkt = "POLYGON (({minx} {miny},{minx} {maxy},{maxx} {maxy}," \
-                      "{maxx} {miny},{minx} {miny}))".format(
-                        minx=float(minx), miny=float(miny),
-                        maxx=float(maxx), maxy=float(maxy))
-
-                polygon = self.ogr.CreateGeometryFromWkt(wkt)
-                if self.transform_in:
-                    polygon.Transform(self.transform_in)
-
-                layer.SetSpatialFilter(polygon)
-
-                # layer.SetSpatialFilterRect(
-                # float(minx), float(miny), float(maxx), float(maxy))
-
-            if properties:
-                LOGGER.debug('processing properties')
-
-                attribute_filter = ' and '.join(
-                    map(
-                        lambda x: '{} = \'{}\''.format(x[0], x[1]),
-                        properties
-                    )
-                )
-
-                LOGGER.debug(attribute_filter)
-
-                layer.SetAttributeFilter(attribute_filter)
+            spatial_filter, attribute_filter = self._get_filters(
+                bbox=bbox, properties=properties)
 
             # Make response based on resulttype specified
             if resulttype == 'hits':
                 LOGGER.debug('hits only specified')
+                layer = self._get_query_layer(
+                    attribute_filter=attribute_filter,
+                    spatial_filter=spatial_filter)
                 result = self._response_feature_hits(layer)
             elif resulttype == 'results':
                 LOGGER.debug('results specified')
-                result = self._response_feature_collection(layer, limit)
+                layer = self._get_query_layer(
+                    startindex=startindex, limit=limit,
+                    attribute_filter=attribute_filter,
+                    spatial_filter=spatial_filter,
+                    sortby=sortby)
+                if self._use_arrow_stream(layer):
+                    result = self._response_feature_collection_batched(
+                        layer, limit)
+                else:
+                    result = self._response_feature_collection(layer, limit)
             else:
                 LOGGER.error('Invalid resulttype: %s' % resulttype)
 
@@ -363,8 +418,76 @@ class OGRProvider(BaseProvider):
         finally:
             self._close()
 
+        if cache_key is not None and result is not None:
+            self._set_cached(cache_key, result)
+
         return result
 
+    def iter_features(self, startindex=0, limit=10, bbox=[], datetime=None,
+                      properties=[], sortby=[]):
+        """
+        Query OGR source, reading features sequentially from the layer
+        (reprojected in batches of ITER_BATCH_SIZE features)
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10, `None`
+                      for all records)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: iterator of GeoJSON features
+        """
+
+        try:
+            if self.source_capabilities.get('paging', False):
+                self.source_helper.enable_paging(
+                    startindex, limit or ITER_BATCH_SIZE)
+
+            spatial_filter, attribute_filter = self._get_filters(
+                bbox=bbox, properties=properties)
+
+            layer = self._get_query_layer(
+                startindex=startindex, limit=limit,
+                attribute_filter=attribute_filter,
+                spatial_filter=spatial_filter,
+                sortby=sortby)
+            layer.ResetReading()
+
+            count = 0
+            features = []
+            ogr_feature = _ignore_gdal_error(layer, 'GetNextFeature')
+            while ogr_feature is not None:
+                features.append(self._ogr_feature_to_json(ogr_feature))
+
+                count += 1
+                if count == limit:
+                    break
+
+                if len(features) == ITER_BATCH_SIZE:
+                    for feature in self._transform_features(features):
+                        yield feature
+                    features = []
+
+                ogr_feature = _ignore_gdal_error(layer, 'GetNextFeature')
+
+            for feature in self._transform_features(features):
+                yield feature
+
+        except RuntimeError as err:
+            LOGGER.error(err)
+            raise ProviderQueryError(err)
+        except ProviderConnectionError as err:
+            LOGGER.error(err)
+            raise ProviderConnectionError(err)
+        except Exception as err:
+            LOGGER.error(err)
+            raise ProviderGenericError(err)
+
+        finally:
+            self._close()
+
     def get(self, identifier):
         """
         Get Feature by id
@@ -373,6 +496,15 @@ class OGRProvider(BaseProvider):
 
         :returns: feature collection
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                self.data_def['source'], self.layer_name, self.target_srs,
+                'get', identifier)
+            result = self._get_cached(cache_key)
+            if result is not None:
+                return result
+
         result = None
         try:
             LOGGER.debug('Fetching identifier {}'.format(identifier))
@@ -383,6 +515,7 @@ class OGRProvider(BaseProvider):
 
             ogr_feature = self._get_next_feature(layer, identifier)
             result = self._ogr_feature_to_json(ogr_feature)
+            self._transform_features([result])
 
         except RuntimeError as err:
             LOGGER.error(err)
@@ -400,11 +533,42 @@ class OGRProvider(BaseProvider):
         finally:
             self._close()
 
+        if cache_key is not None:
+            self._set_cached(cache_key, result)
+
         return result
 
     def __repr__(self):
         return '<OGRProvider> {}'.format(self.data)
 
+    def _get_cached(self, key):
+        """
+        Get a (GeoJSON) result from the cache
+
+        :param key: cache key
+
+        :returns: `dict` of result or `None` when not cached
+        """
+
+        value = self.cache.get(key)
+        if value is None:
+            return None
+
+        LOGGER.debug('Returning cached result {}'.format(key))
+        return json.loads(value)
+
+    def _set_cached(self, key, result):
+        """
+        Store a (GeoJSON) result in the cache
+
+        :param key: cache key
+        :param result: `dict` of result
+
+        :returns: `None`
+        """
+
+        self.cache.set(key, to_json(result).encode('utf-8'))
+
     def _load_source_helper(self, source_type):
         """
         Loads Source Helper by name.
@@ -449,11 +613,6 @@ class OGRProvider(BaseProvider):
             raise gdalerr
 
     def _ogr_feature_to_json(self, ogr_feature):
-        geom = ogr_feature.GetGeometryRef()
-        if self.transform_out:
-            # Optionally reproject the geometry
-            geom.Transform(self.transform_out)
-
         json_feature = ogr_feature.ExportToJson(as_object=True)
         try:
             json_feature['id'] = json_feature['properties'].pop(self.id_field)
@@ -496,10 +655,227 @@ class OGRProvider(BaseProvider):
                 # Ignore gdal error
                 ogr_feature = _ignore_gdal_error(layer, 'GetNextFeature')
 
+            self._transform_features(feature_collection['features'])
+
+            return feature_collection
+        except RuntimeError as gdalerr:
+            LOGGER.error(self.gdal.GetLastErrorMsg())
+            raise gdalerr
+
+    def _use_arrow_stream(self, layer):
+        """
+        Whether features can be read in batches through the
+        columnar (Arrow) stream interface of the GDAL bindings
+        (GDAL >= 3.6 with NumPy support). Can be switched off with
+        `source_capabilities.arrow_stream: False`.
+
+        :returns: `bool` of whether to use batched reading
+        """
+
+        if not self.source_capabilities.get('arrow_stream', True):
+            return False
+
+        return hasattr(layer, 'GetArrowStreamAsNumPy')
+
+    @staticmethod
+    def _arrow_column_names(layer):
+        """
+        Helper function to derive the FID and geometry column names
+        as exposed in batches of the Arrow stream of a Layer.
+
+        :returns: `tuple` of FID and geometry column names
+        """
+
+        fid_column = layer.GetFIDColumn() or 'OGC_FID'
+        geom_column = layer.GetGeometryColumn() or 'wkb_geometry'
+
+        return fid_column, geom_column
+
+    def _response_feature_collection_batched(self, layer, limit):
+        """
+        Assembles output from Layer query as
+        GeoJSON FeatureCollection structure, reading features
+        in batches from the Layer Arrow stream.
+
+        :returns: GeoJSON FeatureCollection
+        """
+
+        feature_collection = {
+            'type': 'FeatureCollection',
+            'features': []
+        }
+
+        fid_column, geom_column = self._arrow_column_names(layer)
+        temporal_fields = self._arrow_temporal_fields(layer)
+
+        layer.ResetReading()
+
+        options = [
+            'INCLUDE_FID=YES',
+            'MAX_FEATURES_IN_BATCH={}'.format(max(min(limit, 65536), 1))
+        ]
+
+        # Ignore gdal errors once for the whole stream
+        # instead of for every single feature
+        self.gdal.PushErrorHandler('CPLQuietErrorHandler')
+        stream = None
+        try:
+            stream = layer.GetArrowStreamAsNumPy(options=options)
+
+            features = feature_collection['features']
+            for batch in stream:
+                features.extend(self._arrow_batch_to_json(
+                    batch, fid_column, geom_column, temporal_fields))
+
+                if len(features) >= limit:
+                    del features[limit:]
+                    break
+
+            self._transform_features(features)
+
             return feature_collection
         except RuntimeError as gdalerr:
             LOGGER.error(self.gdal.GetLastErrorMsg())
             raise gdalerr
+        finally:
+            # The stream must be released before its Layer/ResultSet
+            stream = None
+            self.gdal.PopErrorHandler()
+
+    def _arrow_temporal_fields(self, layer):
+        """
+        Helper function to collect the date, time and datetime fields
+        of a Layer, so that their Arrow stream columns can be formatted
+        the same way OGR formats them for single features.
+
+        :param layer: Layer or ResultSet
+
+        :returns: `dict` of field name and (OGR field type, TZ flag)
+        """
+
+        temporal_types = (self.ogr.OFTDate, self.ogr.OFTTime,
+                          self.ogr.OFTDateTime)
+
+        layer_defn = layer.GetLayerDefn()
+        temporal_fields = {}
+        for i in range(layer_defn.GetFieldCount()):
+            field_defn = layer_defn.GetFieldDefn(i)
+            field_type = field_defn.GetType()
+            if field_type not in temporal_types:
+                continue
+
+            # TZ flag of a field is only known from GDAL 3.8 on
+            tz_flag = 0
+            if hasattr(field_defn, 'GetTZFlag'):
+                tz_flag = field_defn.GetTZFlag()
+
+            temporal_fields[field_defn.GetName()] = (field_type, tz_flag)
+
+        return temporal_fields
+
+    def _arrow_batch_to_json(self, batch, fid_column, geom_column,
+                             temporal_fields=None):
+        """
+        Converts a batch (`dict` of NumPy arrays) of the Layer
+        Arrow stream into GeoJSON features. Attribute and geometry
+        columns are converted as whole arrays rather than feature
+        by feature.
+
+        :param batch: `dict` of column name and NumPy array
+        :param fid_column: name of FID column in the batch
+        :param geom_column: name of geometry column in the batch
+        :param temporal_fields: `dict` of date, time and datetime
+                                fields (see `_arrow_temporal_fields`)
+
+        :returns: `list` of GeoJSON features
+        """
+
+        temporal_fields = temporal_fields or {}
+
+        columns = {}
+        for name, values in batch.items():
+            if name in (fid_column, geom_column):
+                continue
+            if name in temporal_fields:
+                columns[name] = _format_ogr_temporal(
+                    values, *temporal_fields[name])
+            else:
+                columns[name] = _numpy_to_list(values)
+
+        fids = _numpy_to_list(batch[fid_column])
+
+        geometries = batch.get(geom_column)
+        if geometries is None:
+            geometries = [None] * len(fids)
+        else:
+            geometries = _wkb_to_geojson_array(
+                geometries, self._ogr_wkb_to_geojson)
+
+        features = []
+        for i, fid in enumerate(fids):
+            properties = {name: values[i] for name, values in columns.items()}
+
+            json_feature = {
+                'type': 'Feature',
+                'geometry': geometries[i],
+                'properties': properties
+            }
+
+            if self.id_field in properties:
+                json_feature['id'] = properties.pop(self.id_field)
+            else:
+                json_feature['id'] = fid
+
+            features.append(json_feature)
+
+        return features
+
+    def _ogr_wkb_to_geojson(self, wkb):
+        """
+        Converts a single WKB geometry into a GeoJSON geometry
+        through OGR, for geometry types (e.g. curves) not handled
+        by the array decoder.
+
+        :param wkb: `bytes` of WKB geometry
+
+        :returns: `dict` of GeoJSON geometry
+        """
+
+        geom = self.ogr.CreateGeometryFromWkb(wkb)
+        return json.loads(geom.ExportToJson())
+
+    def _transform_features(self, features):
+        """
+        Optionally reprojects the geometries of GeoJSON features.
+        All coordinates of the features are gathered and transformed
+        in a single call instead of one call per geometry.
+
+        :param features: `list` of GeoJSON features (updated in place)
+
+        :returns: `list` of GeoJSON features
+        """
+
+        if not self.transform_out:
+            return features
+
+        positions = []
+        for feature in features:
+            _get_positions(feature.get('geometry'), positions)
+
+        if not positions:
+            return features
+
+        LOGGER.debug('Reprojecting {} coordinates'.format(len(positions)))
+        transformed = self.transform_out.TransformPoints(
+            [(pos[0], pos[1], pos[2] if len(pos) > 2 else 0.0)
+             for pos in positions])
+
+        for pos, xyz in zip(positions, transformed):
+            pos[0:2] = xyz[0:2]
+            if len(pos) > 2:
+                pos[2] = xyz[2]
+
+        return features
 
     def _response_feature_hits(self, layer):
         """
@@ -563,6 +939,32 @@ class SourceHelper:
 
         return layer
 
+    def get_query_layer(self, startindex=0, limit=None,
+                        attribute_filter=None, spatial_filter=None,
+                        sortby=[]):
+        """
+        Default action to get a Layer object with the query
+        filters applied. Paging and sorting are left to the
+        Driver (see enable_paging).
+
+        :param startindex: starting record to return
+        :param limit: number of records to return
+        :param attribute_filter: OGR SQL WHERE expression
+        :param spatial_filter: OGR Geometry in source SRS
+        :param sortby: list of dicts (property, order)
+
+        :return: OGR layer object
+        """
+
+        layer = self.get_layer()
+
+        if spatial_filter is not None:
+            layer.SetSpatialFilter(spatial_filter)
+        if attribute_filter:
+            layer.SetAttributeFilter(attribute_filter)
+
+        return layer
+
     def enable_paging(self, startindex=-1, limit=-1):
         """
         Enable paged access to dataset (OGR Driver-specific)
@@ -593,8 +995,6 @@ class CommonSourceHelper(SourceHelper):
         :returns: pygeoapi.providers.ogr.SourceHelper
         """
         SourceHelper.__init__(self, provider)
-        self.startindex = -1
-        self.limit = -1
         self.result_set = None
 
     def close(self):
@@ -617,45 +1017,55 @@ class CommonSourceHelper(SourceHelper):
         finally:
             self.result_set = None
 
-    def enable_paging(self, startindex=-1, limit=-1):
-        """
-        Enable paged access to dataset (OGR Driver-specific)
-        using OGR SQL https://gdal.org/user/ogr_sql_dialect.html
-        e.g. SELECT * FROM poly LIMIT 10 OFFSET 30
-
-        """
-        self.startindex = startindex
-        self.limit = limit
-
-    def disable_paging(self):
-        """
-        Disable paged access to dataset (OGR Driver-specific)
+    def get_query_layer(self, startindex=0, limit=None,
+                        attribute_filter=None, spatial_filter=None,
+                        sortby=[]):
         """
+        Gets OGR Layer from opened OGR dataset with the query applied.
+        When startindex is 1 or greater or sortby is defined will invoke
+        a single OGR SQL SELECT with WHERE, ORDER BY, LIMIT and OFFSET
+        (https://gdal.org/user/ogr_sql_dialect.html) and return
+        as Layer as ResultSet from ExecuteSQL on dataset.
+        The spatial filter is passed to ExecuteSQL so that it is
+        applied (using the Driver spatial index) before paging.
 
-        pass
+        :param startindex: starting record to return
+        :param limit: number of records to return
+        :param attribute_filter: OGR SQL WHERE expression
+        :param spatial_filter: OGR Geometry in source SRS
+        :param sortby: list of dicts (property, order)
 
-    def get_layer(self):
-        """
-        Gets OGR Layer from opened OGR dataset.
-        When startindex defined 1 or greater will invoke
-        OGR SQL SELECT with LIMIT and OFFSET and return
-        as Layer as ResultSet from ExecuteSQL on dataset.
         :return: OGR layer object
         """
-        if self.startindex <= 0:
-            return SourceHelper.get_layer(self)
+
+        if startindex <= 0 and not sortby:
+            return SourceHelper.get_query_layer(
+                self, attribute_filter=attribute_filter,
+                spatial_filter=spatial_filter)
 
         self.close()
 
-        sql = 'SELECT * FROM "{ds_name}" LIMIT {limit} OFFSET {offset}'.format(
-            ds_name=self.provider.layer_name,
-            limit=self.limit,
-            offset=self.startindex)
-        self.result_set = self.provider.conn.ExecuteSQL(sql)
+        sql = 'SELECT * FROM "{ds_name}"'.format(
+            ds_name=self.provider.layer_name)
+
+        if attribute_filter:
+            sql += ' WHERE {}'.format(attribute_filter)
 
-        # Reset since needs to be set each time explicitly
-        self.startindex = -1
-        self.limit = -1
+        if sortby:
+            sql += ' ORDER BY {}'.format(', '.join(
+                '"{}" {}'.format(
+                    s['property'], 'DESC' if s['order'] == 'D' else 'ASC')
+                for s in sortby))
+
+        if limit is not None:
+            sql += ' LIMIT {}'.format(int(limit))
+
+        if startindex > 0:
+            sql += ' OFFSET {}'.format(int(startindex))
+
+        LOGGER.debug('SQL: {}'.format(sql))
+        self.result_set = self.provider.conn.ExecuteSQL(
+            sql, spatialFilter=spatial_filter, dialect='OGRSQL')
 
         if not self.result_set:
             msg = 'Cannot get Layer {} via ExecuteSQL'.format(
@@ -687,8 +1097,6 @@ class ESRIJSONHelper(CommonSourceHelper):
             return
 
         self.provider.open_options.update(FEATURE_SERVER_PAGING=True)
-        self.startindex = startindex
-        self.limit = limit
 
     def disable_paging(self):
         """
@@ -697,37 +1105,6 @@ class ESRIJSONHelper(CommonSourceHelper):
 
         self.provider.open_options.update(FEATURE_SERVER_PAGING=False)
 
-    def get_layer(self):
-        """
-        Gets OGR Layer from opened OGR dataset.
-        When startindex defined 1 or greater will invoke
-        OGR SQL SELECT with LIMIT and OFFSET and return
-        as Layer as ResultSet from ExecuteSQL on dataset.
-        :return: OGR layer object
-        """
-        if self.startindex <= 0:
-            return CommonSourceHelper.get_layer(self)
-
-        self.close()
-
-        sql = "SELECT * FROM {ds_name} LIMIT {limit} OFFSET {offset}".format(
-            ds_name=self.provider.layer_name,
-            limit=self.limit,
-            offset=self.startindex)
-        self.result_set = self.provider.conn.ExecuteSQL(sql)
-
-        # Reset since needs to be set each time explicitly
-        self.startindex = -1
-        self.limit = -1
-
-        if not self.result_set:
-            msg = 'Cannot get Layer {} via ExecuteSQL'.format(
-                self.provider.layer_name)
-            LOGGER.error(msg)
-            raise Exception(msg)
-
-        return self.result_set
-
 
 class WFSHelper(SourceHelper):
 
@@ -745,16 +1122,19 @@ class WFSHelper(SourceHelper):
         """
         Enable paged access to dataset (OGR Driver-specific)
 
+        The WFS Driver reads its paging settings when the dataset
+        is opened. They are set thread-locally, so that concurrent
+        requests do not see each others' page.
         """
 
         if startindex < 0:
             return
 
-        self.provider.gdal.SetConfigOption(
+        self.provider.gdal.SetThreadLocalConfigOption(
             'OGR_WFS_PAGING_ALLOWED', 'ON')
-        self.provider.gdal.SetConfigOption(
+        self.provider.gdal.SetThreadLocalConfigOption(
             'OGR_WFS_BASE_START_INDEX', str(startindex))
-        self.provider.gdal.SetConfigOption(
+        self.provider.gdal.SetThreadLocalConfigOption(
             'OGR_WFS_PAGE_SIZE', str(limit))
 
     def disable_paging(self):
@@ -762,10 +1142,9 @@ class WFSHelper(SourceHelper):
         Disable paged access to dataset (OGR Driver-specific)
         """
 
-        self.provider.gdal.SetConfigOption(
-            'OGR_WFS_PAGING_ALLOWED', None)
-        self.provider.gdal.SetConfigOption(
-            'OGR_WFS_PAGE_SIZE', None)
+        for key in ['OGR_WFS_PAGING_ALLOWED', 'OGR_WFS_BASE_START_INDEX',
+                    'OGR_WFS_PAGE_SIZE']:
+            self.provider.gdal.SetThreadLocalConfigOption(key, None)
 
 
 class GdalErrorHandler:
@@ -825,9 +1204,10 @@ def _silent_gdal_error(f):
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
         osgeo_gdal.PushErrorHandler('CPLQuietErrorHandler')
-        v = f(*args, **kwargs)
-        osgeo_gdal.PopErrorHandler()
-        return v
+        try:
+            return f(*args, **kwargs)
+        finally:
+            osgeo_gdal.PopErrorHandler()
 
     return wrapper
 
@@ -846,3 +1226,324 @@ def _ignore_gdal_error(inst, fn, *args, **kwargs) -> Any:
     """
     value = getattr(inst, fn)(*args, **kwargs)
     return value
+
+
+def _numpy_to_list(values):
+    """
+    Converts a column (NumPy array) of an Arrow stream batch
+    into a list of JSON serializable values.
+
+    :param values: NumPy array or masked array
+
+    :returns: `list` of values (`None` for null values)
+    """
+
+    mask = None
+    if hasattr(values, 'mask'):  # masked array
+        mask = values.mask
+        values = values.data
+
+    if values.dtype.kind == 'M':  # date/datetime
+        result = values.astype(object).tolist()
+    else:
+        result = values.tolist()
+
+    if values.dtype.kind == 'O':  # strings, binary, lists
+        for i, value in enumerate(result):
+            if isinstance(value, bytes):
+                try:
+                    result[i] = value.decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
+            elif hasattr(value, 'tolist'):
+                result[i] = value.tolist()
+
+    if mask is not None and mask.any():
+        for i in mask.nonzero()[0].tolist():
+            result[i] = None
+
+    return result
+
+
+_WKB_GEOMETRY_TYPES = {
+    1: 'Point',
+    2: 'LineString',
+    3: 'Polygon',
+    4: 'MultiPoint',
+    5: 'MultiLineString',
+    6: 'MultiPolygon',
+    7: 'GeometryCollection'
+}
+
+
+def _wkb_to_geojson_array(values, fallback):
+    """
+    Converts a geometry column (NumPy array of WKB) of an Arrow stream
+    batch into GeoJSON geometries. A column of points of one kind is
+    decoded in one go, other geometries are decoded straight from
+    their WKB buffer. Geometry types that have no GeoJSON equivalent
+    (e.g. curves) are handed to `fallback`.
+
+    :param values: NumPy array or masked array of WKB geometries
+    :param fallback: function converting WKB `bytes` into a GeoJSON
+                     geometry
+
+    :returns: `list` of GeoJSON geometries (`None` for null values)
+    """
+
+    mask = None
+    if hasattr(values, 'mask'):  # masked array
+        mask = values.mask
+        values = values.data
+
+    wkbs = [None if value is None else bytes(value)
+            for value in values.tolist()]
+
+    if mask is not None and mask.any():
+        for i in mask.nonzero()[0].tolist():
+            wkbs[i] = None
+
+    geometries = _wkb_points_to_geojson(wkbs)
+    if geometries is not None:
+        return geometries
+
+    geometries = []
+    for wkb in wkbs:
+        if wkb is None:
+            geometries.append(None)
+            continue
+        try:
+            geometries.append(_wkb_read_geometry(wkb, 0)[0])
+        except (NotImplementedError, struct.error, ValueError):
+            geometries.append(fallback(wkb))
+
+    return geometries
+
+
+def _wkb_points_to_geojson(wkbs):
+    """
+    Decodes a list of WKB points sharing byte order and geometry type
+    as one NumPy array.
+
+    :param wkbs: `list` of WKB `bytes`
+
+    :returns: `list` of GeoJSON geometries, or `None` if the
+              geometries cannot be decoded as one array
+    """
+
+    if not wkbs or None in wkbs:
+        return None
+
+    size = len(wkbs[0])
+    if any(len(wkb) != size for wkb in wkbs):
+        return None
+
+    try:
+        order, geom_type, has_z, has_m, offset = _wkb_header(wkbs[0], 0)
+    except (struct.error, IndexError):
+        return None
+
+    dims = 2 + has_z + has_m
+    if geom_type != 1 or size != offset + dims * 8:
+        return None
+
+    buffer = np.frombuffer(b''.join(wkbs), dtype=np.uint8)
+    buffer = buffer.reshape(len(wkbs), size)
+    if not (buffer[:, :offset] == buffer[0, :offset]).all():
+        return None
+
+    positions = np.ascontiguousarray(buffer[:, offset:])
+    positions = positions.view(order + 'f8')[:, :3 if has_z else 2]
+    if np.isnan(positions).any():  # empty points
+        return None
+
+    return [{'type': 'Point', 'coordinates': coordinates}
+            for coordinates in positions.tolist()]
+
+
+def _wkb_header(wkb, offset):
+    """
+    Reads the header of a (ISO or extended) WKB geometry.
+
+    :param wkb: `bytes` of WKB
+    :param offset: offset of the geometry in `wkb`
+
+    :returns: `tuple` of byte order, geometry type, whether the
+              geometry has Z and M values, and offset of its body
+    """
+
+    order = '<' if wkb[offset] == 1 else '>'
+    geom_type, = struct.unpack_from(order + 'I', wkb, offset + 1)
+    offset += 5
+
+    has_z = bool(geom_type & 0x80000000)
+    has_m = bool(geom_type & 0x40000000)
+    if geom_type & 0x20000000:  # SRID
+        offset += 4
+
+    geom_type &= 0x0FFFFFFF
+    has_z = has_z or geom_type // 1000 in (1, 3)
+    has_m = has_m or geom_type // 1000 in (2, 3)
+
+    return order, geom_type % 1000, has_z, has_m, offset
+
+
+def _wkb_read_geometry(wkb, offset):
+    """
+    Decodes a WKB geometry into a GeoJSON geometry. As in the
+    GeoJSON output of OGR, Z values are kept and M values dropped.
+
+    :param wkb: `bytes` of WKB
+    :param offset: offset of the geometry in `wkb`
+
+    :returns: `tuple` of GeoJSON geometry and offset past the geometry
+    """
+
+    order, geom_type, has_z, has_m, offset = _wkb_header(wkb, offset)
+    if geom_type not in _WKB_GEOMETRY_TYPES:
+        raise NotImplementedError(
+            'WKB geometry type {} not supported'.format(geom_type))
+
+    dims = 2 + has_z + has_m
+    ncoords = 3 if has_z else 2
+
+    def read_positions(count, offset):
+        positions = np.frombuffer(wkb, dtype=order + 'f8',
+                                  count=count * dims, offset=offset)
+        positions = positions.reshape(count, dims)[:, :ncoords]
+        return positions.tolist(), offset + count * dims * 8
+
+    geometry = {'type': _WKB_GEOMETRY_TYPES[geom_type]}
+
+    if geom_type == 1:
+        coordinates, offset = read_positions(1, offset)
+        if all(value != value for value in coordinates[0]):  # NaN: empty
+            geometry['coordinates'] = []
+        else:
+            geometry['coordinates'] = coordinates[0]
+        return geometry, offset
+
+    count, = struct.unpack_from(order + 'I', wkb, offset)
+    offset += 4
+
+    if geom_type == 2:
+        geometry['coordinates'], offset = read_positions(count, offset)
+    elif geom_type == 3:
+        rings = []
+        for i in range(count):
+            npositions, = struct.unpack_from(order + 'I', wkb, offset)
+            ring, offset = read_positions(npositions, offset + 4)
+            rings.append(ring)
+        geometry['coordinates'] = rings
+    else:
+        members = []
+        for i in range(count):
+            member, offset = _wkb_read_geometry(wkb, offset)
+            members.append(member)
+        if geom_type == 7:
+            geometry['geometries'] = members
+        else:
+            geometry['coordinates'] = [member['coordinates']
+                                       for member in members]
+
+    return geometry, offset
+
+
+def _format_ogr_temporal(values, field_type, tz_flag=0):
+    """
+    Formats a date, time or datetime column (NumPy array) of an Arrow
+    stream batch the way OGR formats such fields of a single feature
+    (e.g. `2020/01/31 12:00:00.5+00`).
+
+    :param values: NumPy array or masked array
+    :param field_type: OGR field type (`OFTDate`, `OFTTime` or
+                       `OFTDateTime`)
+    :param tz_flag: OGR TZ flag of the field (0 when unknown)
+
+    :returns: `list` of `str` (`None` for null values)
+    """
+
+    mask = None
+    if hasattr(values, 'mask'):  # masked array
+        mask = values.mask
+        values = values.data
+
+    if values.dtype.kind == 'M':
+        null = np.isnat(values)
+        if field_type == osgeo_ogr.OFTDate:
+            text = np.datetime_as_string(values, unit='D')
+            result = np.char.replace(text, '-', '/').tolist()
+        else:
+            values = values.astype('datetime64[ms]')
+            suffix = ''
+            if tz_flag > 100:  # fixed offset, Arrow holds UTC
+                offset = (tz_flag - 100) * 15
+                values = values + np.timedelta64(offset, 'm')
+                hours, minutes = divmod(abs(offset), 60)
+                suffix = '{}{:02d}'.format('-' if offset < 0 else '+', hours)
+                if minutes:
+                    suffix += '{:02d}'.format(minutes)
+            elif tz_flag == 100:  # UTC
+                suffix = '+00'
+
+            milliseconds = values.astype(np.int64) % 1000
+            text = np.where(milliseconds == 0,
+                            np.datetime_as_string(values, unit='s'),
+                            np.datetime_as_string(values, unit='ms'))
+            text = np.char.replace(text, '-', '/')
+            text = np.char.replace(text, 'T', ' ')
+            result = [value + suffix for value in text.tolist()]
+    elif values.dtype.kind in 'miu' and field_type == osgeo_ogr.OFTTime:
+        if values.dtype.kind == 'm':
+            null = np.isnat(values)
+            values = values.astype('timedelta64[ms]').astype(np.int64)
+        else:  # milliseconds since midnight
+            null = np.zeros(values.shape, dtype=bool)
+        result = []
+        for value in values.tolist():
+            minutes, milliseconds = divmod(value, 60000)
+            hours, minutes = divmod(minutes, 60)
+            if milliseconds % 1000:
+                seconds = '{:06.3f}'.format(milliseconds / 1000)
+            else:
+                seconds = '{:02d}'.format(milliseconds // 1000)
+            result.append('{:02d}:{:02d}:{}'.format(hours, minutes, seconds))
+    else:
+        return _numpy_to_list(values if mask is None else
+                              np.ma.masked_array(values, mask))
+
+    if mask is not None:
+        null = null | mask
+    for i in null.nonzero()[0].tolist():
+        result[i] = None
+
+    return result
+
+
+def _get_positions(geometry, positions):
+    """
+    Collects the (mutable) coordinate positions of a GeoJSON geometry.
+
+    :param geometry: `dict` of GeoJSON geometry (or `None`)
+    :param positions: `list` to which positions are appended
+
+    :returns: `list` of positions
+    """
+
+    if geometry is None:
+        return positions
+
+    if geometry['type'] == 'GeometryCollection':
+        for member in geometry['geometries']:
+            _get_positions(member, positions)
+        return positions
+
+    stack = [geometry['coordinates']]
+    while stack:
+        coordinates = stack.pop()
+        if coordinates and isinstance(coordinates[0], (int, float)):
+            positions.append(coordinates)
+        else:
+            stack.extend(coordinates)
+
+    return positions
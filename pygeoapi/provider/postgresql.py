@@ -43,11 +43,12 @@
 # gunzip < tests/data/hotosm_bdi_waterways.sql.gz |
 #  psql -U postgres -h 127.0.0.1 -p 5432 test
 
+from datetime import datetime
 import logging
 import json
 import psycopg2
 from psycopg2.sql import SQL, Identifier, Literal
-from pygeoapi.provider.base import BaseProvider, \
+from pygeoapi.provider.base import BaseProvider, ITER_BATCH_SIZE, \
     ProviderConnectionError, ProviderQueryError, ProviderItemNotFoundError
 
 from psycopg2.extras import RealDictCursor
@@ -153,6 +154,8 @@ class PostgreSQLProvider(BaseProvider):
         self.id_field = provider_def['id_field']
         self.conn_dic = provider_def['data']
         self.geom = provider_def.get('geom_field', 'geom')
+        # query returning the version of the table (e.g. last update)
+        self.data_version_query = provider_def.get('data_version_query')
 
         LOGGER.debug('Setting Postgresql properties:')
         LOGGER.debug('Connection String:{}'.format(
@@ -175,6 +178,34 @@ class PostgreSQLProvider(BaseProvider):
                 self.fields = db.fields
         return self.fields
 
+    def get_data_version(self):
+        """
+        Get the version of the table with the configured query
+
+        :returns: `datetime` of last modification, `str` of version
+                  or `None` if no query is configured
+        """
+
+        if self.data_version_query is None:
+            return None
+
+        with DatabaseConnection(self.conn_dic, self.table,
+                                context='version') as db:
+            try:
+                db.cur.execute(self.data_version_query)
+                row = db.cur.fetchone()
+            except Exception as err:
+                LOGGER.error('Error executing data version query: {}'.format(
+                    err))
+                raise ProviderQueryError()
+
+        if row is None or row[0] is None:
+            return None
+        if isinstance(row[0], datetime):
+            return row[0]
+
+        return str(row[0])
+
     def __get_where_clauses(self, properties=[], bbox=[]):
         """
         Generarates WHERE conditions to be implemented in query.
@@ -286,6 +317,69 @@ class PostgreSQLProvider(BaseProvider):
 
             return feature_collection
 
+    def iter_features(self, startindex=0, limit=10, bbox=[], datetime=None,
+                      properties=[], sortby=[]):
+        """
+        Query Postgis, fetching rows in batches from a server side
+        (named) cursor
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10, `None`
+                      for all records)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
+
+        :returns: iterator of GeoJSON features
+        """
+        LOGGER.debug('Querying PostGIS with a server side cursor')
+
+        with DatabaseConnection(self.conn_dic, self.table) as db:
+            cursor = db.conn.cursor('geo_stream',
+                                    cursor_factory=RealDictCursor)
+            cursor.itersize = ITER_BATCH_SIZE
+
+            where_clause = self.__get_where_clauses(
+                properties=properties, bbox=bbox)
+
+            if limit is None:
+                limit_clause = SQL('')
+            else:
+                limit_clause = SQL(' LIMIT {}').format(Literal(limit))
+
+            # no DISTINCT (which sorts or hashes the whole result before
+            # the first row), sorted and then ordered by id for
+            # deterministic paging
+            order_by = [SQL('{} {}').format(
+                Identifier(sort['property']),
+                SQL('DESC' if sort['order'] == 'D' else 'ASC'))
+                for sort in sortby]
+            order_by.append(Identifier(self.id_field))
+
+            sql_query = SQL("SELECT {},ST_AsGeoJSON({}) FROM {}{} \
+             ORDER BY {} OFFSET {}{}").\
+                format(db.columns,
+                       Identifier(self.geom),
+                       Identifier(self.table),
+                       where_clause,
+                       SQL(',').join(order_by),
+                       Literal(startindex),
+                       limit_clause)
+
+            LOGGER.debug('SQL Query: {}'.format(sql_query.as_string(db.conn)))
+            try:
+                cursor.execute(sql_query)
+                for row in cursor:
+                    yield self.__response_feature(row)
+            except psycopg2.Error as err:
+                LOGGER.error('Error executing sql_query: {}'.format(
+                    sql_query.as_string(db.conn)))
+                LOGGER.error(err)
+                raise ProviderQueryError()
+            finally:
+                cursor.close()
+
     def get_previous(self, cursor, identifier):
         """
         Query previous ID given current ID
@@ -27,18 +27,200 @@
 #
 # =================================================================
 
-import io
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import functools
 import logging
+import math
+import os
+import tempfile
+import threading
 
+from affine import Affine
+import numpy as np
 import rasterio
+from rasterio.crs import CRS
+from rasterio.enums import Resampling
+from rasterio.errors import CRSError, WindowError
 from rasterio.io import MemoryFile
-import rasterio.mask
+from rasterio.vrt import WarpedVRT
+from rasterio.warp import calculate_default_transform, transform_bounds
+from rasterio.windows import Window, from_bounds
 
 from pygeoapi.provider.base import (BaseProvider, ProviderConnectionError,
+                                    ProviderInvalidQueryError,
                                     ProviderQueryError)
+from pygeoapi.util import read_file_chunks
 
 LOGGER = logging.getLogger(__name__)
 
+# upper bound of cells per band of upsampled (scaled) outputs
+MAX_SCALED_CELLS = 100000000
+
+COG_MIMETYPE = 'image/tiff; application=geotiff; profile=cloud-optimized'
+
+# default COG creation options (https://gdal.org/drivers/raster/cog.html)
+COG_OPTIONS = {
+    'BLOCKSIZE': 512,
+    'COMPRESS': 'DEFLATE',
+    'OVERVIEWS': 'AUTO'
+}
+
+# subsets of at least this number of cells are read by multiple threads
+PARALLEL_READ_MIN_CELLS = 1024 * 1024
+MAX_READ_THREADS = min(4, os.cpu_count() or 1)
+
+# memory limit (MB) of reprojecting (warping) coverages
+WARP_MEM_LIMIT = 256
+
+# outputs up to this size (bytes) are written in memory, larger ones
+# to a temporary file
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# default GDAL block cache budget (MB) shared by all open datasets
+GDAL_CACHEMAX = 512
+
+# upper bound of datasets in use (leased from the pool) at once
+MAX_LEASED_DATASETS = 64
+
+
+class DatasetPool:
+    """
+    Pool of open rasterio datasets, keyed by path.
+
+    Providers are created per request, so datasets are kept open
+    between requests to avoid re-parsing file headers and to keep
+    the GDAL block cache warm. A dataset is used by one provider
+    (thread) at a time, and the number of datasets in use is bounded.
+    """
+
+    def __init__(self, max_idle=4, max_leased=MAX_LEASED_DATASETS):
+        """
+        Initialize object
+
+        :param max_idle: maximum number of idle datasets kept per path
+        :param max_leased: maximum number of datasets in use at once
+
+        :returns: pygeoapi.provider.rasterio_.DatasetPool
+        """
+
+        self.max_idle = max_idle
+        self.max_leased = max_leased
+        self._idle = {}
+        self._leased = {}
+        self._opening = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+    def acquire(self, path, blocking=True):
+        """
+        Get an open dataset for exclusive use. Waits for a dataset
+        to be released when `max_leased` datasets are in use.
+
+        :param path: path or URL of dataset
+        :param blocking: whether to wait for a dataset to be released
+
+        :returns: rasterio dataset, or `None` if `blocking` is `False`
+                  and all datasets are in use
+        """
+
+        mtime = _get_mtime(path)
+        with self._available:
+            while len(self._leased) + self._opening >= self.max_leased:
+                if not blocking:
+                    return None
+                self._available.wait()
+
+            idle = self._idle.get(path, [])
+            while idle:
+                dataset, dataset_mtime = idle.pop()
+                if dataset_mtime == mtime and not dataset.closed:
+                    self._leased[id(dataset)] = mtime
+                    return dataset
+                dataset.close()
+
+            self._opening += 1
+
+        dataset = None
+        try:
+            LOGGER.debug('Opening dataset {}'.format(path))
+            dataset = rasterio.open(path)
+        finally:
+            with self._available:
+                self._opening -= 1
+                if dataset is not None:
+                    self._leased[id(dataset)] = mtime
+                else:
+                    self._available.notify()
+
+        return dataset
+
+    def release(self, path, dataset):
+        """
+        Return a dataset to the pool
+
+        :param path: path or URL of dataset
+        :param dataset: rasterio dataset from acquire()
+
+        :returns: `None`
+        """
+
+        with self._available:
+            mtime = self._leased.pop(id(dataset), None)
+            self._available.notify()
+            idle = self._idle.setdefault(path, [])
+            if len(idle) < self.max_idle and not dataset.closed:
+                idle.append((dataset, mtime))
+                return
+
+        dataset.close()
+
+    @contextmanager
+    def lease(self, path):
+        """
+        Context manager to use a dataset, returned to the pool on exit
+
+        :param path: path or URL of dataset
+
+        :returns: rasterio dataset
+        """
+
+        dataset = self.acquire(path)
+        try:
+            yield dataset
+        finally:
+            self.release(path, dataset)
+
+
+DATASETS = DatasetPool(max_idle=MAX_READ_THREADS + 1)
+
+
+def _with_dataset(func):
+    """
+    Decorator to lease the dataset of a provider from the pool for
+    the duration of a method call, in a GDAL environment with the
+    block cache budget of the provider
+
+    :param func: provider method using `self._data`
+
+    :returns: decorated method
+    """
+
+    @functools.wraps(func)
+    def inner(self, *args, **kwargs):
+        if self._data is not None:  # nested call
+            return func(self, *args, **kwargs)
+
+        with rasterio.Env(**self.gdal_options), \
+                DATASETS.lease(self.data) as dataset:
+            self._data = dataset
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._data = None
+
+    return inner
+
 
 class RasterioProvider(BaseProvider):
     """Rasterio Provider"""
@@ -52,14 +234,27 @@ class RasterioProvider(BaseProvider):
 
         BaseProvider.__init__(self, provider_def)
 
+        # the dataset is only leased from the pool during calls
+        self._data = None
+        self._read_lock = threading.Lock()
+        self.gdal_options = {
+            'GDAL_CACHEMAX': provider_def.get(
+                'gdal_cachemax',
+                os.environ.get('GDAL_CACHEMAX', GDAL_CACHEMAX))
+        }
+
         try:
-            self._data = rasterio.open(self.data)
             self._coverage_properties = self._get_coverage_properties()
             self.axes = self._coverage_properties['axes']
             self.crs = self._coverage_properties['bbox_crs']
             self.num_bands = self._coverage_properties['num_bands']
             self.fields = [str(num) for num in range(1, self.num_bands+1)]
             self.native_format = provider_def['format']['name']
+            self.resampling = Resampling[
+                provider_def.get('resampling', 'nearest')]
+            self.output_formats = {'COG': COG_MIMETYPE}
+            self.cog_options = COG_OPTIONS.copy()
+            self.cog_options.update(provider_def.get('cog_options', {}))
         except Exception as err:
             LOGGER.warning(err)
             raise ProviderConnectionError(err)
@@ -118,6 +313,7 @@ class RasterioProvider(BaseProvider):
 
         return domainset
 
+    @_with_dataset
     def get_coverage_rangetype(self):
         """
         Provide coverage rangetype
@@ -159,26 +355,49 @@ class RasterioProvider(BaseProvider):
 
         return rangetype
 
-    def query(self, range_subset=[], subsets={}, format_='json'):
+    @_with_dataset
+    def query(self, range_subset=[], subsets={}, scale_size={},
+              scale_factor=None, scale_axes={}, subset_crs=None, crs=None,
+              coords=[], resample=None, aggregation=None, format_='json'):
         """
         Extract data from collection collection
         :param range_subset: list of bands
         :param subsets: dict of subset names with lists of ranges
+        :param scale_size: dict of axis names with number of cells
+        :param scale_factor: factor to divide the number of cells by
+        :param scale_axes: dict of axis names with scale factors
+        :param subset_crs: CRS of the spatial subset (default native CRS)
+        :param crs: CRS of the output (default native CRS)
+        :param coords: list of [x, y] positions (not supported)
+        :param resample: temporal resampling period (not supported)
+        :param aggregation: aggregation of resampling (not supported)
         :returns: coverage data as dict of CoverageJSON or native format
         """
 
+        if coords:
+            msg = 'Position queries are not supported by this provider'
+            LOGGER.warning(msg)
+            raise ProviderInvalidQueryError(msg)
+
+        if resample is not None or aggregation is not None:
+            msg = 'Aggregation is not supported by this provider'
+            LOGGER.warning(msg)
+            raise ProviderInvalidQueryError(msg)
+
         bands = range_subset
         LOGGER.debug('Bands: {}, subsets: {}'.format(bands, subsets))
 
         args = {
             'indexes': None
         }
-        shapes = []
+        bbox = []
+
+        scaling = scale_size or scale_factor or scale_axes
 
-        if not bands and not subsets and format_ != 'json':
+        if (not bands and not subsets and not scaling and crs is None and
+                format_ == self.native_format):
             LOGGER.debug('No parameters specified, returning native file')
-            with io.open(self.data, 'rb') as fh:
-                return fh.read()
+            return read_file_chunks(self.data)
 
         if (self._coverage_properties['x_axis_label'] in subsets and
                 self._coverage_properties['y_axis_label'] in subsets):
@@ -187,82 +406,257 @@ class RasterioProvider(BaseProvider):
             x = self._coverage_properties['x_axis_label']
             y = self._coverage_properties['y_axis_label']
 
-            shapes = [{
-               'type': 'Polygon',
-               'coordinates': [[
-                   [subsets[x][0], subsets[y][0]],
-                   [subsets[x][0], subsets[y][1]],
-                   [subsets[x][1], subsets[y][1]],
-                   [subsets[x][1], subsets[y][0]],
-                   [subsets[x][0], subsets[y][0]]
-               ]]
-            }]
+            bbox = [subsets[x][0], subsets[y][0],
+                    subsets[x][1], subsets[y][1]]
 
         if bands:
             LOGGER.debug('Selecting bands')
             args['indexes'] = list(map(int, bands))
 
-        with rasterio.open(self.data) as _data:
-            LOGGER.debug('Creating output coverage metadata')
-            out_meta = _data.meta
-
-            if self.options is not None:
-                LOGGER.debug('Adding dataset options')
-                for key, value in self.options.items():
-                    out_meta[key] = value
-
-            if shapes:  # spatial subset
-                LOGGER.debug('Clipping data with bbox')
-                out_image, out_transform = rasterio.mask.mask(
-                    _data,
-                    filled=False,
-                    shapes=shapes,
-                    crop=True,
-                    indexes=args['indexes'])
-
-                out_meta.update({"driver": self.native_format,
-                                 "height": out_image.shape[1],
-                                 "width": out_image.shape[2],
-                                 "transform": out_transform})
-            else:  # no spatial subset
-                LOGGER.debug('Creating data in memory with band selection')
-                out_image = _data.read(indexes=args['indexes'])
-
-            if shapes:
-                out_meta['bbox'] = [
-                    subsets[x][0], subsets[y][0],
-                    subsets[x][1], subsets[y][1]
-                ]
+        src_crs = self._data.crs
+        dst_crs = None
+        if crs is not None:
+            dst_crs = _parse_crs(crs)
+            if src_crs is None:
+                msg = 'Coverage without CRS cannot be reprojected'
+                LOGGER.warning(msg)
+                raise ProviderInvalidQueryError(msg)
+            if dst_crs == src_crs:
+                dst_crs = None
+
+        if bbox:
+            bbox_crs = src_crs
+            if subset_crs is not None:
+                bbox_crs = _parse_crs(subset_crs)
+
+            if bbox_crs != (dst_crs or src_crs):
+                LOGGER.debug('Transforming bbox to output CRS')
+                bbox = list(transform_bounds(
+                    bbox_crs, dst_crs or src_crs, *bbox, densify_pts=21))
+
+        dataset = self._data
+        if dst_crs is not None:
+            LOGGER.debug('Reprojecting to {}'.format(dst_crs))
+            dataset = self._get_warped_vrt(dst_crs, bbox)
+
+        try:
+            out_image, out_meta = self._read(
+                dataset, args['indexes'], bbox, scale_size, scale_factor,
+                scale_axes)
+        finally:
+            if dataset is not self._data:
+                dataset.close()
+
+        if format_ == 'json':
+            LOGGER.debug('Creating output in CoverageJSON')
+            out_meta['bands'] = args['indexes']
+            return self.gen_covjson(out_meta, out_image)
+
+        profile = {key: value for key, value in out_meta.items()
+                   if key not in ['bbox', 'units', 'crs_properties']}
+
+        if format_ == 'COG':
+            LOGGER.debug('Creating output in COG')
+            profile = {key: value for key, value in profile.items()
+                       if key not in (self.options or {})}
+            profile['driver'] = 'COG'
+            profile.update(self.cog_options)
+        else:
+            LOGGER.debug('Creating output in native format')
+
+        return _write_chunks(profile, out_image)
+
+    def _get_warped_vrt(self, dst_crs, bbox=[]):
+        """
+        Helper function to get a warped virtual dataset, limited to
+        the source window of the bbox, so that only the source blocks
+        needed for the output are read. Warping uses all CPUs.
+
+        :param dst_crs: `rasterio.crs.CRS` of output
+        :param bbox: list of minx, miny, maxx, maxy in output CRS
+
+        :returns: `rasterio.vrt.WarpedVRT`
+        """
+
+        if bbox:
+            src_bounds = transform_bounds(
+                dst_crs, self._data.crs, *bbox, densify_pts=21)
+            window = _get_window(self._data, src_bounds)
+        else:
+            window = Window(0, 0, self._data.width, self._data.height)
+
+        transform, width, height = calculate_default_transform(
+            self._data.crs, dst_crs, int(window.width), int(window.height),
+            *self._data.window_bounds(window))
+
+        return WarpedVRT(
+            self._data, crs=dst_crs, transform=transform, width=width,
+            height=height, resampling=self.resampling,
+            warp_mem_limit=WARP_MEM_LIMIT, NUM_THREADS='ALL_CPUS')
+
+    def _read(self, dataset, indexes=None, bbox=[], scale_size={},
+              scale_factor=None, scale_axes={}):
+        """
+        Helper function to read (a scaled window of) a dataset
+
+        :param dataset: rasterio dataset (or warped VRT of the dataset)
+        :param indexes: list of bands (all if `None`)
+        :param bbox: list of minx, miny, maxx, maxy in dataset coordinates
+        :param scale_size: dict of axis names with number of cells
+        :param scale_factor: factor to divide the number of cells by
+        :param scale_axes: dict of axis names with scale factors
+
+        :returns: tuple of NumPy array and `dict` of output metadata
+        """
+
+        LOGGER.debug('Creating output coverage metadata')
+        out_meta = self._data.meta
+
+        if self.options is not None:
+            LOGGER.debug('Adding dataset options')
+            for key, value in self.options.items():
+                out_meta[key] = value
+
+        scaling = scale_size or scale_factor or scale_axes
+
+        if bbox or scaling or dataset is not self._data:
+            if bbox:
+                LOGGER.debug('Reading data window of bbox')
+                window = _get_window(dataset, bbox)
+            else:
+                window = Window(0, 0, dataset.width, dataset.height)
+
+            height, width = _get_scaled_shape(
+                self._coverage_properties, int(window.height),
+                int(window.width), scale_size, scale_factor, scale_axes)
+
+            if indexes is None:
+                count = dataset.count
+            else:
+                count = len(indexes)
+
+            # GDAL reads from the best matching overview, if any,
+            # when the output shape is smaller than the window
+            LOGGER.debug('Reading {}x{} cells'.format(width, height))
+            if (dataset is self._data and
+                    count * height * width >= PARALLEL_READ_MIN_CELLS):
+                out_image = self._read_parallel(
+                    indexes or list(range(1, count + 1)), window,
+                    height, width)
             else:
-                out_meta['bbox'] = [
-                    _data.bounds.left,
-                    _data.bounds.bottom,
-                    _data.bounds.right,
-                    _data.bounds.top
-                ]
+                out_image = dataset.read(
+                    indexes=indexes, window=window, masked=True,
+                    out_shape=(count, height, width),
+                    resampling=self.resampling)
+
+            out_transform = dataset.window_transform(window) * \
+                Affine.scale(window.width / width, window.height / height)
+
+            out_meta.update({"driver": self.native_format,
+                             "crs": dataset.crs,
+                             "height": out_image.shape[1],
+                             "width": out_image.shape[2],
+                             "transform": out_transform})
+        else:  # no spatial subset
+            LOGGER.debug('Creating data in memory with band selection')
+            count = dataset.count if indexes is None else len(indexes)
+            if (count * dataset.height * dataset.width >=
+                    PARALLEL_READ_MIN_CELLS):
+                out_image = self._read_parallel(
+                    indexes or list(range(1, count + 1)),
+                    Window(0, 0, dataset.width, dataset.height),
+                    dataset.height, dataset.width)
+            else:
+                out_image = dataset.read(indexes=indexes)
 
-            out_meta['units'] = _data.units
+        if bbox:
+            out_meta['bbox'] = bbox
+        else:
+            out_meta['bbox'] = [
+                dataset.bounds.left,
+                dataset.bounds.bottom,
+                dataset.bounds.right,
+                dataset.bounds.top
+            ]
 
-            LOGGER.debug('Serializing data in memory')
-            with MemoryFile() as memfile:
-                with memfile.open(**out_meta) as dest:
-                    dest.write(out_image)
+        out_meta['units'] = self._data.units
+        out_meta['crs_properties'] = _get_crs_properties(dataset.crs)
 
-                if format_ == 'json':
-                    LOGGER.debug('Creating output in CoverageJSON')
-                    out_meta['bands'] = args['indexes']
-                    return self.gen_covjson(out_meta, out_image)
+        return out_image, out_meta
 
-                else:  # return data in native format
-                    LOGGER.debug('Returning data in native format')
-                    return memfile.read()
+    def _read_parallel(self, indexes, window, height, width):
+        """
+        Helper function to read bands (and row stripes of a band)
+        concurrently. Each thread reads with its own dataset handle,
+        into a slice of the output array, while GDAL releases the GIL.
+
+        :param indexes: list of bands
+        :param window: `rasterio.windows.Window` to read
+        :param height: number of output rows
+        :param width: number of output columns
+
+        :returns: NumPy masked array of (bands, rows, columns)
+        """
+
+        dtype = np.result_type(
+            *[self._data.dtypes[index - 1] for index in indexes])
+        shape = (len(indexes), height, width)
+        out_image = np.ma.masked_array(
+            np.empty(shape, dtype=dtype), mask=np.zeros(shape, dtype=bool))
+
+        # (output band, band, window, first row, number of rows)
+        tasks = []
+        if len(indexes) < MAX_READ_THREADS and height == window.height:
+            rows = int(math.ceil(height / MAX_READ_THREADS))
+            for i, index in enumerate(indexes):
+                for row in range(0, height, rows):
+                    num_rows = min(rows, height - row)
+                    tasks.append((i, index, Window(
+                        window.col_off, window.row_off + row,
+                        window.width, num_rows), row, num_rows))
+        else:
+            tasks = [(i, index, window, 0, height)
+                     for i, index in enumerate(indexes)]
+
+        def read(task):
+            i, index, task_window, row, num_rows = task
+            # without a free dataset in the pool, share the dataset
+            # of the provider (idle while waiting for the tasks)
+            dataset = DATASETS.acquire(self.data, blocking=False)
+            lock = None
+            if dataset is None:
+                dataset, lock = self._data, self._read_lock
+                lock.acquire()
+            try:
+                with rasterio.Env(**self.gdal_options):
+                    dataset.read(
+                        index, window=task_window,
+                        out=out_image.data[i, row:row + num_rows],
+                        resampling=self.resampling)
+                    masks = dataset.read_masks(
+                        index, window=task_window,
+                        out_shape=(num_rows, width),
+                        resampling=self.resampling)
+                out_image.mask[i, row:row + num_rows] = masks == 0
+            finally:
+                if lock is not None:
+                    lock.release()
+                else:
+                    DATASETS.release(self.data, dataset)
+
+        LOGGER.debug('Reading {} tasks in parallel'.format(len(tasks)))
+        with ThreadPoolExecutor(max_workers=MAX_READ_THREADS) as executor:
+            list(executor.map(read, tasks))
+
+        return out_image
 
     def gen_covjson(self, metadata, data):
         """
         Generate coverage as CoverageJSON representation
         :param metadata: coverage metadata
-        :param data: rasterio DatasetReader object
-        :returns: dict of CoverageJSON representation
+        :param data: NumPy (masked) array of coverage values
+        :returns: dict of CoverageJSON representation, with range
+                  values as NumPy arrays
         """
 
         LOGGER.debug('Creating CoverageJSON domain')
@@ -288,8 +682,8 @@ class RasterioProvider(BaseProvider):
                 'referencing': [{
                     'coordinates': ['x', 'y'],
                     'system': {
-                        'type': self._coverage_properties['crs_type'],
-                        'id': self._coverage_properties['bbox_crs']
+                        'type': metadata['crs_properties']['crs_type'],
+                        'id': metadata['crs_properties']['bbox_crs']
                     }
                 }]
             },
@@ -303,7 +697,12 @@ class RasterioProvider(BaseProvider):
             bands_select = metadata['bands']
 
         LOGGER.debug('bands selected: {}'.format(bands_select))
-        for bs in bands_select:
+        if data.dtype.kind in ['i', 'u']:
+            data_type = 'integer'
+        else:
+            data_type = 'float'
+
+        for i, bs in enumerate(bands_select):
             pm = _get_parameter_metadata(
                 self._data.profile['driver'], self._data.tags(bs))
 
@@ -321,25 +720,29 @@ class RasterioProvider(BaseProvider):
                 }
             }
 
-            cj['parameters'][pm['id']] = parameter
+            # parameters are keyed by name, or band number if unnamed
+            # or not unique (e.g. same GRIB element at other levels)
+            key = pm['id'] or str(bs)
+            if key in cj['parameters']:
+                key = '{}_{}'.format(key, bs)
 
-        try:
-            for key in cj['parameters'].keys():
+            cj['parameters'][key] = parameter
+
+            try:
                 cj['ranges'][key] = {
                     'type': 'NdArray',
-                    # 'dataType': metadata.dtypes[0],
-                    'dataType': 'float',
+                    'dataType': data_type,
                     'axisNames': ['y', 'x'],
                     'shape': [metadata['height'], metadata['width']],
+                    'values': data[i]  # view of band, no copy
                 }
-                # TODO: deal with multi-band value output
-                cj['ranges'][key]['values'] = data.flatten().tolist()
-        except IndexError as err:
-            LOGGER.warning(err)
-            raise ProviderQueryError('Invalid query parameter')
+            except IndexError as err:
+                LOGGER.warning(err)
+                raise ProviderQueryError('Invalid query parameter')
 
         return cj
 
+    @_with_dataset
     def _get_coverage_properties(self):
         """
         Helper function to normalize coverage properties
@@ -353,11 +756,6 @@ class RasterioProvider(BaseProvider):
                 self._data.bounds.right,
                 self._data.bounds.top
             ],
-            'bbox_crs': 'http://www.opengis.net/def/crs/OGC/1.3/CRS84',
-            'crs_type': 'GeographicCRS',
-            'bbox_units': 'deg',
-            'x_axis_label': 'Long',
-            'y_axis_label': 'Lat',
             'width': self._data.width,
             'height': self._data.height,
             'resx': self._data.res[0],
@@ -366,16 +764,7 @@ class RasterioProvider(BaseProvider):
             'tags': self._data.tags()
         }
 
-        if self._data.crs is not None:
-            if self._data.crs.is_projected:
-                properties['bbox_crs'] = '{}/{}'.format(
-                    'http://www.opengis.net/def/crs/OGC/1.3/',
-                    self._data.crs.to_epsg())
-
-                properties['x_axis_label'] = 'x'
-                properties['y_axis_label'] = 'y'
-                properties['bbox_units'] = self._data.crs.linear_units
-                properties['crs_type'] = 'ProjectedCRS'
+        properties.update(_get_crs_properties(self._data.crs))
 
         properties['axes'] = [
             properties['x_axis_label'], properties['y_axis_label']
@@ -384,6 +773,202 @@ class RasterioProvider(BaseProvider):
         return properties
 
 
+def _parse_crs(value):
+    """
+    Helper function to parse a CRS parameter
+
+    :param value: CRS as URI (http://www.opengis.net/def/crs/...)
+                  or authority code (EPSG:4326)
+
+    :returns: `rasterio.crs.CRS`
+    """
+
+    try:
+        return CRS.from_user_input(value)
+    except CRSError as err:
+        msg = 'Invalid CRS {}: {}'.format(value, err)
+        LOGGER.warning(msg)
+        raise ProviderInvalidQueryError(msg)
+
+
+def _get_crs_properties(crs):
+    """
+    Helper function to derive CoverageJSON/CIS properties of a CRS
+
+    :param crs: `rasterio.crs.CRS` (or `None`)
+
+    :returns: `dict` of CRS URI, type, units and axis labels
+    """
+
+    properties = {
+        'bbox_crs': 'http://www.opengis.net/def/crs/OGC/1.3/CRS84',
+        'crs_type': 'GeographicCRS',
+        'bbox_units': 'deg',
+        'x_axis_label': 'Long',
+        'y_axis_label': 'Lat'
+    }
+
+    if crs is None:
+        return properties
+
+    epsg = crs.to_epsg()
+    if epsg is not None:
+        crs_uri = 'http://www.opengis.net/def/crs/EPSG/0/{}'.format(epsg)
+    else:
+        crs_uri = crs.to_string()
+
+    if crs.is_projected:
+        properties['bbox_crs'] = crs_uri
+        properties['x_axis_label'] = 'x'
+        properties['y_axis_label'] = 'y'
+        properties['bbox_units'] = crs.linear_units
+        properties['crs_type'] = 'ProjectedCRS'
+    elif epsg not in [None, 4326]:
+        # geographic, but not WGS84 (CRS84)
+        properties['bbox_crs'] = crs_uri
+
+    return properties
+
+
+def _write_chunks(profile, data):
+    """
+    Helper function to write a coverage subset and stream it back.
+    Small outputs are written in memory, larger ones to a temporary
+    file, so that the output is never held in memory twice.
+
+    :param profile: `dict` of rasterio dataset profile (incl. driver)
+    :param data: NumPy (masked) array of coverage values
+
+    :returns: generator of `bytes` chunks
+    """
+
+    if data.nbytes <= SPOOL_MAX_SIZE:
+        memfile = MemoryFile()
+        try:
+            with memfile.open(**profile) as dest:
+                dest.write(data)
+        except Exception:
+            memfile.close()
+            raise
+
+        return _read_memfile_chunks(memfile)
+
+    fd, filename = tempfile.mkstemp(prefix='pygeoapi-')
+    os.close(fd)
+    try:
+        with rasterio.open(filename, 'w', **profile) as dest:
+            dest.write(data)
+    except Exception:
+        os.remove(filename)
+        raise
+
+    return read_file_chunks(filename, remove=True)
+
+
+def _read_memfile_chunks(memfile, chunk_size=65536):
+    """
+    Helper function to stream and close an in-memory file
+
+    :param memfile: `rasterio.io.MemoryFile`
+    :param chunk_size: `int` of bytes per chunk
+
+    :returns: generator of `bytes` chunks
+    """
+
+    try:
+        memfile.seek(0)
+        for chunk in iter(lambda: memfile.read(chunk_size), b''):
+            yield chunk
+    finally:
+        memfile.close()
+
+
+def _get_mtime(path):
+    """
+    Helper function to get the modification time of a local file
+
+    :param path: path or URL of dataset
+
+    :returns: `float` of modification time or `None` if not a local file
+    """
+
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+
+def _get_window(dataset, bbox):
+    """
+    Helper function to derive the pixel window covering a bbox.
+    The window is aligned to whole pixels, like a crop of the bbox,
+    and limited to the dataset, so that only the blocks intersecting
+    the bbox are read.
+
+    :param dataset: rasterio dataset
+    :param bbox: list of minx, miny, maxx, maxy in dataset coordinates
+
+    :returns: `rasterio.windows.Window`
+    """
+
+    window = from_bounds(*bbox, transform=dataset.transform)
+
+    # tolerance for floating point noise of the inverse transform
+    eps = 1e-9
+    col_off = math.floor(window.col_off + eps)
+    row_off = math.floor(window.row_off + eps)
+    col_end = math.ceil(window.col_off + window.width - eps)
+    row_end = math.ceil(window.row_off + window.height - eps)
+
+    try:
+        return Window(col_off, row_off,
+                      col_end - col_off, row_end - row_off).intersection(
+            Window(0, 0, dataset.width, dataset.height))
+    except WindowError:
+        msg = 'Subset does not intersect coverage'
+        LOGGER.warning(msg)
+        raise ProviderInvalidQueryError(msg)
+
+
+def _get_scaled_shape(coverage_properties, height, width, scale_size={},
+                      scale_factor=None, scale_axes={}):
+    """
+    Helper function to derive the output shape of a scaled read
+
+    :param coverage_properties: `dict` of coverage properties
+    :param height: number of rows to scale
+    :param width: number of columns to scale
+    :param scale_size: dict of axis names with number of cells
+    :param scale_factor: factor to divide the number of cells by
+    :param scale_axes: dict of axis names with scale factors
+
+    :returns: tuple of scaled height and width
+    """
+
+    x = coverage_properties['x_axis_label']
+    y = coverage_properties['y_axis_label']
+
+    if scale_factor:
+        height = height / scale_factor
+        width = width / scale_factor
+    if scale_axes:
+        height = height / scale_axes.get(y, 1)
+        width = width / scale_axes.get(x, 1)
+    if scale_size:
+        height = scale_size.get(y, height)
+        width = scale_size.get(x, width)
+
+    height = max(1, int(round(height)))
+    width = max(1, int(round(width)))
+
+    if height * width > MAX_SCALED_CELLS:
+        msg = 'Scaled coverage too large: {}x{} cells'.format(width, height)
+        LOGGER.warning(msg)
+        raise ProviderInvalidQueryError(msg)
+
+    return height, width
+
+
 def _get_parameter_metadata(driver, band):
     """
     Helper function to derive parameter name and units
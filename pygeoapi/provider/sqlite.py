@@ -35,6 +35,7 @@ import sqlite3
 import logging
 import os
 import json
+import threading
 from pygeoapi.plugin import InvalidPluginError
 from pygeoapi.provider.base import (BaseProvider, ProviderConnectionError,
                                     ProviderItemNotFoundError)
@@ -174,7 +175,11 @@ class SQLiteGPKGProvider(BaseProvider):
         """
 
         if (os.path.exists(self.data)):
-            conn = sqlite3.connect(self.data)
+            # streamed responses may read rows on other threads than
+            # the one that opened the connection (e.g. Starlette's
+            # threadpool), so access is serialized with self.lock
+            conn = sqlite3.connect(self.data, check_same_thread=False)
+            self.lock = threading.Lock()
         else:
             LOGGER.error('Path to sqlite does not exist')
             raise InvalidPluginError()
@@ -270,10 +275,9 @@ class SQLiteGPKGProvider(BaseProvider):
         """
         LOGGER.debug('Querying SQLite/GPKG')
 
-        where_clause, where_values = self.__get_where_clauses(
-            properties=properties, bbox=bbox)
-
         if resulttype == 'hits':
+            where_clause, where_values = self.__get_where_clauses(
+                properties=properties, bbox=bbox)
 
             sql_query = "SELECT COUNT(*) as hits FROM {} {} ".format(
                 self.table, where_clause)
@@ -283,29 +287,65 @@ class SQLiteGPKGProvider(BaseProvider):
             hits = res.fetchone()["hits"]
             return self.__response_feature_hits(hits)
 
-        sql_query = "SELECT DISTINCT {} from \
-            {} {} limit ? offset ?".format(
-                self.columns, self.table, where_clause)
+        feature_collection = {
+            'type': 'FeatureCollection',
+            'features': list(self.iter_features(
+                startindex=startindex, limit=limit, bbox=bbox,
+                properties=properties))
+        }
 
-        end_index = startindex + limit
+        return feature_collection
 
-        LOGGER.debug('SQL Query: {}'.format(sql_query))
-        LOGGER.debug('Start Index: {}'.format(startindex))
-        LOGGER.debug('End Index: {}'.format(end_index))
+    def iter_features(self, startindex=0, limit=10, bbox=[], datetime=None,
+                      properties=[], sortby=[]):
+        """
+        Query SQLite/GPKG, fetching rows one by one
+
+        :param startindex: starting record to return (default 0)
+        :param limit: number of records to return (default 10, `None`
+                      for all records)
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+        :param datetime: temporal (datestamp or extent)
+        :param properties: list of tuples (name, value)
+        :param sortby: list of dicts (property, order)
 
-        row_data = self.cursor.execute(
-            sql_query, where_values + (limit, startindex))
+        :returns: generator of GeoJSON features
+        """
 
-        feature_collection = {
-            'type': 'FeatureCollection',
-            'features': []
-        }
+        where_clause, where_values = self.__get_where_clauses(
+            properties=properties, bbox=bbox)
 
-        for rd in row_data:
-            feature_collection['features'].append(
-                self.__response_feature(rd))
+        # no DISTINCT (which builds the whole result before the first
+        # row), sorted and then ordered by id for deterministic paging
+        order_by = ['{} {}'.format(sort['property'],
+                                   'DESC' if sort['order'] == 'D' else 'ASC')
+                    for sort in sortby]
+        order_by.append(self.id_field)
 
-        return feature_collection
+        sql_query = "SELECT {} from \
+            {} {} ORDER BY {} limit ? offset ?".format(
+                self.columns, self.table, where_clause, ','.join(order_by))
+
+        if limit is None:
+            limit = -1  # no limit
+
+        LOGGER.debug('SQL Query: {}'.format(sql_query))
+        LOGGER.debug('Start Index: {}'.format(startindex))
+        LOGGER.debug('Limit: {}'.format(limit))
+
+        cursor = self.cursor.connection.cursor()
+        with self.lock:
+            cursor.execute(sql_query, where_values + (limit, startindex))
+
+        try:
+            while True:
+                with self.lock:
+                    rd = cursor.fetchone()
+                if rd is None:
+                    break
+                yield self.__response_feature(rd)
+        finally:
+            cursor.close()
 
     def get(self, identifier):
         """
@@ -27,18 +27,48 @@
 #
 # =================================================================
 
+from datetime import datetime, timezone
+import glob
 import logging
+import os
+import re
 import tempfile
+import threading
 
 import xarray
 import numpy as np
 
 from pygeoapi.provider.base import (BaseProvider,
                                     ProviderConnectionError,
+                                    ProviderInvalidQueryError,
                                     ProviderQueryError)
+from pygeoapi.util import read_file_chunks
+
+try:
+    import dask
+except ImportError:
+    dask = None
+
+try:
+    import zarr
+except ImportError:
+    zarr = None
 
 LOGGER = logging.getLogger(__name__)
 
+NETCDF_MIMETYPE = 'application/x-netcdf'
+ZARR_MIMETYPE = 'application/zip'
+
+# pandas frequencies of ISO 8601 duration components (Y, M, W, D, H, M, S)
+RESAMPLE_UNITS = ['AS', 'MS', 'W', 'D', 'H', 'T', 'S']
+
+#: (average) seconds of the pandas frequency units of temporal resampling
+RESAMPLE_SECONDS = [31557600, 2629800, 604800, 86400, 3600, 60, 1]
+
+# time values of multi-file datasets, per file: {path: (mtime, values)}
+TIME_INDEX = {}
+TIME_INDEX_LOCK = threading.Lock()
+
 
 class XarrayProvider(BaseProvider):
     """Xarray Provider"""
@@ -52,8 +82,42 @@ class XarrayProvider(BaseProvider):
 
         BaseProvider.__init__(self, provider_def)
 
+        # selection method of position queries (nearest or linear)
+        self.interpolation = provider_def.get('interpolation', 'nearest')
+
+        # chunk sizes (dict of dimension sizes or 'auto') for lazy
+        # opening with Dask; Zarr stores are always opened lazily
+        self.chunks = provider_def.get('chunks')
+
+        # NetCDF output compression (complevel, chunksizes)
+        self.netcdf_options = provider_def.get('netcdf_options', {})
+
+        self.output_formats = {'netcdf': NETCDF_MIMETYPE}
+        if zarr is not None:
+            self.output_formats['zarr'] = ZARR_MIMETYPE
+
+        # files of multi-file datasets (glob or list), None otherwise
+        self._files = _get_files(self.data)
+        self._time_index = []
+
         try:
-            self._data = xarray.open_dataset(self.data)
+            if self._files is not None:
+                LOGGER.debug('Indexing {} files'.format(len(self._files)))
+                self._time_index = _get_time_index(self._files)
+                self._files = [path for path, values in self._time_index]
+                # the first file provides variables and spatial axes
+                self._data = self._open_files(self._files[:1])
+            elif _is_zarr(self.data):
+                LOGGER.debug('Opening Zarr store {}'.format(self.data))
+                self._data = xarray.open_zarr(
+                    self.data, chunks=self.chunks or 'auto')
+            elif self.chunks is not None:
+                LOGGER.debug('Opening {} lazily with chunks {}'.format(
+                    self.data, self.chunks))
+                self._data = xarray.open_dataset(
+                    self.data, chunks=self.chunks)
+            else:
+                self._data = xarray.open_dataset(self.data)
             self._coverage_properties = self._get_coverage_properties()
 
             self.axes = [self._coverage_properties['x_axis_label'],
@@ -171,40 +235,92 @@ class XarrayProvider(BaseProvider):
 
         return rangetype
 
-    def query(self, range_subset=[], subsets={}, format_='json'):
+    def query(self, range_subset=[], subsets={}, scale_size={},
+              scale_factor=None, scale_axes={}, subset_crs=None, crs=None,
+              coords=[], resample=None, aggregation=None, format_='json'):
         """
          Extract data from collection collection
 
         :param range_subset: list of data variables to return (all if blank)
         :param subsets: dict of subset names with lists of ranges
+        :param scale_size: dict of axis names with number of cells
+        :param scale_factor: factor to divide the number of cells by
+        :param scale_axes: dict of axis names with scale factors
+        :param subset_crs: CRS of the spatial subset (not supported)
+        :param crs: CRS of the output (not supported)
+        :param coords: list of [x, y] positions to extract time series at
+        :param resample: ISO 8601 duration of temporal resampling periods
+        :param aggregation: aggregation of resampled and coarsened cells
+                            (mean, min, max or sum; default mean)
         :param format_: data format of output
 
-        :returns: coverage data as dict of CoverageJSON or native format
+        :returns: coverage data as dict of CoverageJSON, or generator of
+                  `bytes` chunks of NetCDF or zipped Zarr
         """
 
+        if subset_crs is not None or crs is not None:
+            msg = 'Reprojection is not supported by this provider'
+            LOGGER.warning(msg)
+            raise ProviderInvalidQueryError(msg)
+
         if len(range_subset) < 1:
             range_subset = self.fields
 
-        data = self._data[[*range_subset]]
-
+        query_params = {}
         if(self._coverage_properties['x_axis_label'] in subsets or
            self._coverage_properties['y_axis_label'] in subsets or
            self._coverage_properties['time_axis_label'] in subsets):
 
             LOGGER.debug('Creating spatio-temporal subset')
 
-            query_params = {}
             for key, val in subsets.items():
                 query_params[key] = slice(val[0], val[1])
 
-            data = data.sel(query_params)
+        if self._files is not None:
+            files = self._get_files_in_range(subsets.get(self.time_var))
+            LOGGER.debug('Opening {} of {} files'.format(
+                len(files), len(self._files)))
+            data = self._open_files(files, range_subset, query_params)
+        else:
+            data = self._select(self._data, range_subset, query_params)
+
+        aggregation = aggregation or 'mean'
+
+        factors = self._get_coarsen_factors(
+            data, scale_size, scale_factor, scale_axes)
+        if factors:
+            LOGGER.debug('Coarsening by {}'.format(factors))
+            data = getattr(data.coarsen(factors, boundary='trim'),
+                           aggregation)(keep_attrs=True)
+
+        if resample is not None:
+            LOGGER.debug('Resampling to {}'.format(resample))
+            frequency = _get_resample_frequency(resample)
+            # periods shorter than the time step would upsample the data
+            times = data[self.time_var].values
+            if _count_resample_periods(times, frequency) > times.size:
+                msg = 'resample period {} is shorter than the time ' \
+                      'step of the data'.format(resample)
+                LOGGER.warning(msg)
+                raise ProviderInvalidQueryError(msg)
+            data = getattr(data.resample({self.time_var: frequency}),
+                           aggregation)(keep_attrs=True)
+
+        if coords:
+            LOGGER.debug('Selecting {} positions'.format(len(coords)))
+            data = self._select_points(data, coords)
+            if format_ == 'json':
+                return self.gen_covjson_points(data, range_subset)
+
+            return self._write_native(data, format_)
 
         out_meta = {'bbox': [
             data.coords[self.lon_var].values[0],
             data.coords[self.lat_var].values[0],
             data.coords[self.lon_var].values[-1],
             data.coords[self.lat_var].values[-1]],
-            "time": self._coverage_properties['time_range'],
+            "time": [np.datetime_as_string(value) for value in
+                     data.coords[self.time_var].values[[0, -1]]],
             "driver": "Xarray",
             "height": data.dims[self.lat_var],
             "width": data.dims[self.lon_var],
@@ -213,27 +329,219 @@ class XarrayProvider(BaseProvider):
                           for var_name, var in data.variables.items()}
         }
 
-        LOGGER.debug('Serializing data in memory')
         if format_ == 'json':
             LOGGER.debug('Creating output in CoverageJSON')
             return self.gen_covjson(out_meta, data, range_subset)
 
-        else:  # return data in native format
-            with tempfile.TemporaryFile() as fp:
-                LOGGER.debug('Returning data in native format')
-                fp.write(data.to_netcdf())
-                fp.seek(0)
-                return fp.read()
+        return self._write_native(data, format_)
+
+    def get_data_version(self):
+        """
+        Get the version of the data (the latest modification time of
+        the files of multi-file datasets)
+
+        :returns: `datetime` of last modification or `None` if unknown
+        """
+
+        if self._files is None:
+            return BaseProvider.get_data_version(self)
+
+        try:
+            mtime = max(os.path.getmtime(path) for path in self._files)
+        except (OSError, ValueError) as err:
+            LOGGER.warning('Cannot get data version: {}'.format(err))
+            return None
+
+        return datetime.fromtimestamp(mtime, timezone.utc)
+
+    def _write_native(self, data, format_):
+        """
+        Helper function to write data to a temporary file and stream it
+
+        :param data: xarray Dataset object
+        :param format_: data format of output (NetCDF or Zarr)
+
+        :returns: generator of `bytes` chunks
+        """
+
+        fd, filename = tempfile.mkstemp(prefix='pygeoapi-')
+        os.close(fd)
+        try:
+            if format_.lower() == 'zarr':
+                LOGGER.debug('Writing data as zipped Zarr')
+                self._write_zarr(data, filename)
+            else:
+                LOGGER.debug('Writing data as NetCDF')
+                data.to_netcdf(filename,
+                               encoding=self._get_netcdf_encoding(data))
+        except Exception as err:
+            os.remove(filename)
+            LOGGER.error(err)
+            raise ProviderQueryError(err)
+
+        return read_file_chunks(filename, remove=True)
+
+    def _open_files(self, files, variables=None, selection={}):
+        """
+        Helper function to open files of a multi-file dataset as one
+        dataset along the time axis. Without Dask, the selection is
+        read from each file into memory and the files are closed.
+
+        :param files: `list` of file paths
+        :param variables: `list` of data variables (all if `None`)
+        :param selection: `dict` of dimension names with values or
+                          slices to select
+
+        :returns: xarray Dataset object
+        """
+
+        if len(files) == 1:
+            data = xarray.open_dataset(files[0], chunks=self.chunks)
+        elif dask is None:
+            LOGGER.debug('Dask not available; reading selection of files')
+            parts = []
+            for file_ in files:
+                with xarray.open_dataset(file_) as data:
+                    parts.append(
+                        self._select(data, variables, selection).load())
+            return xarray.concat(parts, dim=self.time_var)
+        else:
+            data = xarray.open_mfdataset(files, chunks=self.chunks or {},
+                                         combine='by_coords')
+
+        return self._select(data, variables, selection)
+
+    @staticmethod
+    def _select(data, variables=None, selection={}):
+        """
+        Helper function to select data variables and a subset of
+        a dataset
+
+        :param data: xarray Dataset object
+        :param variables: `list` of data variables (all if `None`)
+        :param selection: `dict` of dimension names with values or
+                          slices to select
+
+        :returns: xarray Dataset object
+        """
+
+        if variables is not None:
+            data = data[[*variables]]
+        if selection:
+            data = data.sel(selection)
+
+        return data
+
+    def _get_files_in_range(self, time_range=None):
+        """
+        Helper function to find the files of a multi-file dataset
+        intersecting a time range
+
+        :param time_range: `list` of start and end time (all if blank)
+
+        :returns: `list` of file paths
+        """
+
+        if not time_range:
+            return self._files
+
+        try:
+            start, end = [np.datetime64(value) for value in time_range]
+        except (TypeError, ValueError) as err:
+            msg = 'Invalid time subset: {}'.format(err)
+            LOGGER.warning(msg)
+            raise ProviderInvalidQueryError(msg)
+
+        files = [path for path, values in self._time_index
+                 if values.min() <= end and values.max() >= start]
+
+        if not files:
+            msg = 'No data in time range {}/{}'.format(*time_range)
+            LOGGER.warning(msg)
+            raise ProviderInvalidQueryError(msg)
+
+        return files
+
+    def _get_time_values(self, time_var):
+        """
+        Helper function to get the values of the time axis, from the
+        time index of multi-file datasets
+
+        :param time_var: name of time coordinate
+
+        :returns: NumPy array of time values
+        """
+
+        if self._files is not None:
+            return np.concatenate(
+                [values for path, values in self._time_index])
+
+        return self._data.coords[time_var].values
+
+    def _get_netcdf_encoding(self, data):
+        """
+        Helper function to derive the NetCDF encoding of each variable
+        from the netcdf_options of the provider
+
+        :param data: xarray Dataset object
+
+        :returns: `dict` of encoding per variable name
+        """
+
+        complevel = self.netcdf_options.get('complevel')
+        chunksizes = self.netcdf_options.get('chunksizes', {})
+
+        encoding = {}
+        for name, variable in data.data_vars.items():
+            encoding[name] = {}
+            if complevel:
+                encoding[name]['zlib'] = True
+                encoding[name]['complevel'] = int(complevel)
+            if chunksizes:
+                encoding[name]['chunksizes'] = tuple(
+                    min(int(chunksizes.get(dim, size)), size)
+                    for dim, size in zip(variable.dims, variable.shape))
+
+        return encoding
+
+    @staticmethod
+    def _write_zarr(data, filename):
+        """
+        Helper function to write a dataset as a zipped Zarr store
+
+        :param data: xarray Dataset object
+        :param filename: filename of the zip file
+
+        :returns: `None`
+        """
+
+        if zarr is None:
+            raise ProviderQueryError('Zarr output requires zarr')
+
+        # drop the encoding of the source (e.g. NetCDF compression)
+        data = data.copy()
+        for variable in data.variables.values():
+            variable.encoding = {}
+
+        # zarr.storage.ZipStore exists in zarr 2 and 3 (unlike the
+        # top-level alias, removed in zarr 3)
+        store = zarr.storage.ZipStore(filename, mode='w')
+        try:
+            data.to_zarr(store, mode='w')
+        finally:
+            store.close()
 
     def gen_covjson(self, metadata, data, range_type):
         """
         Generate coverage as CoverageJSON representation
 
         :param metadata: coverage metadata
-        :param data: rasterio DatasetReader object
+        :param data: xarray Dataset object
         :param range_type: range type list
 
-        :returns: dict of CoverageJSON representation
+        :returns: dict of CoverageJSON representation, with range
+                  values as NumPy arrays (or Dask arrays when opened
+                  lazily, computed block by block at serialization)
         """
 
         LOGGER.debug('Creating CoverageJSON domain')
@@ -278,21 +586,7 @@ class XarrayProvider(BaseProvider):
             pm = self._get_parameter_metadata(
                 variable, self._data[variable].attrs)
 
-            parameter = {
-                'type': 'Parameter',
-                'description': pm['description'],
-                'unit': {
-                    'symbol': pm['unit_label']
-                },
-                'observedProperty': {
-                    'id': pm['observed_property_id'],
-                    'label': {
-                        'en': pm['observed_property_name']
-                    }
-                }
-            }
-
-            cj['parameters'][pm['id']] = parameter
+            cj['parameters'][pm['id']] = self._gen_parameter(pm)
 
         try:
             for key in cj['parameters'].keys():
@@ -308,13 +602,185 @@ class XarrayProvider(BaseProvider):
                               metadata['time_steps']]
                 }
 
-                cj['ranges'][key]['values'] = data[key].values.tolist()
+                cj['ranges'][key]['values'] = data[key].data
         except IndexError as err:
             LOGGER.warning(err)
             raise ProviderQueryError('Invalid query parameter')
 
         return cj
 
+    def gen_covjson_points(self, data, range_type):
+        """
+        Generate time series at positions as CoverageJSON PointSeries
+        (one position) or MultiPointSeries representation
+
+        :param data: xarray Dataset object with a point dimension
+        :param range_type: range type list
+
+        :returns: dict of CoverageJSON representation, with range
+                  values as NumPy (or Dask) arrays
+        """
+
+        LOGGER.debug('Creating CoverageJSON point series domain')
+        times = [np.datetime_as_string(value) for value in
+                 data.coords[self.time_var].values]
+        xs = data.coords[self.lon_var].values.tolist()
+        ys = data.coords[self.lat_var].values.tolist()
+
+        if len(xs) == 1:
+            domain_type = 'PointSeries'
+            axes = {
+                'x': {'values': xs},
+                'y': {'values': ys},
+                't': {'values': times}
+            }
+            axis_names = ['t']
+            shape = [len(times)]
+        else:
+            domain_type = 'MultiPointSeries'
+            axes = {
+                't': {'values': times},
+                'composite': {
+                    'dataType': 'tuple',
+                    'coordinates': ['x', 'y'],
+                    'values': [[x, y] for x, y in zip(xs, ys)]
+                }
+            }
+            axis_names = ['t', 'composite']
+            shape = [len(times), len(xs)]
+
+        cj = {
+            'type': 'Coverage',
+            'domain': {
+                'type': 'Domain',
+                'domainType': domain_type,
+                'axes': axes,
+                'referencing': [{
+                    'coordinates': ['x', 'y'],
+                    'system': {
+                        'type': self._coverage_properties['crs_type'],
+                        'id': self._coverage_properties['bbox_crs']
+                    }
+                }, {
+                    'coordinates': ['t'],
+                    'system': {
+                        'type': 'TemporalRS',
+                        'calendar': 'Gregorian'
+                    }
+                }]
+            },
+            'parameters': {},
+            'ranges': {}
+        }
+
+        for variable in range_type:
+            pm = self._get_parameter_metadata(
+                variable, self._data[variable].attrs)
+
+            cj['parameters'][pm['id']] = self._gen_parameter(pm)
+
+            values = data[variable].transpose(self.time_var, 'point')
+            if len(xs) == 1:
+                values = values.isel(point=0)
+
+            cj['ranges'][pm['id']] = {
+                'type': 'NdArray',
+                'dataType': 'integer' if values.dtype.kind in 'iu'
+                            else 'float',
+                'axisNames': axis_names,
+                'shape': shape,
+                'values': values.data
+            }
+
+        return cj
+
+    def _get_coarsen_factors(self, data, scale_size={}, scale_factor=None,
+                             scale_axes={}):
+        """
+        Helper function to derive the (integer) coarsening factor of each
+        axis from the scaling parameters
+
+        :param data: xarray Dataset object
+        :param scale_size: dict of axis names with number of cells
+        :param scale_factor: factor to divide the number of cells by
+                             (spatial axes)
+        :param scale_axes: dict of axis names with scale factors
+
+        :returns: dict of axis names with coarsening factors (> 1)
+        """
+
+        factors = {}
+        if scale_factor:
+            factors = {self.lon_var: scale_factor, self.lat_var: scale_factor}
+        elif scale_axes:
+            factors = dict(scale_axes)
+        elif scale_size:
+            factors = {axis: data.dims[axis] / float(size)
+                       for axis, size in scale_size.items()}
+
+        for axis, factor in factors.items():
+            if factor < 1:
+                msg = 'Coverages can only be scaled down'
+                LOGGER.warning(msg)
+                raise ProviderInvalidQueryError(msg)
+
+        return {axis: min(int(np.ceil(factor - 1e-9)), data.dims[axis])
+                for axis, factor in factors.items() if factor > 1}
+
+    def _select_points(self, data, coords):
+        """
+        Helper function to select the time series at all positions at
+        once, by nearest neighbour or linear interpolation
+
+        :param data: xarray Dataset object
+        :param coords: list of [x, y] positions
+
+        :returns: xarray Dataset object with a point dimension
+        """
+
+        xs, ys = np.array(coords, dtype=np.float64).T
+
+        for values, var in [(xs, self.lon_var), (ys, self.lat_var)]:
+            axis = data.coords[var].values
+            if values.min() < axis.min() or values.max() > axis.max():
+                msg = 'Position outside of coverage extent'
+                LOGGER.warning(msg)
+                raise ProviderInvalidQueryError(msg)
+
+        indexers = {
+            self.lon_var: xarray.DataArray(xs, dims='point'),
+            self.lat_var: xarray.DataArray(ys, dims='point')
+        }
+
+        if self.interpolation == 'linear':
+            return data.interp(indexers)
+
+        return data.sel(indexers, method='nearest')
+
+    @staticmethod
+    def _gen_parameter(pm):
+        """
+        Helper function to generate a CoverageJSON parameter
+
+        :param pm: dict of parameter metadata
+
+        :returns: dict of CoverageJSON parameter
+        """
+
+        return {
+            'type': 'Parameter',
+            'description': pm['description'],
+            'unit': {
+                'symbol': pm['unit_label']
+            },
+            'observedProperty': {
+                'id': pm['observed_property_id'],
+                'label': {
+                    'en': pm['observed_property_name']
+                }
+            }
+        }
+
     def _get_coverage_properties(self):
         """
         Helper function to normalize coverage properties
@@ -326,6 +792,7 @@ class XarrayProvider(BaseProvider):
         for coord in self._data.coords:
             if coord.lower() == 'time':
                 self.time_var = time_var = coord
+                self._time_values = self._get_time_values(time_var)
                 continue
             if self._data.coords[coord].attrs['units'] == 'degrees_north':
                 self.lat_var = lat_var = coord
@@ -345,8 +812,8 @@ class XarrayProvider(BaseProvider):
                 self._data.coords[lat_var].values[-1],
             ],
             'time_range': [
-                np.datetime_as_string(self._data.coords[time_var].values[0]),
-                np.datetime_as_string(self._data.coords[time_var].values[-1])
+                np.datetime_as_string(self._time_values[0]),
+                np.datetime_as_string(self._time_values[-1])
             ],
             'bbox_crs': 'http://www.opengis.net/def/crs/OGC/1.3/CRS84',
             'crs_type': 'GeographicCRS',
@@ -355,7 +822,7 @@ class XarrayProvider(BaseProvider):
             'time_axis_label': time_var,
             'width': self._data.dims[lon_var],
             'height': self._data.dims[lat_var],
-            'time': self._data.dims[time_var],
+            'time': len(self._time_values),
             'time_duration': self.get_time_coverage_duration(),
             'bbox_units': 'degrees',
             'resx': np.abs(self._data.coords[lon_var].values[1]
@@ -409,8 +876,8 @@ class XarrayProvider(BaseProvider):
         Helper function to derive time resolution
         :returns: time resolution string
         """
-        dts = np.array([(self._data.TIME[1] - self._data.TIME[0])
-                       .values.astype('timedelta64[%s]' % x) for x in
+        dts = np.array([(self._time_values[1] - self._time_values[0])
+                       .astype('timedelta64[%s]' % x) for x in
                         ['Y', 'M', 'D', 'h', 'm', 's', 'ms']])
         return str(dts[np.array([x.astype(np.int) for x in dts]) > 0][0])
 
@@ -419,8 +886,8 @@ class XarrayProvider(BaseProvider):
         Helper function to derive time coverage duration
         :returns: time coverage duration string
         """
-        ms_difference = (self._data.TIME[-1] - self._data.TIME[0])\
-            .values.astype('timedelta64[ms]').astype(np.double)
+        ms_difference = (self._time_values[-1] - self._time_values[0])\
+            .astype('timedelta64[ms]').astype(np.double)
         time_dict = {
             'days': int(ms_difference / 1000 / 60 / 60 / 24),
             'hours': int((ms_difference / 1000 / 60 / 60) % 24),
@@ -429,3 +896,120 @@ class XarrayProvider(BaseProvider):
         times = ['%d %s' % (val, key) for key, val
                  in time_dict.items() if val > 0]
         return ', '.join(times)
+
+
+def _is_zarr(path):
+    """
+    Helper function to test whether data is a Zarr store
+
+    :param path: path to data
+
+    :returns: `bool` of whether the path is a Zarr store
+    """
+
+    path = str(path).rstrip('/')
+    return (path.endswith('.zarr') or
+            os.path.isfile(os.path.join(path, '.zgroup')))
+
+
+def _get_files(data):
+    """
+    Helper function to get the files of a multi-file dataset
+
+    :param data: glob pattern or `list` of file paths
+
+    :returns: sorted `list` of file paths, or `None` if data is
+              a single file or store
+    """
+
+    if isinstance(data, (list, tuple)):
+        files = list(data)
+    elif glob.has_magic(str(data)):
+        files = sorted(glob.glob(data))
+    else:
+        return None
+
+    if not files:
+        msg = 'No files found for {}'.format(data)
+        LOGGER.error(msg)
+        raise ProviderConnectionError(msg)
+
+    return files
+
+
+def _get_time_index(files):
+    """
+    Helper function to get the time values of each file, cached
+    until the file is modified
+
+    :param files: `list` of file paths
+
+    :returns: `list` of tuples of file path and NumPy array of time
+              values, sorted by time
+    """
+
+    index = []
+    for path in files:
+        mtime = os.path.getmtime(path)
+        with TIME_INDEX_LOCK:
+            cached = TIME_INDEX.get(path)
+
+        if cached is None or cached[0] != mtime:
+            LOGGER.debug('Indexing time values of {}'.format(path))
+            with xarray.open_dataset(path) as ds:
+                time_var = next(coord for coord in ds.coords
+                                if coord.lower() == 'time')
+                cached = (mtime, ds.coords[time_var].values)
+            with TIME_INDEX_LOCK:
+                TIME_INDEX[path] = cached
+
+        index.append((path, cached[1]))
+
+    return sorted(index, key=lambda item: item[1].min())
+
+
+def _get_resample_frequency(duration):
+    """
+    Helper function to convert an ISO 8601 duration (of one
+    component, e.g. P1M or PT6H) into a pandas frequency
+
+    :param duration: `str` of ISO 8601 duration
+
+    :returns: `str` of pandas frequency
+    """
+
+    match = re.match(
+        r'^P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?'
+        r'(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$', duration)
+    if match is None or len([g for g in match.groups() if g]) != 1:
+        msg = 'resample should be an ISO 8601 duration of one ' \
+              'component (e.g. P1M): {}'.format(duration)
+        LOGGER.warning(msg)
+        raise ProviderInvalidQueryError(msg)
+
+    for value, unit in zip(match.groups(), RESAMPLE_UNITS):
+        if value:
+            return '{}{}'.format(int(value), unit)
+
+
+def _count_resample_periods(times, frequency):
+    """
+    Helper function to estimate the number of resampling periods
+    spanned by time values (without building the periods)
+
+    :param times: `numpy.ndarray` of time values
+    :param frequency: `str` of pandas frequency (see
+                      `_get_resample_frequency`)
+
+    :returns: `int` of number of periods (0 if unknown)
+    """
+
+    if times.size == 0 or times.dtype.kind != 'M':
+        return 0
+
+    value, unit = re.match(r'^(\d+)(\D+)$', frequency).groups()
+    seconds = int(value) * RESAMPLE_SECONDS[RESAMPLE_UNITS.index(unit)]
+
+    span = (times.max() - times.min()) / np.timedelta64(1, 's')
+
+    return int(span // seconds) + 1
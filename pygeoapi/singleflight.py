@@ -0,0 +1,160 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+"""Coalescing of concurrent identical calls"""
+
+import copy
+import logging
+import threading
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Runs one call per key at a time: callers arriving while a call with
+    the same key is in flight wait for it and share its result (as deep
+    copies, so that callers can modify their result).
+    """
+
+    def __init__(self):
+        """
+        Initialize object
+
+        :returns: pygeoapi.singleflight.SingleFlight
+        """
+
+        self._lock = threading.Lock()
+        self._calls = {}  # key: _Call
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Call a function, or wait for the in-flight call with the same key
+
+        :param key: hashable key identifying the call
+        :param func: function to call
+        :param args: positional arguments of function
+        :param kwargs: keyword arguments of function
+
+        :returns: result of function
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+            else:
+                call.followers += 1
+
+        if leader:
+            try:
+                call.result = func(*args, **kwargs)
+            except Exception as err:
+                call.error = err
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+            if call.error is not None:
+                raise call.error
+            if call.followers == 0:
+                return call.result
+
+            # keep the result unchanged while followers copy it
+            try:
+                return copy.deepcopy(call.result)
+            except TypeError:
+                return call.result
+
+        call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return self._share(call, func, args, kwargs)
+
+    def _share(self, call, func, args, kwargs):
+        """
+        Helper function to copy the result of a call, or to call the
+        function again if its result cannot be copied (e.g. a generator)
+
+        :param call: `_Call` object
+        :param func: function to call
+        :param args: positional arguments of function
+        :param kwargs: keyword arguments of function
+
+        :returns: result of function
+        """
+
+        try:
+            result = copy.deepcopy(call.result)
+        except TypeError as err:
+            LOGGER.debug('Result cannot be shared: {}'.format(err))
+            return func(*args, **kwargs)
+
+        with self._lock:
+            self.coalesced += 1
+
+        return result
+
+    def get_metrics(self):
+        """
+        Get call metrics
+
+        :returns: `dict` of number of calls made, number of callers
+                  which shared the result of an in-flight call and number
+                  of calls in flight
+        """
+
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls)
+            }
+
+    def __repr__(self):
+        return '<SingleFlight> calls={} coalesced={}'.format(
+            self.calls, self.coalesced)
+
+
+class _Call:
+    """in-flight call"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.error = None
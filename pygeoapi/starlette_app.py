@@ -30,6 +30,7 @@
 # =================================================================
 """ Starlette module providing the route paths to the api"""
 
+from datetime import datetime, timezone
 import os
 
 import click
@@ -37,10 +38,10 @@ import click
 from starlette.staticfiles import StaticFiles
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import FileResponse, Response, StreamingResponse
 import uvicorn
 
-from pygeoapi.api import API
+from pygeoapi.api import API, is_not_modified
 from pygeoapi.util import yaml_load
 
 app = Starlette()
@@ -204,7 +205,10 @@ async def collection_items(request: Request, collection_id=None, item_id=None):
         headers, status_code, content = api_.get_collection_item(
             request.headers, request.query_params, collection_id, item_id)
 
-    response = Response(content=content, status_code=status_code)
+    if isinstance(content, (str, bytes)):
+        response = Response(content=content, status_code=status_code)
+    else:  # streamed (chunked) content
+        response = StreamingResponse(content, status_code=status_code)
 
     if headers:
         response.headers.update(headers)
@@ -225,7 +229,10 @@ def collection_coverage(request: Request, collection_id):
     headers, status_code, content = api_.get_collection_coverage(
         request.headers, request.query_params, collection_id)
 
-    response = Response(content=content, status_code=status_code)
+    if isinstance(content, (str, bytes)):
+        response = Response(content=content, status_code=status_code)
+    else:  # streamed (native file) content
+        response = StreamingResponse(content, status_code=status_code)
 
     if headers:
         response.headers.update(headers)
@@ -342,6 +349,25 @@ async def stac_catalog_root(request: Request):
     return response
 
 
+@app.route('/stac/search')
+async def stac_search(request: Request):
+    """
+    STAC search endpoint
+
+    :returns: Starlette HTTP response
+    """
+
+    headers, status_code, content = api_.get_stac_search(
+        request.headers, request.query_params)
+
+    response = Response(content=content, status_code=status_code)
+
+    if headers:
+        response.headers.update(headers)
+
+    return response
+
+
 @app.route('/stac/{path:path}')
 async def stac_catalog_path(request: Request):
     """
@@ -357,6 +383,25 @@ async def stac_catalog_path(request: Request):
     headers, status_code, content = api_.get_stac_path(
         request.headers, request.query_params, path)
 
+    if isinstance(content, os.PathLike):  # raw file
+        # Range requests (Starlette >= 0.39), ETag and sendfile (where
+        # supported by the server); conditional requests are answered here
+        filepath = os.fspath(content)
+        stat_result = os.stat(filepath)
+        response = FileResponse(filepath, headers=dict(headers),
+                                stat_result=stat_result)
+
+        last_modified = datetime.fromtimestamp(stat_result.st_mtime,
+                                               timezone.utc)
+        if is_not_modified(request.headers, response.headers['ETag'],
+                           last_modified):
+            return Response(status_code=304, headers={
+                key: response.headers[key]
+                for key in ['ETag', 'Last-Modified']
+            })
+
+        return response
+
     response = Response(content=content, status_code=status_code)
 
     if headers:
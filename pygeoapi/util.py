@@ -30,7 +30,7 @@
 """Generic util functions used in the code"""
 
 import base64
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timezone
 from decimal import Decimal
 import logging
 import mimetypes
@@ -45,6 +45,16 @@ import simplejson as json
 from pygeoapi import __version__
 from pygeoapi.provider.base import ProviderTypeError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 TEMPLATES = '{}{}templates'.format(os.path.dirname(
@@ -145,7 +155,20 @@ def str2bool(value):
 
 def to_json(dict_, pretty=False):
     """
-    Serialize dict to json
+    Serialize dict to json (with the encoder set by `JSON_ENCODER`)
+
+    :param dict_: `dict` of JSON representation
+    :param pretty: `bool` of whether to prettify JSON (default is `False`)
+
+    :returns: JSON string representation
+    """
+
+    return JSON_ENCODERS[JSON_ENCODER](dict_, pretty)
+
+
+def _to_json_simplejson(dict_, pretty=False):
+    """
+    Serialize dict to json with simplejson
 
     :param dict_: `dict` of JSON representation
     :param pretty: `bool` of whether to prettify JSON (default is `False`)
@@ -163,6 +186,46 @@ def to_json(dict_, pretty=False):
                       ignore_nan=True)
 
 
+def _to_json_orjson(dict_, pretty=False):
+    """
+    Serialize dict to json with orjson (pretty printed JSON, and values
+    orjson does not support, such as integers over 64 bits, are
+    serialized with simplejson)
+
+    :param dict_: `dict` of JSON representation
+    :param pretty: `bool` of whether to prettify JSON (default is `False`)
+
+    :returns: JSON string representation
+    """
+
+    if pretty:  # orjson only indents by 2 spaces
+        return _to_json_simplejson(dict_, pretty)
+
+    try:
+        return orjson.dumps(dict_, default=json_serial,
+                            option=ORJSON_OPTIONS).decode('utf-8')
+    except orjson.JSONEncodeError as err:
+        LOGGER.debug('Serializing with simplejson: {}'.format(err))
+        return _to_json_simplejson(dict_, pretty)
+
+
+#: JSON encoders (functions of dict and pretty flag)
+JSON_ENCODERS = {
+    'simplejson': _to_json_simplejson
+}
+
+#: name of JSON encoder used by `to_json` (orjson if installed)
+JSON_ENCODER = 'simplejson'
+
+if orjson is not None:
+    # datetimes are passed to json_serial, for the same representation
+    ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS |
+                      orjson.OPT_PASSTHROUGH_DATETIME |
+                      orjson.OPT_SERIALIZE_NUMPY)
+    JSON_ENCODERS['orjson'] = _to_json_orjson
+    JSON_ENCODER = 'orjson'
+
+
 def get_path_basename(urlpath):
     """
     Helper function to derive file basename
@@ -191,15 +254,35 @@ def json_serial(obj):
             return obj.decode('utf-8')
         except UnicodeDecodeError:
             LOGGER.debug('Returning as base64 encoded JSON object')
-            return base64.b64encode(obj)
+            return base64.b64encode(obj).decode('ascii')
     elif isinstance(obj, Decimal):
         return float(obj)
+    elif np is not None and isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif np is not None and isinstance(obj, np.generic):
+        return obj.item()
 
     msg = '{} type {} not serializable'.format(obj, type(obj))
     LOGGER.error(msg)
     raise TypeError(msg)
 
 
+def to_utc_string(datetime_):
+    """
+    helper function to format a datetime as ISO 8601 in UTC
+    (naive datetimes are assumed to be UTC)
+
+    :param datetime_: `datetime.datetime` object
+
+    :returns: `str` of datetime, e.g. 2020-04-11T00:00:00Z
+    """
+
+    if datetime_.tzinfo is not None:
+        datetime_ = datetime_.astimezone(timezone.utc)
+
+    return datetime_.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
 def is_url(urlstring):
     """
     Validation function that determines whether a candidate URL should be
@@ -256,6 +339,56 @@ def get_mimetype(filename):
     return mimetypes.guess_type(filename)[0]
 
 
+def read_file_chunks(filename, chunk_size=65536, remove=False):
+    """
+    helper function to stream a file in chunks
+
+    :param filename: filename
+    :param chunk_size: `int` of bytes per chunk
+    :param remove: `bool` of whether to remove the (temporary) file
+                   once streamed
+
+    :returns: generator of `bytes` chunks
+    """
+
+    try:
+        with open(filename, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(chunk_size), b''):
+                yield chunk
+    finally:
+        if remove:
+            os.remove(filename)
+
+
+def get_wkt_points(wkt):
+    """
+    helper function to parse the coordinates of a WKT POINT
+    or MULTIPOINT
+
+    :param wkt: `str` of WKT geometry
+
+    :returns: `list` of [x, y] coordinates
+    """
+
+    match = re.match(r'^\s*(MULTI)?POINT\s*\((.+)\)\s*$', wkt,
+                     re.IGNORECASE)
+    if match is None:
+        raise ValueError('Invalid WKT POINT or MULTIPOINT: {}'.format(wkt))
+
+    parts = match.group(2).split(',')
+    if match.group(1) is None and len(parts) != 1:
+        raise ValueError('Invalid WKT POINT: {}'.format(wkt))
+
+    points = []
+    for part in parts:
+        values = part.strip().strip('()').split()
+        if len(values) != 2:
+            raise ValueError('Invalid WKT coordinates: {}'.format(part))
+        points.append([float(value) for value in values])
+
+    return points
+
+
 def get_breadcrumbs(urlpath):
     """
     helper function to make breadcrumbs from a URL path
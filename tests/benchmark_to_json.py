@@ -0,0 +1,92 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+# Benchmark of the JSON encoders of pygeoapi.util.to_json on feature pages
+# of the test data:
+#
+#   python tests/benchmark_to_json.py
+
+import itertools
+import os
+import timeit
+
+from pygeoapi import util
+from pygeoapi.provider.geojson import GeoJSONProvider
+
+#: page sizes (number of features)
+LIMITS = [10, 100, 1000, 10000]
+
+DATASETS = [
+    ('populated places (points)', 'ne_110m_populated_places_simple.geojson'),
+    ('lakes (polygons)', 'ne_110m_lakes.geojson')
+]
+
+
+def get_page(filename, limit):
+    """helper function to make a FeatureCollection page of test data"""
+
+    p = GeoJSONProvider({
+        'name': 'GeoJSON',
+        'type': 'feature',
+        'data': os.path.join(os.path.dirname(__file__), 'data', filename),
+        'id_field': 'id'
+    })
+    page = p.query(limit=limit)
+
+    # repeat features of small datasets up to the page size
+    page['features'] = list(itertools.islice(
+        itertools.cycle(page['features']), limit))
+    page['numberReturned'] = limit
+
+    return page
+
+
+def main():
+    print('{:30} {:>6} {:>10} {:>12} {:>9}'.format(
+        'dataset', 'limit', 'encoder', 'ms per page', 'speedup'))
+
+    for title, filename in DATASETS:
+        for limit in LIMITS:
+            page = get_page(filename, limit)
+            number = max(1, 10000 // limit)
+            baseline = None
+            for encoder, func in sorted(util.JSON_ENCODERS.items(),
+                                        reverse=True):
+                seconds = min(timeit.repeat(
+                    lambda: func(page), number=number, repeat=5)) / number
+                if baseline is None:
+                    baseline = seconds
+                print('{:30} {:>6} {:>10} {:>12.3f} {:>8.1f}x'.format(
+                    title, limit, encoder, seconds * 1000,
+                    baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
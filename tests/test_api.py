@@ -497,6 +497,258 @@ def test_get_collection_items(config, api_):
     assert code == 200
 
 
+def test_get_collection_items_response_cache(config):
+    config['server']['response_cache'] = {'name': 'Memory', 'ttl': 60}
+    api_ = API(config)
+    req_headers = make_req_headers()
+
+    calls = []
+    query = api_._get_collection_items
+
+    def counted_query(*args):
+        calls.append(args)
+        return query(*args)
+
+    api_._get_collection_items = counted_query
+
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'limit': 2, 'f': 'json'}, 'obs')
+    assert code == 200
+    rsp_headers2, code, response2 = api_.get_collection_items(
+        req_headers, {'f': 'json', 'limit': '2 '}, 'obs')
+    assert code == 200
+    assert response2 == response
+    assert rsp_headers2 == rsp_headers
+    assert len(calls) == 1
+
+    # conditional requests are answered from the cache
+    req_headers = make_req_headers(
+        HTTP_IF_MODIFIED_SINCE=rsp_headers['Last-Modified'])
+    rsp_headers2, code, response2 = api_.get_collection_items(
+        req_headers, {'limit': 2, 'f': 'json'}, 'obs')
+    assert code == 304
+    assert rsp_headers2['Last-Modified'] == rsp_headers['Last-Modified']
+    assert len(calls) == 1
+
+    req_headers = make_req_headers(HTTP_IF_NONE_MATCH=rsp_headers['ETag'])
+    rsp_headers2, code, response2 = api_.get_collection_items(
+        req_headers, {'limit': 2, 'f': 'json'}, 'obs')
+    assert code == 304
+    assert len(calls) == 1
+    req_headers = make_req_headers()
+
+    # other parameters or format
+    api_.get_collection_items(req_headers, {'limit': 3}, 'obs')
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'limit': 2, 'f': 'csv'}, 'obs')
+    assert code == 200
+    assert rsp_headers['Content-Type'].startswith('text/csv')
+    api_.get_collection_items(req_headers, {'limit': 2, 'f': 'csv'}, 'obs')
+    assert len(calls) == 3
+
+    # errors are not cached
+    api_.get_collection_items(req_headers, {'bbox': '1,2,3'}, 'obs')
+    api_.get_collection_items(req_headers, {'bbox': '1,2,3'}, 'obs')
+    assert len(calls) == 5
+
+    api_.invalidate_response_cache('obs')
+    api_.get_collection_items(req_headers, {'limit': 2, 'f': 'json'}, 'obs')
+    assert len(calls) == 6
+
+    config['resources']['obs']['response_cache'] = {'ttl': 0}
+    api_.get_collection_items(req_headers, {'limit': 3}, 'obs')
+    assert len(calls) == 7
+
+
+def test_get_collection_items_coalescing(config, api_):
+    # disabled by default
+    assert api_.get_coalescing_metrics() is None
+
+    config['server']['coalesce_requests'] = True
+    api_ = API(config)
+    req_headers = make_req_headers()
+    api_.get_collection_items(req_headers, {}, 'obs')
+    api_.get_collection_item(req_headers, {}, 'obs', '371')
+    assert api_.get_coalescing_metrics() == {
+        'calls': 2,
+        'coalesced': 0,
+        'in_flight': 0
+    }
+
+    # coverage data is not coalesced
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers,
+        ImmutableMultiDict([
+            ('subset', 'Lat(5,10)'), ('subset', 'Long(5,10)')]),
+        'gdps-temperature')
+    assert code == 200
+    assert api_.get_coalescing_metrics()['calls'] == 2
+
+
+def test_conditional_requests(config):
+    config['server']['cache_control'] = 'max-age=60'
+    config['resources']['obs']['cache_control'] = 'no-cache'
+    api_ = API(config)
+    req_headers = make_req_headers()
+
+    # documents derived from the configuration
+    rsp_headers, code, response = api_.landing_page(req_headers, {})
+    assert code == 200
+    assert rsp_headers['Cache-Control'] == 'max-age=60'
+    etag = rsp_headers['ETag']
+
+    req_headers = make_req_headers(HTTP_IF_NONE_MATCH=etag)
+    rsp_headers, code, response = api_.landing_page(req_headers, {})
+    assert code == 304
+    assert response == ''
+    assert rsp_headers['ETag'] == etag
+
+    rsp_headers, code, response = api_.landing_page(req_headers,
+                                                    {'f': 'html'})
+    assert code == 200
+    assert rsp_headers['ETag'] != etag
+
+    # each document has its own entity tag
+    rsp_headers, code, response = api_.conformance(req_headers, {})
+    assert code == 200
+    assert rsp_headers['ETag'] != etag
+
+    req_headers = make_req_headers()
+    openapi = {'openapi': '3.0.2', 'paths': {}}
+    rsp_headers, code, response = api_.openapi(req_headers, {}, openapi)
+    etag = rsp_headers['ETag']
+    req_headers = make_req_headers(HTTP_IF_NONE_MATCH=etag)
+    rsp_headers, code, response = api_.openapi(req_headers, {}, openapi)
+    assert code == 304
+    openapi['paths']['/foo'] = {}
+    rsp_headers, code, response = api_.openapi(req_headers, {}, openapi)
+    assert code == 200
+    assert rsp_headers['ETag'] != etag
+
+    # coverage metadata is validated by the data version
+    rsp_headers, code, response = api_.describe_collections(
+        req_headers, {}, 'gdps-temperature')
+    assert code == 200
+    etag = rsp_headers['ETag']
+    req_headers = make_req_headers(HTTP_IF_NONE_MATCH=etag)
+    rsp_headers, code, response = api_.describe_collections(
+        req_headers, {}, 'gdps-temperature')
+    assert code == 304
+
+    data = config['resources']['gdps-temperature']['providers'][0]['data']
+    stat = os.stat(data)
+    try:
+        os.utime(data, (stat.st_atime, stat.st_mtime + 60))
+        rsp_headers, code, response = api_.describe_collections(
+            req_headers, {}, 'gdps-temperature')
+        assert code == 200
+        assert rsp_headers['ETag'] != etag
+    finally:
+        os.utime(data, (stat.st_atime, stat.st_mtime))
+
+    # data of file providers
+    req_headers = make_req_headers()
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'limit': 2}, 'obs')
+    assert code == 200
+    assert rsp_headers['Cache-Control'] == 'no-cache'
+    etag = rsp_headers['ETag']
+    last_modified = rsp_headers['Last-Modified']
+    rsp_headers, code, response2 = api_.get_collection_items(
+        req_headers, {'limit': 2}, 'obs')
+    assert response2 == response
+
+    req_headers = make_req_headers(HTTP_IF_NONE_MATCH=etag)
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'limit': 2}, 'obs')
+    assert code == 304
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'limit': 3}, 'obs')
+    assert code == 200
+
+    req_headers = make_req_headers(HTTP_IF_MODIFIED_SINCE=last_modified)
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'limit': 3}, 'obs')
+    assert code == 304
+    req_headers = make_req_headers(
+        HTTP_IF_MODIFIED_SINCE='Thu, 01 Jan 1970 00:00:00 GMT')
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'limit': 3}, 'obs')
+    assert code == 200
+
+    req_headers = make_req_headers()
+    rsp_headers, code, response = api_.get_collection_item(
+        req_headers, {}, 'obs', '371')
+    assert code == 200
+    req_headers = make_req_headers(HTTP_IF_NONE_MATCH=rsp_headers['ETag'])
+    rsp_headers, code, response = api_.get_collection_item(
+        req_headers, {}, 'obs', '371')
+    assert code == 304
+
+
+def test_get_collection_items_streamed(config):
+    req_headers = make_req_headers()
+    api_ = API(config)
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'limit': 2, 'startindex': 1}, 'obs')
+    assert code == 200
+
+    config['resources']['obs']['stream_items'] = True
+    rsp_headers2, code, chunks = api_.get_collection_items(
+        req_headers, {'limit': 2, 'startindex': 1}, 'obs')
+    assert code == 200
+    assert not isinstance(chunks, str)
+    content = json.loads(response)
+    content.pop('numberMatched')  # not known when streaming
+    assert json.loads(''.join(chunks)) == content
+
+    # other formats are not streamed
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'f': 'csv'}, 'obs')
+    assert isinstance(response, bytes)
+
+    rsp_headers, code, chunks = api_.get_collection_items(
+        req_headers, {'startindex': 10}, 'obs')
+    content = json.loads(''.join(chunks))
+    assert content['features'] == []
+    assert content['numberReturned'] == 0
+
+
+def test_get_collection_items_bulk(config):
+    config['server']['limit'] = 2
+    api_ = API(config)
+    req_headers = make_req_headers()
+    rsp_headers, code, chunks = api_.get_collection_items(
+        req_headers, {'f': 'ndjson'}, 'obs')
+    assert code == 200
+    assert rsp_headers['Content-Type'] == 'application/x-ndjson'
+    lines = ''.join(chunks).splitlines()
+    assert len(lines) == 5  # all features, regardless of server limit
+    features = [json.loads(line) for line in lines]
+    assert features[0]['type'] == 'Feature'
+    assert features[0]['id'] == '371'
+
+    rsp_headers, code, chunks = api_.get_collection_items(
+        req_headers, {'f': 'ndjson', 'startindex': 1, 'limit': 2}, 'obs')
+    features = [json.loads(line) for line in ''.join(chunks).splitlines()]
+    assert [feature['id'] for feature in features] == ['377', '238']
+
+    req_headers = make_req_headers(HTTP_ACCEPT='application/geo+json-seq')
+    rsp_headers, code, chunks = api_.get_collection_items(
+        req_headers, {}, 'obs')
+    assert code == 200
+    assert rsp_headers['Content-Type'] == 'application/geo+json-seq'
+    records = ''.join(chunks).split('\x1e')
+    assert records[0] == ''
+    assert len(records) == 6
+    assert all(record.endswith('\n') for record in records[1:])
+    assert json.loads(records[1])['id'] == '371'
+
+    rsp_headers, code, response = api_.get_collection_items(
+        req_headers, {'f': 'ndjson', 'foo': 'bar'}, 'obs')
+    assert code == 400
+
+
 def test_get_collection_items_json_ld(config, api_):
     req_headers = make_req_headers()
     rsp_headers, code, response = api_.get_collection_items(
@@ -662,7 +914,7 @@ def test_get_collection_coverage(config, api_):
         'gdps-temperature')
 
     assert code == 200
-    content = json.loads(response)
+    content = json.loads(b''.join(response))
 
     assert content['domain']['axes']['x']['num'] == 35
     assert content['domain']['axes']['y']['num'] == 35
@@ -670,6 +922,121 @@ def test_get_collection_coverage(config, api_):
     assert 'TMP' in content['ranges']
     assert content['ranges']['TMP']['axisNames'] == ['y', 'x']
 
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'scaleSize': 'Lat(10),Long(20)'}, 'gdps-temperature')
+
+    assert code == 200
+    content = json.loads(b''.join(response))
+
+    assert content['domain']['axes']['x']['num'] == 20
+    assert content['domain']['axes']['y']['num'] == 10
+    assert len(content['ranges']['TMP']['values']) == 200
+
+    req_headers = make_req_headers(HTTP_IF_NONE_MATCH=rsp_headers['ETag'])
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'scaleSize': 'Lat(10),Long(20)'}, 'gdps-temperature')
+
+    assert code == 304
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'scaleSize': 'Lat(10),Long(30)'}, 'gdps-temperature')
+
+    assert code == 200
+
+    req_headers = make_req_headers(
+        HTTP_ACCEPT='application/prs.coverage+cbor')
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'scaleSize': 'Lat(10),Long(20)'}, 'gdps-temperature')
+
+    assert code == 200
+    assert rsp_headers['Content-type'] == 'application/prs.coverage+cbor'
+    assert b''.join(response).startswith(b'\xa4\x64type')
+
+    req_headers = make_req_headers()
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers,
+        ImmutableMultiDict([
+            ('subset', 'Lat(45,50)'), ('subset', 'Long(5,10)'),
+            ('crs', 'http://www.opengis.net/def/crs/EPSG/0/3857')]),
+        'gdps-temperature')
+
+    assert code == 200
+    content = json.loads(b''.join(response))
+
+    assert content['domain']['referencing'][0]['system']['id'] == \
+        'http://www.opengis.net/def/crs/EPSG/0/3857'
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'crs': 'EPSG:foo'}, 'gdps-temperature')
+
+    assert code == 400
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, ImmutableMultiDict([('subset', 'Lat(5)')]),
+        'gdps-temperature')
+
+    assert code == 400
+    assert rsp_headers['Content-Type'] == 'application/json'
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'scaleFactor': '0'}, 'gdps-temperature')
+
+    assert code == 400
+    assert rsp_headers['Content-Type'] == 'application/json'
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'scaleSize': 'Lat(-1)'}, 'gdps-temperature')
+
+    assert code == 400
+    assert rsp_headers['Content-Type'] == 'application/json'
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'scaleAxes': 'bad_axis(2)'}, 'gdps-temperature')
+
+    assert code == 400
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'scaleFactor': '2', 'scaleSize': 'Lat(10)'},
+        'gdps-temperature')
+
+    assert code == 400
+    assert rsp_headers['Content-Type'] == 'application/json'
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'coords': 'POINT(5)'}, 'gdps-temperature')
+
+    assert code == 400
+    assert rsp_headers['Content-Type'] == 'application/json'
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'coords': 'POINT(5 45)'}, 'gdps-temperature')
+
+    assert code == 400
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'aggregation': 'median'}, 'gdps-temperature')
+
+    assert code == 400
+    assert rsp_headers['Content-Type'] == 'application/json'
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers, {'resample': 'P1D'}, 'gdps-temperature')
+
+    assert code == 400
+
+    rsp_headers, code, response = api_.get_collection_coverage(
+        req_headers,
+        ImmutableMultiDict([
+             ('subset', 'Lat(5,10)'), ('subset', 'Long(5,10)'),
+             ('f', 'COG')
+        ]),
+        'gdps-temperature')
+
+    assert code == 200
+    assert rsp_headers['Content-type'].startswith('image/tiff')
+    assert b''.join(response).startswith(b'II*')
+
     rsp_headers, code, response = api_.get_collection_coverage(
         req_headers,
         ImmutableMultiDict([
@@ -679,7 +1046,64 @@ def test_get_collection_coverage(config, api_):
         'gdps-temperature')
 
     assert code == 200
-    assert isinstance(response, bytes)
+    assert isinstance(b''.join(response), bytes)
+
+
+def test_get_stac_search(config, tmp_path):
+    config['resources']['stac'] = {
+        'type': 'stac-collection',
+        'title': 'STAC',
+        'description': 'STAC',
+        'keywords': [],
+        'links': [],
+        'extents': {
+            'spatial': {
+                'bbox': [-180, -90, 180, 90],
+                'crs': 'http://www.opengis.net/def/crs/OGC/1.3/CRS84'
+            }
+        },
+        'providers': [{
+            'type': 'stac',
+            'name': 'FileSystem',
+            'data': os.path.dirname(get_test_file_path('data/obs.csv')),
+            'file_types': ['.gpkg'],
+            'metadata_cache': {
+                'path': str(tmp_path / 'stac.sqlite'),
+                'scan_interval': 0
+            }
+        }]
+    }
+    api_ = API(config)
+    req_headers = make_req_headers()
+
+    # files are described on first access
+    api_.get_stac_path(req_headers, {}, 'stac/poi_portugal')
+
+    rsp_headers, code, response = api_.get_stac_search(
+        req_headers, {'bbox': '-10,36,-6,43', 'limit': '1'})
+    assert code == 200
+    assert rsp_headers['Content-Type'] == 'application/geo+json'
+
+    content = json.loads(response)
+    assert content['context'] == {'returned': 1, 'limit': 1, 'matched': 1}
+    assert content['features'][0]['id'] == 'poi_portugal'
+    assert content['features'][0]['collection'] == 'stac'
+
+    rsp_headers, code, response = api_.get_stac_search(
+        req_headers, {'datetime': '../1970-01-02'})
+    assert code == 200
+    assert json.loads(response)['context']['matched'] == 0
+
+    for args in [{'bbox': '1,2,3'}, {'datetime': 'foo'}, {'limit': '0'},
+                 {'collections': 'obs'}]:
+        rsp_headers, code, response = api_.get_stac_search(req_headers, args)
+        assert code == 400
+
+    # no searchable collection
+    config['resources']['stac']['providers'][0].pop('metadata_cache')
+    api_ = API(config)
+    rsp_headers, code, response = api_.get_stac_search(req_headers, {})
+    assert code == 501
 
 
 def test_describe_processes(config, api_):
@@ -0,0 +1,184 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import os
+import time
+
+import pytest
+
+from pygeoapi.cache import (FileSystemCache, MemoryCache, RedisCache,
+                            SQLiteCache)
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    return FileSystemCache({
+        'directory': str(tmp_path),
+        'ttl': 60,
+        'max_size': 1000
+    })
+
+
+def test_make_key():
+    key = FileSystemCache.make_key('src', 'layer', 0, 10)
+    assert key == FileSystemCache.make_key('src', 'layer', 0, 10)
+    assert key != FileSystemCache.make_key('src', 'layer', 10, 10)
+
+
+def test_get_set(cache):
+    assert cache.get('foo') is None
+
+    cache.set('foo', b'{"type": "FeatureCollection"}')
+    assert cache.get('foo') == b'{"type": "FeatureCollection"}'
+
+    cache.delete('foo')
+    assert cache.get('foo') is None
+
+
+def test_ttl(cache):
+    cache.ttl = -1
+    cache.set('foo', b'bar')
+    assert cache.get('foo') is None
+    assert not os.listdir(cache.directory)
+
+
+def test_evict_least_recently_used(cache):
+    cache.set('a', b'a' * 400)
+    cache.set('b', b'b' * 400)
+
+    # make 'a' the most recently used entry
+    past = time.time() - 10
+    os.utime(cache._path('b'), (past, past))
+    assert cache.get('a') is not None
+
+    cache.set('c', b'c' * 400)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+
+
+def test_clear(cache):
+    cache.set('a', b'a')
+    cache.set('b', b'b')
+    cache.clear()
+    assert cache.get('a') is None
+    assert cache.get('b') is None
+
+
+class LocalRedis:
+    """local stand-in of a Redis client"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        value = self.values.get(key)
+        if value is None or value[0] < time.time():
+            return None
+        return value[1]
+
+    def set(self, key, value, ex=None):
+        self.values[key] = (time.time() + ex, value)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip('*')
+        return [key for key in list(self.values) if key.startswith(prefix)]
+
+
+@pytest.fixture(params=['memory', 'filesystem', 'sqlite', 'redis'])
+def any_cache(request, tmp_path):
+    cache_def = {'ttl': 60, 'max_size': 1000}
+    if request.param == 'memory':
+        return MemoryCache(cache_def)
+    elif request.param == 'filesystem':
+        cache_def['directory'] = str(tmp_path)
+        return FileSystemCache(cache_def)
+    elif request.param == 'sqlite':
+        cache_def['path'] = str(tmp_path / 'cache.sqlite')
+        return SQLiteCache(cache_def)
+    else:
+        return RedisCache(cache_def, client=LocalRedis())
+
+
+def test_backends(any_cache):
+    assert any_cache.get('foo') is None
+
+    any_cache.set('foo', b'bar')
+    assert any_cache.get('foo') == b'bar'
+
+    any_cache.set('baz', b'qux', ttl=-1)
+    assert any_cache.get('baz') is None
+
+    any_cache.delete('foo')
+    assert any_cache.get('foo') is None
+
+    any_cache.set('foo', b'bar')
+    any_cache.clear()
+    assert any_cache.get('foo') is None
+
+
+def test_invalidate(any_cache):
+    version = any_cache.get_version('obs')
+    assert any_cache.get_version('obs') == version
+    assert any_cache.get_version('lakes') != version
+
+    any_cache.invalidate('obs')
+    assert any_cache.get_version('obs') != version
+
+
+@pytest.mark.parametrize('name', ['memory', 'sqlite'])
+def test_backends_evict_least_recently_used(name, tmp_path):
+    cache_def = {'ttl': 60, 'max_size': 1000}
+    if name == 'memory':
+        cache = MemoryCache(cache_def)
+    else:
+        cache_def['path'] = str(tmp_path / 'cache.sqlite')
+        cache = SQLiteCache(cache_def)
+
+    cache.set('a', b'a' * 400)
+    time.sleep(0.01)
+    cache.set('b', b'b' * 400)
+    time.sleep(0.01)
+    assert cache.get('a') is not None  # 'b' is now least recently used
+    time.sleep(0.01)
+    cache.set('c', b'c' * 400)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+
+
+def test_sqlite_shared(tmp_path):
+    cache_def = {'path': str(tmp_path / 'cache.sqlite')}
+    SQLiteCache(cache_def).set('foo', b'bar')
+    assert SQLiteCache(cache_def).get('foo') == b'bar'
@@ -0,0 +1,130 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from pygeoapi.formatter import covjson
+from pygeoapi.formatter.covjson import CoverageJSONFormatter
+
+
+@pytest.fixture()
+def fixture():
+    values = np.ma.masked_array(
+        np.arange(6, dtype='float32').reshape(2, 3),
+        mask=[[False, True, False], [False, False, False]])
+
+    return {
+        'type': 'Coverage',
+        'domain': {
+            'type': 'Domain',
+            'domainType': 'Grid',
+            'axes': {
+                'x': {'start': 0, 'stop': 2, 'num': 3},
+                'y': {'start': 1, 'stop': 0, 'num': 2}
+            }
+        },
+        'parameters': {},
+        'ranges': {
+            'TMP': {
+                'type': 'NdArray',
+                'dataType': 'float',
+                'axisNames': ['y', 'x'],
+                'shape': [2, 3],
+                'values': values
+            }
+        }
+    }
+
+
+def test_covjson__formatter(fixture, monkeypatch):
+    f = CoverageJSONFormatter({})
+    assert f.mimetype == 'application/prs.coverage+json'
+
+    data = json.loads(b''.join(f.write(data=fixture)))
+    assert data['domain'] == fixture['domain']
+    assert data['ranges']['TMP']['shape'] == [2, 3]
+    assert data['ranges']['TMP']['values'] == [0, None, 2, 3, 4, 5]
+
+    # chunked output
+    monkeypatch.setattr(covjson, 'CHUNK_SIZE', 4)
+    data2 = json.loads(b''.join(f.write(data=fixture)))
+    assert data2 == data
+
+
+def test_covjson__formatter_cbor(fixture):
+    f = CoverageJSONFormatter({'encoding': 'cbor'})
+    assert f.mimetype == 'application/prs.coverage+cbor'
+
+    data = b''.join(f.write(data=fixture))
+
+    # map of 4 items, first key 'type'
+    assert data[:6] == b'\xa4\x64type'
+
+    # float32 little endian typed array (tag 85) of 6 values
+    values = struct.pack('<6f', 0, float('nan'), 2, 3, 4, 5)
+    assert data.endswith(b'\xd8\x55\x58\x18' + values)
+
+
+class LazyArray:
+    """array computed on demand, recording the computed blocks"""
+
+    def __init__(self, values, computed):
+        self.values = values
+        self.computed = computed
+        self.shape = values.shape
+        self.dtype = values.dtype
+
+    def __getitem__(self, key):
+        return LazyArray(self.values[key], self.computed)
+
+    def compute(self):
+        self.computed.append(self.values.shape)
+        return self.values
+
+
+def test_covjson__formatter_lazy(fixture, monkeypatch):
+    computed = []
+    values = np.arange(6, dtype='float32').reshape(2, 3)
+    fixture['ranges']['TMP']['values'] = LazyArray(values, computed)
+
+    # one row per block
+    monkeypatch.setattr(covjson, 'BLOCK_SIZE', 12)
+
+    f = CoverageJSONFormatter({})
+    data = json.loads(b''.join(f.write(data=fixture)))
+    assert data['ranges']['TMP']['values'] == [0, 1, 2, 3, 4, 5]
+    assert computed == [(1, 3), (1, 3)]
+
+    f = CoverageJSONFormatter({'encoding': 'cbor'})
+    data = b''.join(f.write(data=fixture))
+    assert data.endswith(b'\xd8\x55\x58\x18' + values.tobytes())
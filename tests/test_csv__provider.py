@@ -95,6 +95,17 @@ def test_query(config):
     assert len(results['features'][0]['properties']) == 2
 
 
+def test_iter_features(config):
+    p = CSVProvider(config)
+
+    features = p.iter_features(startindex=1, limit=3)
+    assert next(features) == p.query(startindex=1, limit=1)['features'][0]
+    assert [feature['id'] for feature in features] == ['238', '297']
+
+    features = list(p.iter_features(startindex=2, limit=None))
+    assert [feature['id'] for feature in features] == ['238', '297', '964']
+
+
 def test_get(config):
     p = CSVProvider(config)
 
@@ -30,6 +30,7 @@
 import os
 import pytest
 
+from pygeoapi.provider import filesystem
 from pygeoapi.provider.filesystem import FileSystemProvider
 
 THISDIR = os.path.dirname(os.path.realpath(__file__))
@@ -59,3 +60,126 @@ def test_query(config):
     r = p.get_data_path(baseurl, urlpath, '/poi_portugal')
     assert r['geometry']['type'] == 'Polygon'
     assert r['assets']['default']['href'] == 'http://example.org/stac/poi_portugal.gpkg'  # noqa
+
+    r = p.get_data_path(baseurl, urlpath, '/poi_portugal.gpkg')
+    assert isinstance(r, os.PathLike)
+    assert os.path.samefile(r, os.path.join(THISDIR, 'data',
+                                            'poi_portugal.gpkg'))
+
+
+def test_query_metadata_cache(config, tmp_path, monkeypatch):
+    config['metadata_cache'] = {
+        'path': str(tmp_path / 'stac.sqlite'),
+        'scan_interval': 0
+    }
+
+    p = FileSystemProvider(config)
+
+    # the schema of the sidecar is set up once
+    def create_schema(self):
+        raise AssertionError('schema set up again')
+
+    monkeypatch.setattr(filesystem.FileMetadataCache, '_create_schema',
+                        create_schema)
+    p = FileSystemProvider(config)
+
+    baseurl = 'http://example.org/stac'
+
+    assert p.metadata_cache.scan() == 3
+
+    described = []
+
+    def describe_file(filepath):
+        described.append(filepath)
+        return {}
+
+    monkeypatch.setattr(filesystem, '_describe_file', describe_file)
+
+    r = p.get_data_path(baseurl, '', '')
+    assert len(r['links']) == 12
+
+    r = p.get_data_path(baseurl, '', '/poi_portugal')
+    assert r['geometry']['type'] == 'Polygon'
+    assert r['assets']['default']['href'] == 'http://example.org/stac/poi_portugal.gpkg'  # noqa
+    assert described == []
+
+    # modified files are described again
+    filepath = os.path.join(THISDIR, 'data', 'poi_portugal.gpkg')
+    stat = os.stat(filepath)
+    os.utime(filepath, (stat.st_atime, stat.st_mtime + 1))
+    try:
+        p.get_data_path(baseurl, '', '/poi_portugal')
+        assert described == [filepath]
+    finally:
+        os.utime(filepath, (stat.st_atime, stat.st_mtime))
+
+
+def test_query_metadata_cache_queued(config, tmp_path, monkeypatch):
+    config['metadata_cache'] = {
+        'path': str(tmp_path / 'stac.sqlite'),
+        'scan_interval': 300
+    }
+
+    # no background scanner thread: queued files are described below
+    monkeypatch.setattr(filesystem.FileMetadataCache, '_run_scanner',
+                        lambda self: None)
+    p = FileSystemProvider(config)
+
+    # unscanned files are not opened on the request path
+    r = p.get_data_path('http://example.org/stac', '', '/poi_portugal')
+    assert r['geometry'] is None
+    assert r['properties']['datetime'].endswith('Z')
+    assert r['properties']['file:size'] > 0
+
+    assert p.metadata_cache.describe_queued() == 1
+    assert p.metadata_cache.describe_queued() == 0
+
+    r = p.get_data_path('http://example.org/stac', '', '/poi_portugal')
+    assert r['geometry']['type'] == 'Polygon'
+
+
+def test_search(config, tmp_path):
+    config['metadata_cache'] = {
+        'path': str(tmp_path / 'stac.sqlite'),
+        'scan_interval': 0
+    }
+
+    p = FileSystemProvider(config)
+
+    baseurl = 'http://example.org/stac/data'
+
+    # not scanned yet
+    assert p.search(baseurl)['numberMatched'] == 0
+
+    p.metadata_cache.scan()
+
+    r = p.search(baseurl)
+    assert r['numberMatched'] == 3
+    assert [f['id'] for f in r['features']] == [
+        'dutch_addresses_28992', 'dutch_addresses_4326', 'poi_portugal']
+
+    r = p.search(baseurl, bbox=[-10, 36, -6, 43])
+    assert r['numberMatched'] == 1
+    item = r['features'][0]
+    assert item['id'] == 'poi_portugal'
+    assert item['assets']['default']['href'] == '{}/poi_portugal.gpkg'.format(baseurl)  # noqa
+    assert item['properties']['datetime'].endswith('Z')
+    assert 'osm_id' in item['properties']
+
+    # projected (EPSG:28992) footprints are indexed in WGS84
+    r = p.search(baseurl, bbox=[5.6, 52.0, 5.9, 52.2])
+    assert [f['id'] for f in r['features']] == [
+        'dutch_addresses_28992', 'dutch_addresses_4326']
+    minx, miny, maxx, maxy = r['features'][0]['bbox']
+    assert 5.6 < minx < maxx < 5.9
+    assert 52.0 < miny < maxy < 52.2
+
+    r = p.search(baseurl, limit=1, startindex=1)
+    assert r['numberMatched'] == 3
+    assert [f['id'] for f in r['features']] == ['dutch_addresses_4326']
+
+    r = p.search(baseurl, datetime_=(None, '1970-01-02T00:00:00Z'))
+    assert r['numberMatched'] == 0
+
+    r = p.search(baseurl, properties=[('fclass', 'str:255')])
+    assert [f['id'] for f in r['features']] == ['poi_portugal']
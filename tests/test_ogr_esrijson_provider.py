@@ -31,8 +31,11 @@
 
 # https://sampleserver6.arcgisonline.com/arcgis/rest/services/CommunityAddressing/FeatureServer/0
 
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
 import logging
 import random
+import threading
 
 import pytest
 
@@ -70,6 +73,70 @@ def config_ArcGIS_ESRIJSON():
     }
 
 
+@pytest.fixture()
+def esrijson_server():
+    """Local stand-in for an ArcGIS FeatureServer query endpoint"""
+
+    requests = []
+    body = json.dumps({
+        'objectIdFieldName': 'objectid',
+        'geometryType': 'esriGeometryPoint',
+        'spatialReference': {'wkid': 4326},
+        'fields': [
+            {'name': 'objectid', 'type': 'esriFieldTypeOID'},
+            {'name': 'fulladdr', 'type': 'esriFieldTypeString',
+             'length': 50}
+        ],
+        'features': [{
+            'attributes': {'objectid': i, 'fulladdr': '{} Main St'.format(i)},
+            'geometry': {'x': -88.0 + i / 100, 'y': 41.0}
+        } for i in range(1, 6)]
+    }).encode('utf-8')
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield 'http://127.0.0.1:{}/query?f=json'.format(server.server_port), \
+        requests
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def config_cached_ESRIJSON(esrijson_server, tmp_path):
+    url, _ = esrijson_server
+    return {
+        'name': 'OGR',
+        'type': 'feature',
+        'data': {
+            'source_type': 'ESRIJSON',
+            'source': url,
+            'source_srs': 'EPSG:4326',
+            'target_srs': 'EPSG:4326',
+            'cache': {
+                'directory': str(tmp_path),
+                'ttl': 60
+            }
+        },
+        'id_field': 'objectid',
+        'layer': 'ESRIJSON'
+    }
+
+
 @pytest.fixture()
 def config_random_id(config_ArcGIS_ESRIJSON):
     p = OGRProvider(config_ArcGIS_ESRIJSON)
@@ -174,3 +241,24 @@ def test_query_with_startindex(config_ArcGIS_ESRIJSON):
     assert properties['fulladdr'] is not None
     geometry = feature.get('geometry', None)
     assert geometry is not None
+
+
+def test_query_cached(config_cached_ESRIJSON, esrijson_server):
+    """Testing repeated queries are answered from the local cache"""
+
+    _, requests = esrijson_server
+
+    p = OGRProvider(config_cached_ESRIJSON)
+    feature_collection = p.query(limit=2, resulttype='results')
+    assert len(feature_collection['features']) == 2
+    num_requests = len(requests)
+    assert num_requests > 0
+
+    p = OGRProvider(config_cached_ESRIJSON)
+    num_requests = len(requests)
+    assert p.query(limit=2, resulttype='results') == feature_collection
+    assert len(requests) == num_requests
+
+    feature_collection = p.query(limit=3, resulttype='results')
+    assert len(feature_collection['features']) == 3
+    assert len(requests) > num_requests
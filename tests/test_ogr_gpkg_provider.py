@@ -29,6 +29,7 @@
 
 # Needs to be run like: python3 -m pytest
 
+import json
 import logging
 
 import pytest
@@ -333,12 +334,13 @@ def test_query_with_startindex_4326(config_gpkg_4326):
 
 
 def test_query_bbox_with_startindex_28992(config_gpkg_28992):
-    """Testing query for a valid JSON object with geometry"""
+    """Testing paging applies to the bbox filtered features"""
 
     p = OGRProvider(config_gpkg_28992)
+    bbox = (5.742, 52.053, 5.773, 52.098)
     feature_collection = p.query(
         startindex=10, limit=5,
-        bbox=(5.742, 52.053, 5.773, 52.098),
+        bbox=bbox,
         resulttype='results')
     assert feature_collection.get('type', None) == 'FeatureCollection'
     features = feature_collection.get('features', None)
@@ -350,17 +352,25 @@ def test_query_bbox_with_startindex_28992(config_gpkg_28992):
     assert properties is not None
     geometry = feature.get('geometry', None)
     assert geometry is not None
-    assert properties['straatnaam'] == 'Buurtweg'
-    assert properties['huisnummer'] == '4'
+
+    for feature in features:
+        x, y = feature['geometry']['coordinates'][:2]
+        assert bbox[0] - 0.001 <= x <= bbox[2] + 0.001
+        assert bbox[1] - 0.001 <= y <= bbox[3] + 0.001
+
+    first_page = p.query(
+        startindex=0, limit=15, bbox=bbox, resulttype='results')
+    assert features == first_page['features'][10:]
 
 
 def test_query_bbox_with_startindex_4326(config_gpkg_4326):
-    """Testing query for a valid JSON object with geometry"""
+    """Testing paging applies to the bbox filtered features"""
 
     p = OGRProvider(config_gpkg_4326)
+    bbox = (5.742, 52.053, 5.773, 52.098)
     feature_collection = p.query(
         startindex=1, limit=5,
-        bbox=(5.742, 52.053, 5.773, 52.098),
+        bbox=bbox,
         resulttype='results')
     assert feature_collection.get('type', None) == 'FeatureCollection'
     features = feature_collection.get('features', None)
@@ -372,8 +382,15 @@ def test_query_bbox_with_startindex_4326(config_gpkg_4326):
     assert properties is not None
     geometry = feature.get('geometry', None)
     assert geometry is not None
-    assert properties['straatnaam'] == 'Egypte'
-    assert properties['huisnummer'] == '6'
+
+    for feature in features:
+        x, y = feature['geometry']['coordinates'][:2]
+        assert bbox[0] - 0.001 <= x <= bbox[2] + 0.001
+        assert bbox[1] - 0.001 <= y <= bbox[3] + 0.001
+
+    first_page = p.query(
+        startindex=0, limit=6, bbox=bbox, resulttype='results')
+    assert features == first_page['features'][1:]
 
 
 def test_query_with_property_filtering(config_gpkg_4326):
@@ -396,3 +413,117 @@ def test_query_with_property_filtering(config_gpkg_4326):
         assert 'straatnaam' in feature['properties']
 
         assert feature['properties']['straatnaam'] == 'Arnhemseweg'
+
+
+def test_query_arrow_stream_4326(config_gpkg_4326):
+    """Testing batched (Arrow stream) query against per-feature reading"""
+
+    p = OGRProvider(config_gpkg_4326)
+    batched = p.query(startindex=10, limit=50)
+
+    config_gpkg_4326['data']['source_capabilities']['arrow_stream'] = False
+    p = OGRProvider(config_gpkg_4326)
+    per_feature = p.query(startindex=10, limit=50)
+
+    assert len(batched['features']) == 50
+    assert batched['features'] == per_feature['features']
+
+
+def test_query_arrow_stream_dates(tmp_path):
+    """Testing batched (Arrow stream) query of dates and geometry types"""
+
+    geometries = [
+        {'type': 'Point', 'coordinates': [5.5, 52.25]},
+        {'type': 'LineString', 'coordinates': [[5.5, 52.25], [5.75, 52.5]]},
+        {'type': 'Polygon', 'coordinates': [
+            [[5.0, 52.0], [6.0, 52.0], [6.0, 53.0], [5.0, 52.0]]]},
+        {'type': 'MultiPoint', 'coordinates': [[5.5, 52.25, 10.0]]},
+        None
+    ]
+    features = [{
+        'type': 'Feature',
+        'geometry': geometry,
+        'properties': {
+            'id': 'f{}'.format(i),
+            'day': '2020-01-{:02d}'.format(i + 1),
+            'time': '12:{:02d}:30'.format(i),
+            'datetime': '2020-01-{:02d}T12:00:0{}'.format(
+                i + 1, '5.250' if i % 2 else '0') if i < 4 else None
+        }
+    } for i, geometry in enumerate(geometries)]
+
+    source = tmp_path / 'dates.geojson'
+    with source.open('w') as fh:
+        json.dump({'type': 'FeatureCollection', 'name': 'dates',
+                   'features': features}, fh)
+
+    config = {
+        'name': 'OGR',
+        'type': 'feature',
+        'data': {
+            'source_type': 'GeoJSON',
+            'source': str(source),
+            'source_srs': 'EPSG:4326',
+            'target_srs': 'EPSG:4326',
+            'source_capabilities': {
+                'paging': True
+            },
+        },
+        'id_field': 'id',
+        'layer': 'dates'
+    }
+
+    p = OGRProvider(config)
+    batched = p.query(limit=10)
+
+    config['data']['source_capabilities']['arrow_stream'] = False
+    p = OGRProvider(config)
+    per_feature = p.query(limit=10)
+
+    assert len(batched['features']) == 5
+    assert batched['features'] == per_feature['features']
+
+    properties = batched['features'][1]['properties']
+    assert properties['day'] == '2020/01/02'
+    assert properties['datetime'] == '2020/01/02 12:00:05.250'
+
+
+def test_query_with_property_filtering_sortby_startindex(config_gpkg_4326):
+    """Testing filtering, sorting and paging in one query"""
+
+    p = OGRProvider(config_gpkg_4326)
+    properties = [('straatnaam', 'Arnhemseweg')]
+    sortby = [{'property': 'huisnummer', 'order': 'D'}]
+
+    feature_collection = p.query(startindex=5, limit=5,
+                                 properties=properties, sortby=sortby)
+    features = feature_collection.get('features', None)
+    assert len(features) == 5
+
+    for feature in features:
+        assert feature['properties']['straatnaam'] == 'Arnhemseweg'
+
+    huisnummers = [f['properties']['huisnummer'] for f in features]
+    assert huisnummers == sorted(huisnummers, reverse=True)
+
+    first_page = p.query(startindex=0, limit=10,
+                         properties=properties, sortby=sortby)
+    assert features == first_page['features'][5:]
+
+
+def test_query_reprojected_28992(config_gpkg_28992, config_gpkg_4326):
+    """Testing reprojected page against the same features in EPSG:4326"""
+
+    features_28992 = OGRProvider(config_gpkg_28992).query(limit=100)
+    features_4326 = OGRProvider(config_gpkg_4326).query(limit=100)
+
+    coordinates = {
+        f['id']: f['geometry']['coordinates']
+        for f in features_4326['features']
+    }
+
+    assert len(features_28992['features']) == 100
+    for feature in features_28992['features']:
+        x, y = feature['geometry']['coordinates'][:2]
+        assert abs(x - coordinates[feature['id']][0]) < 0.00001
+        assert abs(y - coordinates[feature['id']][1]) < 0.00001
@@ -289,12 +289,13 @@ def test_query_with_startindex_4326(config_shapefile_4326):
 
 
 def test_query_bbox_with_startindex_28992(config_shapefile_28992):
-    """Testing query for a valid JSON object with geometry"""
+    """Testing paging applies to the bbox filtered features"""
 
     p = OGRProvider(config_shapefile_28992)
+    bbox = (5.742, 52.053, 5.773, 52.098)
     feature_collection = p.query(
         startindex=10, limit=5,
-        bbox=(5.742, 52.053, 5.773, 52.098),
+        bbox=bbox,
         resulttype='results')
     assert feature_collection.get('type', None) == 'FeatureCollection'
     features = feature_collection.get('features', None)
@@ -306,17 +307,25 @@ def test_query_bbox_with_startindex_28992(config_shapefile_28992):
     assert properties is not None
     geometry = feature.get('geometry', None)
     assert geometry is not None
-    assert properties['straatnaam'] == 'Buurtweg'
-    assert properties['huisnummer'] == '4'
+
+    for feature in features:
+        x, y = feature['geometry']['coordinates'][:2]
+        assert bbox[0] - 0.001 <= x <= bbox[2] + 0.001
+        assert bbox[1] - 0.001 <= y <= bbox[3] + 0.001
+
+    first_page = p.query(
+        startindex=0, limit=15, bbox=bbox, resulttype='results')
+    assert features == first_page['features'][10:]
 
 
 def test_query_bbox_with_startindex_4326(config_shapefile_4326):
-    """Testing query for a valid JSON object with geometry"""
+    """Testing paging applies to the bbox filtered features"""
 
     p = OGRProvider(config_shapefile_4326)
+    bbox = (5.742, 52.053, 5.773, 52.098)
     feature_collection = p.query(
         startindex=1, limit=5,
-        bbox=(5.742, 52.053, 5.773, 52.098),
+        bbox=bbox,
         resulttype='results')
     assert feature_collection.get('type', None) == 'FeatureCollection'
     features = feature_collection.get('features', None)
@@ -328,8 +337,15 @@ def test_query_bbox_with_startindex_4326(config_shapefile_4326):
     assert properties is not None
     geometry = feature.get('geometry', None)
     assert geometry is not None
-    assert properties['straatnaam'] == 'Egypte'
-    assert properties['huisnummer'] == '6'
+
+    for feature in features:
+        x, y = feature['geometry']['coordinates'][:2]
+        assert bbox[0] - 0.001 <= x <= bbox[2] + 0.001
+        assert bbox[1] - 0.001 <= y <= bbox[3] + 0.001
+
+    first_page = p.query(
+        startindex=0, limit=6, bbox=bbox, resulttype='results')
+    assert features == first_page['features'][1:]
 
 
 def test_query_with_property_filtering(config_shapefile_4326):
@@ -174,16 +174,17 @@ def test_query_with_startindex_4326(config_sqlite_4326):
 
 
 def test_query_bbox_with_startindex_4326(config_sqlite_4326):
-    """Testing query for a valid JSON object with geometry"""
+    """Testing paging applies to the bbox filtered features"""
 
     p = OGRProvider(config_sqlite_4326)
+    bbox = (5.742, 52.053, 5.773, 52.098)
     feature_collection = p.query(
         startindex=1, limit=50,
-        bbox=(5.742, 52.053, 5.773, 52.098),
+        bbox=bbox,
         resulttype='results')
     assert feature_collection.get('type', None) == 'FeatureCollection'
     features = feature_collection.get('features', None)
-    assert len(features) == 3
+    assert len(features) == 50
     hits = feature_collection.get('numberMatched', None)
     assert hits is None
     feature = features[0]
@@ -191,8 +192,15 @@ def test_query_bbox_with_startindex_4326(config_sqlite_4326):
     assert properties is not None
     geometry = feature.get('geometry', None)
     assert geometry is not None
-    assert properties['straatnaam'] == 'Egypte'
-    assert properties['huisnummer'] == '4'
+
+    for feature in features:
+        x, y = feature['geometry']['coordinates'][:2]
+        assert bbox[0] - 0.001 <= x <= bbox[2] + 0.001
+        assert bbox[1] - 0.001 <= y <= bbox[3] + 0.001
+
+    first_page = p.query(
+        startindex=0, limit=51, bbox=bbox, resulttype='results')
+    assert features == first_page['features'][1:]
 
 
 def test_query_with_property_filtering(config_sqlite_4326):
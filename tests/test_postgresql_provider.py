@@ -114,6 +114,29 @@ def test_query_bbox(config):
     assert len(boxed_feature_collection['features']) == 5
 
 
+def test_iter_features(config):
+    """Test features streamed from a server side cursor"""
+    psp = PostgreSQLProvider(config)
+    ids = [feature['id'] for feature in psp.iter_features(limit=None)]
+    assert len(ids) == 14776
+    assert ids == sorted(ids)
+
+    features = list(psp.iter_features(startindex=10, limit=5))
+    assert [feature['id'] for feature in features] == ids[10:15]
+
+    features = list(psp.iter_features(
+        limit=None, bbox=[29.3373, -3.4099, 29.3761, -3.3924]))
+    assert len(features) == 5
+
+    sortby = [{'property': 'waterway', 'order': 'D'}]
+    keys = [(feature['properties']['waterway'], feature['id']) for feature
+            in psp.iter_features(limit=None, sortby=sortby)]
+    assert len(keys) == 14776
+    # sorted by waterway (descending), then by id
+    assert keys == sorted(keys, key=lambda key: (key[0], -key[1]),
+                          reverse=True)
+
+
 def test_get(config):
     """Testing query for a specific object"""
     p = PostgreSQLProvider(config)
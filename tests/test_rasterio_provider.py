@@ -28,9 +28,17 @@
 # =================================================================
 
 import os
+
+import numpy as np
 import pytest
+import rasterio
+from rasterio.io import MemoryFile
+from rasterio.transform import from_origin
 
-from pygeoapi.provider.rasterio_ import RasterioProvider
+from pygeoapi.provider import rasterio_
+from pygeoapi.provider.base import ProviderInvalidQueryError
+from pygeoapi.provider.rasterio_ import (DATASETS, DatasetPool,
+                                         RasterioProvider)
 
 
 def get_test_file_path(filename):
@@ -96,5 +104,127 @@ def test_query(config):
     data = p.query()
     assert isinstance(data, dict)
 
-    data = p.query(format_='GRIB2')
-    assert isinstance(data, bytes)
+    data = b''.join(p.query(format_='GRIB2'))
+    with open(path, 'rb') as fh:
+        assert data == fh.read()
+
+    data = p.query(subsets={'Lat': [5, 10], 'Long': [5, 10]})
+    assert isinstance(data, dict)
+    assert data['ranges']['TMP']['shape'] == [35, 35]
+    assert data['ranges']['TMP']['values'].size == 35 * 35
+
+    data = p.query(scale_factor=10)
+    assert data['ranges']['TMP']['shape'] == [120, 240]
+
+    with pytest.raises(ProviderInvalidQueryError):
+        p.query(subsets={'Lat': [100, 120], 'Long': [5, 10]})
+
+    data = p.query(subsets={'Lat': [5, 10], 'Long': [5, 10]},
+                   scale_axes={'Long': 5})
+    assert data['ranges']['TMP']['shape'] == [35, 7]
+
+
+def test_query_crs(config):
+    p = RasterioProvider(config)
+
+    subsets = {'Long': [5, 10], 'Lat': [45, 50]}
+    crs = 'http://www.opengis.net/def/crs/EPSG/0/3857'
+
+    data = p.query(subsets=subsets, crs=crs)
+    assert data['domain']['referencing'][0]['system']['id'] == crs
+    assert data['domain']['referencing'][0]['system']['type'] == 'ProjectedCRS'  # noqa
+    assert round(data['domain']['axes']['x']['start']) == 556597
+    assert round(data['domain']['axes']['x']['stop']) == 1113195
+
+    # bbox in EPSG:3857, output in native CRS
+    data = p.query(subsets={'Long': [556597.45, 1113194.91],
+                            'Lat': [5621521.49, 6446275.84]},
+                   subset_crs=crs)
+    assert data['domain']['referencing'][0]['system']['type'] == 'GeographicCRS'  # noqa
+    assert round(data['domain']['axes']['x']['start'], 3) == 5
+    assert round(data['domain']['axes']['y']['stop'], 3) == 45
+    assert data['ranges']['TMP']['shape'] == [34, 35]
+
+    with pytest.raises(ProviderInvalidQueryError):
+        p.query(crs='EPSG:foo')
+
+
+def test_query_cog(config, monkeypatch):
+    p = RasterioProvider(config)
+
+    data = b''.join(p.query(format_='COG'))
+    with MemoryFile(data) as memfile, memfile.open() as dataset:
+        assert dataset.driver == 'GTiff'
+        assert dataset.compression.name == 'deflate'
+        assert dataset.block_shapes == [(512, 512)]
+        assert dataset.overviews(1)
+        assert (dataset.width, dataset.height) == (2400, 1201)
+
+    # written to a temporary file
+    monkeypatch.setattr(rasterio_, 'SPOOL_MAX_SIZE', 0)
+    data = b''.join(p.query(subsets={'Lat': [5, 10], 'Long': [5, 10]},
+                            format_='COG'))
+    with MemoryFile(data) as memfile, memfile.open() as dataset:
+        assert (dataset.width, dataset.height) == (35, 35)
+
+
+def test_dataset_pool(config):
+    p = RasterioProvider(config)
+    assert p._data is None
+    dataset, _ = DATASETS._idle[path][-1]
+
+    p.get_coverage_rangetype()
+    p.query(subsets={'Lat': [5, 10], 'Long': [5, 10]})
+    assert p._data is None
+    assert DATASETS._idle[path][-1][0] is dataset
+    assert not DATASETS._leased
+
+    pool = DatasetPool(max_idle=1, max_leased=1)
+    dataset = pool.acquire(path)
+    assert pool.acquire(path, blocking=False) is None
+
+    pool.release(path, dataset)
+    with pool.lease(path) as dataset2:
+        assert dataset2 is dataset
+    assert not pool._leased
+
+
+def test_query_parallel(config, monkeypatch):
+    p = RasterioProvider(config)
+
+    subsets = {'Lat': [5, 10], 'Long': [5, 10]}
+    monkeypatch.setattr(rasterio_, 'PARALLEL_READ_MIN_CELLS', 0)
+    data = p.query(subsets=subsets)
+    monkeypatch.setattr(rasterio_, 'PARALLEL_READ_MIN_CELLS', 10 ** 12)
+    data2 = p.query(subsets=subsets)
+
+    assert (data['ranges']['TMP']['values'] ==
+            data2['ranges']['TMP']['values']).all()
+
+
+def test_query_multiband(tmp_path, monkeypatch):
+    filename = str(tmp_path / 'multiband.tif')
+    values = np.arange(3 * 20 * 30, dtype='int16').reshape(3, 20, 30)
+    with rasterio.open(filename, 'w', driver='GTiff', width=30, height=20,
+                       count=3, dtype='int16', crs='EPSG:4326',
+                       transform=from_origin(0, 20, 1, 1)) as dst:
+        dst.write(values)
+
+    p = RasterioProvider({
+        'name': 'rasterio',
+        'type': 'coverage',
+        'data': filename,
+        'format': {
+            'name': 'GTiff',
+            'mimetype': 'image/tiff'
+        }
+    })
+
+    for min_cells in [0, 10 ** 12]:
+        monkeypatch.setattr(rasterio_, 'PARALLEL_READ_MIN_CELLS', min_cells)
+        data = p.query(range_subset=['1', '3'])
+
+        assert list(data['parameters'].keys()) == ['1', '3']
+        assert data['ranges']['1']['dataType'] == 'integer'
+        assert (data['ranges']['1']['values'] == values[0]).all()
+        assert (data['ranges']['3']['values'] == values[2]).all()
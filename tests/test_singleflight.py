@@ -0,0 +1,114 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+import threading
+import time
+
+import pytest
+
+from pygeoapi.singleflight import SingleFlight
+
+
+def test_single_flight():
+    single_flight = SingleFlight()
+    calls = []
+
+    def query(value):
+        calls.append(value)
+        time.sleep(0.2)
+        return {'features': [value]}
+
+    results = []
+
+    def request():
+        results.append(single_flight.do('key', query, 'foo'))
+
+    threads = [threading.Thread(target=request) for i in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['foo']
+    assert results == [{'features': ['foo']}] * 5
+    # each caller gets its own copy
+    assert len(set(id(result) for result in results)) == 5
+
+    assert single_flight.get_metrics() == {
+        'calls': 1,
+        'coalesced': 4,
+        'in_flight': 0
+    }
+
+    # later calls are not coalesced
+    single_flight.do('key', query, 'foo')
+    assert calls == ['foo', 'foo']
+
+
+def test_single_flight_error():
+    single_flight = SingleFlight()
+
+    def query():
+        raise ValueError('backend error')
+
+    with pytest.raises(ValueError):
+        single_flight.do('key', query)
+
+    assert single_flight.get_metrics()['in_flight'] == 0
+
+
+def test_single_flight_generator():
+    single_flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def query():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return (chunk for chunk in [b'a', b'b'])
+
+    results = []
+
+    def request():
+        results.append(b''.join(single_flight.do('key', query)))
+
+    leader = threading.Thread(target=request)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=request)
+    follower.start()
+    leader.join()
+    follower.join()
+
+    # generators cannot be shared, so that followers call again
+    assert results == [b'ab', b'ab']
+    assert len(calls) == 2
+    assert single_flight.get_metrics()['coalesced'] == 0
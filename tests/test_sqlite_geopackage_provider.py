@@ -167,3 +167,39 @@ def test_get_geopackage_not_existing_item_raise_exception(config_geopackage):
     p = SQLiteGPKGProvider(config_geopackage)
     with pytest.raises(ProviderItemNotFoundError):
         p.get(-1)
+
+
+def test_iter_features(config_sqlite):
+    """Testing features streamed row by row, ordered by id or sortby"""
+
+    p = SQLiteGPKGProvider(config_sqlite)
+    ids = [feature['id'] for feature in p.iter_features(limit=None)]
+    assert len(ids) == 177
+    assert ids == sorted(ids)
+
+    features = list(p.iter_features(startindex=10, limit=5))
+    assert [feature['id'] for feature in features] == ids[10:15]
+
+    sortby = [{'property': 'name', 'order': 'D'}]
+    names = [feature['properties']['name'] for feature in
+             p.iter_features(limit=None, sortby=sortby)]
+    assert names == sorted(names, reverse=True)
+
+
+def test_iter_features_threadpool(config_sqlite):
+    """Testing features streamed by Starlette (read on worker threads)"""
+
+    anyio = pytest.importorskip('anyio')
+    concurrency = pytest.importorskip('starlette.concurrency')
+
+    p = SQLiteGPKGProvider(config_sqlite)
+    features = p.iter_features(limit=None)
+    first = next(features)
+
+    async def consume():
+        return [feature async for feature in
+                concurrency.iterate_in_threadpool(features)]
+
+    rest = anyio.run(consume)
+    assert len(rest) == p.query(resulttype='hits')['numberMatched'] - 1
+    assert first['id'] not in [feature['id'] for feature in rest]
@@ -0,0 +1,107 @@
+# =================================================================
+#
+# Authors: Tom Kralidis <tomkralidis@gmail.com>
+#
+# Copyright (c) 2020 Tom Kralidis
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+
+import importlib
+import os
+import sys
+
+import pytest
+import yaml
+
+from pygeoapi.util import yaml_load
+
+THISDIR = os.path.dirname(os.path.realpath(__file__))
+
+
+@pytest.fixture()
+def app(tmp_path, monkeypatch):
+    pytest.importorskip('httpx')  # Starlette TestClient
+
+    with open(os.path.join(THISDIR, 'pygeoapi-test-config.yml')) as fh:
+        config = yaml_load(fh)
+
+    config['server']['cors'] = False
+    config['resources']['stac'] = {
+        'type': 'stac-collection',
+        'title': 'STAC',
+        'description': 'STAC',
+        'keywords': [],
+        'links': [],
+        'extents': {
+            'spatial': {
+                'bbox': [-180, -90, 180, 90],
+                'crs': 'http://www.opengis.net/def/crs/OGC/1.3/CRS84'
+            }
+        },
+        'providers': [{
+            'type': 'stac',
+            'name': 'FileSystem',
+            'data': os.path.join(THISDIR, 'data'),
+            'file_types': ['.gpkg']
+        }]
+    }
+
+    config_file = tmp_path / 'pygeoapi-config.yml'
+    with config_file.open('w') as fh:
+        yaml.safe_dump(config, fh)
+
+    monkeypatch.setenv('PYGEOAPI_CONFIG', str(config_file))
+    monkeypatch.setenv('PYGEOAPI_OPENAPI',
+                       os.path.join(THISDIR, 'pygeoapi-test-openapi.yml'))
+    monkeypatch.delitem(sys.modules, 'pygeoapi.starlette_app', raising=False)
+
+    return importlib.import_module('pygeoapi.starlette_app').app
+
+
+def test_stac_raw_file(app):
+    from starlette.testclient import TestClient
+
+    client = TestClient(app)
+    filepath = os.path.join(THISDIR, 'data', 'poi_portugal.gpkg')
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as fh:
+        data = fh.read()
+
+    response = client.get('/stac/stac/poi_portugal.gpkg')
+    assert response.status_code == 200
+    assert response.content == data
+    assert response.headers['Accept-Ranges'] == 'bytes'
+
+    response = client.get('/stac/stac/poi_portugal.gpkg',
+                          headers={'Range': 'bytes=100-199'})
+    assert response.status_code == 206
+    assert response.headers['Content-Range'] == \
+        'bytes 100-199/{}'.format(size)
+    assert response.content == data[100:200]
+
+    response = client.get('/stac/stac/poi_portugal.gpkg',
+                          headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+    assert response.content == b''
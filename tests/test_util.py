@@ -29,8 +29,10 @@
 
 from datetime import datetime, date, time
 from decimal import Decimal
+import json
 import os
 
+import numpy as np
 import pytest
 
 from pygeoapi import util
@@ -95,16 +97,69 @@ def test_json_serial():
     d = Decimal(1.0)
     assert util.json_serial(d) == 1.0
 
+    d = np.array([1.5, 2.5])
+    assert util.json_serial(d) == [1.5, 2.5]
+
+    d = np.int64(3)
+    assert util.json_serial(d) == 3
+
+    assert util.json_serial(b'\xff') == '/w=='
+
     with pytest.raises(TypeError):
         util.json_serial('foo')
 
 
+@pytest.mark.parametrize('encoder', sorted(util.JSON_ENCODERS))
+def test_to_json(encoder, monkeypatch):
+    monkeypatch.setattr(util, 'JSON_ENCODER', encoder)
+
+    d = {
+        'datetime': datetime(1972, 10, 30, 11, 5, 2, 5),
+        'date': date(2010, 7, 31),
+        'decimal': Decimal('1.5'),
+        'bytes': b'foo',
+        'nan': float('nan'),
+        'array': np.array([[1, 2], [3, 4]])[:, 0],
+        'scalar': np.float32(0.5),
+        'big': 2 ** 70,
+        1: 'one'
+    }
+
+    assert json.loads(util.to_json(d)) == {
+        'datetime': '1972-10-30T11:05:02.000005',
+        'date': '2010-07-31',
+        'decimal': 1.5,
+        'bytes': 'foo',
+        'nan': None,
+        'array': [1, 3],
+        'scalar': 0.5,
+        'big': 2 ** 70,
+        '1': 'one'
+    }
+
+    assert util.to_json({'a': 1}, pretty=True) == '{\n    "a": 1\n}'
+
+    with pytest.raises(TypeError):
+        util.to_json({'a': object()})
+
+
 def test_mimetype():
     assert util.get_mimetype('file.xml') == 'application/xml'
     assert util.get_mimetype('file.yml') == 'text/plain'
     assert util.get_mimetype('file.yaml') == 'text/plain'
 
 
+def test_get_wkt_points():
+    assert util.get_wkt_points('POINT(-75.5 45)') == [[-75.5, 45]]
+    assert util.get_wkt_points('MULTIPOINT((1 2), (3 4))') == [[1, 2], [3, 4]]
+    assert util.get_wkt_points('multipoint(1 2,3 4)') == [[1, 2], [3, 4]]
+
+    for wkt in ['POINT(1)', 'POINT(1 2, 3 4)', 'LINESTRING(1 2, 3 4)',
+                'POINT(a b)']:
+        with pytest.raises(ValueError):
+            util.get_wkt_points(wkt)
+
+
 def test_get_breadcrumbs():
     path = '/dataset/model-run/forecast-hour/variable.grib2'
     breadcrumbs = util.get_breadcrumbs(path)
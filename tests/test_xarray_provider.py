@@ -28,8 +28,12 @@
 # =================================================================
 
 import os
+import numpy as np
 import pytest
+import xarray
 
+from pygeoapi.provider import xarray_
+from pygeoapi.provider.base import ProviderInvalidQueryError
 from pygeoapi.provider.xarray_ import XarrayProvider
 
 
@@ -88,3 +92,183 @@ def test_query(config):
 
     data = p.query()
     assert isinstance(data, dict)
+
+
+def test_query_chunked(config):
+    pytest.importorskip('dask')
+
+    config['chunks'] = {'TIME': 1}
+    p = XarrayProvider(config)
+
+    data = p.query(range_subset=['SST'])
+    values = data['ranges']['SST']['values']
+    assert hasattr(values, 'compute')
+    assert values.size == np.prod(data['ranges']['SST']['shape'])
+
+
+def test_query_zarr(config, tmp_path):
+    pytest.importorskip('dask')
+    pytest.importorskip('zarr')
+
+    store = str(tmp_path / 'coads_sst.zarr')
+    XarrayProvider(config)._data.to_zarr(store)
+
+    config['data'] = store
+    p = XarrayProvider(config)
+
+    assert p.axes == ['COADSX', 'COADSY', 'TIME']
+    data = p.query(range_subset=['SST'])
+    assert hasattr(data['ranges']['SST']['values'], 'compute')
+
+
+def test_query_netcdf(config, tmp_path):
+    config['netcdf_options'] = {'complevel': 4, 'chunksizes': {'TIME': 1}}
+    p = XarrayProvider(config)
+
+    filename = str(tmp_path / 'subset.nc')
+    with open(filename, 'wb') as fh:
+        for chunk in p.query(range_subset=['SST'], format_='netcdf'):
+            fh.write(chunk)
+
+    with xarray.open_dataset(filename) as ds:
+        assert list(ds.data_vars) == ['SST']
+        assert ds['SST'].encoding['zlib'] is True
+        assert ds['SST'].encoding['complevel'] == 4
+        assert ds['SST'].encoding['chunksizes'][0] == 1
+        assert ds['SST'].shape == p._data['SST'].shape
+
+
+def test_query_zarr_zip(config, tmp_path):
+    zarr = pytest.importorskip('zarr')
+
+    p = XarrayProvider(config)
+    assert p.output_formats['zarr'] == 'application/zip'
+
+    filename = str(tmp_path / 'subset.zarr.zip')
+    with open(filename, 'wb') as fh:
+        for chunk in p.query(range_subset=['SST'], format_='zarr'):
+            fh.write(chunk)
+
+    with xarray.open_zarr(zarr.storage.ZipStore(filename, mode='r')) as ds:
+        assert list(ds.data_vars) == ['SST']
+
+
+@pytest.fixture()
+def config_mosaic(config, tmp_path):
+    with xarray.open_dataset(path) as ds:
+        for i in range(0, 12, 3):
+            ds.isel(TIME=slice(i, i + 3)).to_netcdf(
+                str(tmp_path / 'coads_sst_{:02d}.nc'.format(i)))
+
+    config['data'] = str(tmp_path / 'coads_sst_*.nc')
+    return config
+
+
+def test_query_mosaic(config_mosaic):
+    p = XarrayProvider(config_mosaic)
+
+    assert p.axes == ['COADSX', 'COADSY', 'TIME']
+    assert len(p._files) == 4
+    assert p._coverage_properties['time'] == 12
+    assert p._coverage_properties['time_range'][0].startswith('2000-01-16')
+    assert p._coverage_properties['time_range'][1].startswith('2000-12-16')
+
+    files = p._get_files_in_range(['2000-03-01', '2000-05-01'])
+    assert [os.path.basename(f) for f in files] == [
+        'coads_sst_00.nc', 'coads_sst_03.nc']
+
+    data = p.query(range_subset=['SST'],
+                   subsets={'TIME': ['2000-03-01', '2000-05-01']})
+    assert data['domain']['axes']['TIME']['num'] == 2
+    assert data['ranges']['SST']['values'].shape == (2, 90, 180)
+
+    data = p.query(range_subset=['SST'])
+    assert data['domain']['axes']['TIME']['num'] == 12
+
+
+def test_query_mosaic_without_dask(config_mosaic, monkeypatch):
+    monkeypatch.setattr(xarray_, 'dask', None)
+    p = XarrayProvider(config_mosaic)
+
+    opened = []
+    xarray_open_dataset = xarray.open_dataset
+
+    def open_dataset(*args, **kwargs):
+        opened.append(xarray_open_dataset(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(xarray_.xarray, 'open_dataset', open_dataset)
+    data = p.query(range_subset=['SST'],
+                   subsets={'COADSY': [-10, 10], 'COADSX': [0, 40]})
+
+    assert data['domain']['axes']['TIME']['num'] == 12
+    assert data['ranges']['SST']['values'].shape == (12, 10, 20)
+    assert len(opened) == 4
+    assert all(dataset._close is None for dataset in opened)  # closed
+
+
+def test_query_points(config):
+    p = XarrayProvider(config)
+
+    data = p.query(range_subset=['SST'], coords=[[-73.6, 43.8]],
+                   subsets={'TIME': ['2000-03-01', '2000-05-01']})
+    assert data['domain']['domainType'] == 'PointSeries'
+    assert data['domain']['axes']['x']['values'] == [-73]
+    assert data['domain']['axes']['y']['values'] == [43]
+    assert len(data['domain']['axes']['t']['values']) == 2
+    assert data['ranges']['SST']['axisNames'] == ['t']
+    assert data['ranges']['SST']['shape'] == [2]
+
+    expected = p._data['SST'].sel(
+        COADSX=-73, COADSY=43,
+        TIME=slice('2000-03-01', '2000-05-01')).values
+    np.testing.assert_array_equal(data['ranges']['SST']['values'], expected)
+
+    data = p.query(range_subset=['SST'],
+                   coords=[[-73.6, 43.8], [10.2, -20.5]])
+    assert data['domain']['domainType'] == 'MultiPointSeries'
+    assert data['domain']['axes']['composite']['values'] == [
+        [-73, 43], [11, -21]]
+    assert data['ranges']['SST']['axisNames'] == ['t', 'composite']
+    assert data['ranges']['SST']['shape'] == [12, 2]
+    assert data['ranges']['SST']['values'].shape == (12, 2)
+
+    config['interpolation'] = 'linear'
+    p = XarrayProvider(config)
+    data = p.query(range_subset=['SST'], coords=[[-73.6, 43.8]])
+    assert data['domain']['axes']['x']['values'] == [-73.6]
+
+    with pytest.raises(ProviderInvalidQueryError):
+        p.query(coords=[[200, 0]])
+
+
+def test_query_aggregation(config):
+    p = XarrayProvider(config)
+
+    data = p.query(range_subset=['SST'], scale_factor=2)
+    assert data['domain']['axes']['COADSX']['num'] == 90
+    assert data['domain']['axes']['COADSY']['num'] == 45
+    assert data['ranges']['SST']['values'].shape == (12, 45, 90)
+
+    data = p.query(range_subset=['SST'], scale_size={'COADSX': 60})
+    assert data['domain']['axes']['COADSX']['num'] == 60
+    assert data['domain']['axes']['COADSY']['num'] == 90
+
+    data = p.query(range_subset=['SST'], resample='P3M', aggregation='max')
+    assert data['domain']['axes']['TIME']['num'] == 4
+    assert data['domain']['axes']['TIME']['start'].startswith('2000-01-01')
+
+    expected = p._data['SST'].isel(TIME=slice(0, 3)).max('TIME').values
+    np.testing.assert_array_equal(
+        data['ranges']['SST']['values'][0], expected)
+
+    with pytest.raises(ProviderInvalidQueryError):
+        p.query(resample='P1M1D')
+
+    # no upsampling
+    for resample in ['PT6H', 'PT1S']:
+        with pytest.raises(ProviderInvalidQueryError):
+            p.query(resample=resample)
+
+    with pytest.raises(ProviderInvalidQueryError):
+        p.query(scale_factor=0.5)